@@ -18,22 +18,28 @@ from homeassistant.helpers import entity_registry as er
 from homeassistant.loader import async_get_integration
 
 from .base import FritzBoxPhonebook
-from .call_log import FritzCallLogCoordinator
+from .cache import remove_entry_cache
+from .call_log import FritzCallLogCoordinator, async_remove_call_history
 from .const import (
     CALL_TYPE_INCOMING,
     CALL_TYPE_LIVE,
     CALL_TYPE_MISSED,
     CALL_TYPE_OUTGOING,
     CALL_TYPE_VOICEMAIL,
+    CONF_ADDITIONAL_PHONEBOOKS,
+    CONF_AREA_CODE,
+    CONF_COUNTRY_CODE,
     CONF_PHONEBOOK,
     CONF_PREFIXES,
     DOMAIN,
     PLATFORMS,
     SERIAL_NUMBER,
 )
-from .http import FritzBoxCallMediaView, FritzBoxTamMediaView
+from .http import FritzBoxCallMediaView, FritzBoxContactImageView, FritzBoxTamMediaView
+from .phonebook import FritzPhonebookCoordinator, async_remove_contact_images
 from .tam import FritzTam
 from .voicemail import FritzTamCoordinator
+from .websocket_api import async_register_websocket_commands
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -197,13 +203,15 @@ def _async_register_tam_view(hass: HomeAssistant) -> None:
     Two views share the same underlying download mechanism (see
     FritzBoxCallMediaView's docstring in http.py): one for the
     Anrufbeantworter-Sensor's own message list, one for a recording linked
-    from a call-list entry's "Weiterverarbeitung" row (since v1.0.3).
+    from a call-list entry's "Weiterverarbeitung" row (since v1.0.3). The
+    contact image view (see phonebook.py) is registered along with them.
     """
     if hass.data.get(_TAM_VIEW_REGISTERED_KEY):
         return
     hass.data[_TAM_VIEW_REGISTERED_KEY] = True
     hass.http.register_view(FritzBoxTamMediaView())
     hass.http.register_view(FritzBoxCallMediaView())
+    hass.http.register_view(FritzBoxContactImageView())
 
 
 def _async_reserve_entity_ids(hass: HomeAssistant, config_entry: ConfigEntry, unique_id: str) -> None:
@@ -254,6 +262,7 @@ class FritzBoxRuntimeData:
     """
 
     phonebook: FritzBoxPhonebook
+    phonebook_coordinator: FritzPhonebookCoordinator
     call_log_coordinator: FritzCallLogCoordinator
     tam_coordinator: FritzTamCoordinator | None = None
 
@@ -267,6 +276,7 @@ async def async_setup_entry(
     """Set up the fritzbox_anrufe platforms."""
     await _async_register_frontend_card(hass)
     _async_register_tam_view(hass)
+    async_register_websocket_commands(hass)
 
     fritzbox_phonebook = FritzBoxPhonebook(
         host=config_entry.data[CONF_HOST],
@@ -274,10 +284,21 @@ async def async_setup_entry(
         password=config_entry.data[CONF_PASSWORD],
         phonebook_id=config_entry.data[CONF_PHONEBOOK],
         prefixes=config_entry.options.get(CONF_PREFIXES),
+        country_code=config_entry.options.get(CONF_COUNTRY_CODE),
+        area_code=config_entry.options.get(CONF_AREA_CODE),
+        additional_phonebook_ids=config_entry.options.get(CONF_ADDITIONAL_PHONEBOOKS),
     )
 
+    # Contacts are kept up to date by their own coordinator (see
+    # phonebook.py); the first load still happens right here, so the usual
+    # auth/permission/connection error handling below covers it as well.
+    phonebook_coordinator = FritzPhonebookCoordinator(
+        hass, config_entry, fritzbox_phonebook
+    )
+    await phonebook_coordinator.async_load_image_files()
     try:
         await hass.async_add_executor_job(fritzbox_phonebook.init_phonebook)
+        revision = await phonebook_coordinator.async_load_phonebooks()
     except FritzSecurityError as ex:
         _LOGGER.error(
             (
@@ -292,6 +313,7 @@ async def async_setup_entry(
     except RequestsConnectionError as ex:
         _LOGGER.error("Unable to connect to FRITZ!Box call monitor: %s", ex)
         raise ConfigEntryNotReady from ex
+    phonebook_coordinator.async_set_updated_data(revision)
 
     # Anrufbeantworter (EXPERIMENTELL, siehe tam.py/voicemail.py). Same
     # "never block setup, just show as unavailable" treatment as the call
@@ -311,6 +333,10 @@ async def async_setup_entry(
     call_log_coordinator = FritzCallLogCoordinator(
         hass, config_entry, fritz_call, tam_coordinator=tam_coordinator
     )
+    # Local call history first (see call_log.py, "Persistent history") -
+    # the refresh below then only has to top it up instead of downloading
+    # the whole window again after every restart.
+    await call_log_coordinator.async_load_history()
     # Deliberately not using async_config_entry_first_refresh() here: a
     # missing "Anrufliste" permission or disabled TR-064 on the FRITZ!Box
     # account must not prevent the whole integration (incl. the working
@@ -323,6 +349,7 @@ async def async_setup_entry(
 
     config_entry.runtime_data = FritzBoxRuntimeData(
         phonebook=fritzbox_phonebook,
+        phonebook_coordinator=phonebook_coordinator,
         call_log_coordinator=call_log_coordinator,
         tam_coordinator=tam_coordinator,
     )
@@ -335,4 +362,16 @@ async def async_unload_entry(
     hass: HomeAssistant, config_entry: FritzBoxCallMonitorConfigEntry
 ) -> bool:
     """Unloading the fritzbox_anrufe platforms."""
-    return await hass.config_entries.async_unload_platforms(config_entry, PLATFORMS)
+    unload_ok = await hass.config_entries.async_unload_platforms(config_entry, PLATFORMS)
+    if unload_ok:
+        await config_entry.runtime_data.call_log_coordinator.async_save_history()
+    return unload_ok
+
+
+async def async_remove_entry(
+    hass: HomeAssistant, config_entry: FritzBoxCallMonitorConfigEntry
+) -> None:
+    """Remove the local call history and caches with the config entry."""
+    await async_remove_call_history(hass, config_entry.entry_id)
+    await async_remove_contact_images(hass, config_entry.entry_id)
+    await hass.async_add_executor_job(remove_entry_cache, hass, config_entry.entry_id)
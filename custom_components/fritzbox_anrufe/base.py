@@ -1,50 +1,123 @@
 """Base class for fritzbox_anrufe entities."""
 
-from contextlib import suppress
 from dataclasses import dataclass
-from datetime import timedelta
+from functools import lru_cache
 import logging
 import re
+from urllib.parse import urlencode, urljoin
+from xml.etree.ElementTree import Element
 
+from fritzconnection.core.exceptions import FritzConnectionException
+from fritzconnection.core.utils import get_xml_root
 from fritzconnection.lib.fritzphonebook import FritzPhonebook
+from requests.exceptions import RequestException
 
-from homeassistant.util import Throttle
-
-from .const import REGEX_NUMBER, UNKNOWN_NAME
+from .const import UNKNOWN_NAME
+from .number_index import DialingCodes, NumberIndex, intern_number, normalize_number
 
 _LOGGER = logging.getLogger(__name__)
 
-# Return cached results if phonebook was downloaded less then this time ago.
-MIN_TIME_PHONEBOOK_UPDATE = timedelta(hours=6)
+# Size of the raw number -> Contact memo in front of get_contact() - well
+# above the number of distinct numbers any call list/TAM renders at once.
+CONTACT_LOOKUP_CACHE_SIZE = 1024
+
+# TR-064 service/actions providing the box's own country/area code (the
+# "Ortsvorwahl"/"Landesvorwahl" of its telephony settings).
+VOIP_SERVICE = "X_VoIP1"
+ACTION_GET_COUNTRY_CODE = "X_AVM-DE_GetVoIPCommonCountryCode"
+ACTION_GET_AREA_CODE = "X_AVM-DE_GetVoIPCommonAreaCode"
+
+
+# Timeout (seconds) for downloading one contact image from the box.
+CONTACT_IMAGE_TIMEOUT = 10
 
+_SID_RE = re.compile(r"[?&]sid=([a-fA-F0-9]+)")
 
-@dataclass
+
+@dataclass(slots=True)
 class Contact:
     """Store details for one phonebook contact."""
 
     name: str
     numbers: list[str]
     vip: bool
+    phonebook_id: int | None
+    category: str | None
+    image_url: str | None
+    # Normalized number -> its type on the box ("home", "mobile", "work",
+    # "fax_work", ...), for every number that has one.
+    number_types: dict[str, str]
+    emails: list[str]
+    uniqueid: str | None
 
     def __init__(
-        self, name: str, numbers: list[str] | None = None, category: str | None = None
+        self,
+        name: str,
+        numbers: list[str] | None = None,
+        category: str | None = None,
+        phonebook_id: int | None = None,
+        *,
+        image_url: str | None = None,
+        number_types: dict[str, str] | None = None,
+        emails: list[str] | None = None,
+        uniqueid: str | None = None,
     ) -> None:
         """Initialize the class."""
         self.name = name
-        self.numbers = [re.sub(REGEX_NUMBER, "", nr) for nr in numbers or ()]
+        self.numbers = [intern_number(normalize_number(nr)) for nr in numbers or ()]
         self.vip = category == "1"
+        # Which of the loaded phonebooks this contact came from.
+        self.phonebook_id = phonebook_id
+        self.category = category
+        # As stored in the phonebook - usually a path-only
+        # "/download.lua?path=..." still lacking the sid, see
+        # FritzBoxPhonebook.fetch_contact_image().
+        self.image_url = image_url
+        self.number_types = {
+            intern_number(normalize_number(nr)): intern_number(nr_type)
+            for nr, nr_type in (number_types or {}).items()
+        }
+        self.emails = emails or []
+        self.uniqueid = uniqueid
 
 
 unknown_contact = Contact(UNKNOWN_NAME)
 
 
+def _parse_contacts(root: Element, phonebook_id: int) -> list[Contact]:
+    """Extract the contacts from one downloaded phonebook XML document."""
+    contacts = []
+    for node in root.iter("contact"):
+        numbers = [nr for nr in node.iterfind("telephony/number") if nr.text]
+        contacts.append(
+            Contact(
+                node.findtext("person/realName") or "",
+                [nr.text for nr in numbers],
+                node.findtext("category"),
+                phonebook_id=phonebook_id,
+                image_url=node.findtext("person/imageURL") or None,
+                number_types={
+                    nr.text: nr.get("type") for nr in numbers if nr.get("type")
+                },
+                emails=[
+                    email.text
+                    for email in node.iterfind("telephony/services/email")
+                    if email.text
+                ],
+                uniqueid=node.findtext("uniqueid"),
+            )
+        )
+    return contacts
+
+
 class FritzBoxPhonebook:
     """Connects to a FritzBox router and downloads its phone book."""
 
     fph: FritzPhonebook
     phonebook_dict: dict[str, list[str]]
     contacts: list[Contact]
-    number_dict: dict[str, Contact]
+    number_index: NumberIndex[Contact]
+    dialing_codes: DialingCodes
 
     def __init__(
         self,
@@ -53,55 +126,189 @@ class FritzBoxPhonebook:
         password: str,
         phonebook_id: int | None = None,
         prefixes: list[str] | None = None,
+        country_code: str | None = None,
+        area_code: str | None = None,
+        additional_phonebook_ids: list[int] | None = None,
     ) -> None:
-        """Initialize the class."""
+        """Initialize the class.
+
+        country_code/area_code override the codes read from the box's
+        telephony settings (digits only, without leading "+"/"0").
+        additional_phonebook_ids are looked up after phonebook_id, in the
+        given order: a number found in several books resolves to the
+        contact of the first of them.
+        """
         self.host = host
         self.username = username
         self.password = password
         self.phonebook_id = phonebook_id
+        self.additional_phonebook_ids = additional_phonebook_ids or []
         self.prefixes = prefixes
+        self.country_code = country_code
+        self.area_code = area_code
+        # Bumped on every successful reload, so consumers caching
+        # get_contact() results (see sensor.py) know when to drop them.
+        self.revision = 0
+        # Last seen <timestamp> and parsed contacts per loaded phonebook -
+        # see download_contacts().
+        self._timestamps: dict[int, str | None] = {}
+        self._books: dict[int, list[Contact]] = {}
+        # Session URL each book was last downloaded from - its sid also
+        # authorizes the contact image downloads, see fetch_contact_image().
+        self._book_urls: dict[int, str] = {}
+        # imageURL -> file name in the contact image cache, maintained by
+        # the phonebook coordinator (see phonebook.py).
+        self.image_files: dict[str, str] = {}
 
     def init_phonebook(self) -> None:
-        """Connect to the FRITZ!Box and check if phonebook_id is valid."""
+        """Connect to the FRITZ!Box; contacts are loaded by the coordinator.
+
+        Until the first load (see phonebook.py), get_contact() simply
+        resolves every number to the unknown contact.
+        """
         self.fph = FritzPhonebook(
             address=self.host,
             user=self.username,
             password=self.password,
         )
-        self.update_phonebook()
+        self.dialing_codes = self._get_dialing_codes()
+        self.rebuild_index()
 
-    @Throttle(MIN_TIME_PHONEBOOK_UPDATE)
-    def update_phonebook(self) -> None:
-        """Update the phone book dictionary."""
+    def _get_dialing_codes(self) -> DialingCodes:
+        """Combine configured and box-provided dialing codes.
+
+        Reading them from the box is best effort: without them (older
+        firmware, missing permission), numbers are simply compared in the
+        form they are stored/reported in, as before.
+        """
+        country_code = self.country_code
+        area_code = self.area_code
+        international_prefix = "00"
+        national_prefix = "0"
+        try:
+            result = self.fph.fc.call_action(VOIP_SERVICE, ACTION_GET_COUNTRY_CODE)
+            country_code = country_code or result["NewX_AVM-DE_LKZ"]
+            international_prefix = result.get("NewX_AVM-DE_LKZPrefix") or "00"
+            result = self.fph.fc.call_action(VOIP_SERVICE, ACTION_GET_AREA_CODE)
+            area_code = area_code or result["NewX_AVM-DE_OKZ"]
+            national_prefix = result.get("NewX_AVM-DE_OKZPrefix") or "0"
+        except (FritzConnectionException, KeyError) as ex:
+            _LOGGER.debug("Could not read country/area code from FRITZ!Box: %s", ex)
+        codes = DialingCodes(
+            country_code=(country_code or "").lstrip("+0") or None,
+            area_code=(area_code or "").lstrip("0") or None,
+            international_prefix=international_prefix,
+            national_prefix=national_prefix,
+        )
+        _LOGGER.debug("Using dialing codes %s", codes)
+        return codes
+
+    @property
+    def loaded_phonebook_ids(self) -> list[int]:
+        """Return the ids of all phonebooks to load, highest priority first."""
         if self.phonebook_id is None:
-            return
+            return []
+        return list(dict.fromkeys([self.phonebook_id, *self.additional_phonebook_ids]))
 
-        self.fph.get_all_name_numbers(self.phonebook_id)
-        self.contacts = [
-            Contact(c.name, c.numbers, getattr(c, "category", None))
-            for c in self.fph.phonebook.contacts
-        ]
-        self.number_dict = {nr: c for c in self.contacts for nr in c.numbers}
-        _LOGGER.debug("Fritz!Box phone book successfully updated")
+    def download_contacts(self, phonebook_id: int) -> bool:
+        """Download and parse one phonebook if it changed; return if it did.
+
+        Blocking - executor only; safe to run for several books at once
+        (see phonebook.py). The request carries the last seen <timestamp>
+        of the book, so an unchanged book is answered with just that
+        timestamp instead of all contacts - checking for changes costs next
+        to no transfer, and only a changed book is parsed and re-indexed.
+
+        Parsed straight from the XML instead of via
+        FritzPhonebook.get_all_name_numbers(), which keeps its result in the
+        shared fph.phonebook attribute and so can't run for several books
+        at once.
+        """
+        url = self.fph.phonebook_info(phonebook_id)["url"]
+        self._book_urls[phonebook_id] = url
+        last_timestamp = self._timestamps.get(phonebook_id)
+        if last_timestamp is not None:
+            url += f"&{urlencode({'timestamp': last_timestamp})}"
+        root = get_xml_root(url, session=self.fph.fc.session)
+        timestamp = root.findtext("phonebook/timestamp")
+        if (
+            phonebook_id in self._books
+            and timestamp is not None
+            and timestamp == last_timestamp
+        ):
+            return False
+        self._books[phonebook_id] = _parse_contacts(root, phonebook_id)
+        self._timestamps[phonebook_id] = timestamp
+        return True
+
+    def fetch_contact_image(self, contact: Contact) -> tuple[bytes, str | None]:
+        """Download a contact's image; return (bytes, content type).
+
+        Blocking - executor only. Per AVM's TR-064 phonebook documentation,
+        an <imageURL> is resolved against the URL of the book it came from
+        and completed with that URL's sid - valid as long as the session
+        of the last download_contacts() of that book. Raises
+        RequestException on any failure.
+        """
+        book_url = self._book_urls.get(contact.phonebook_id)  # type: ignore[arg-type]
+        if not contact.image_url or book_url is None:
+            raise RequestException("contact has no image")
+        url = urljoin(book_url, contact.image_url)
+        if (sid_match := _SID_RE.search(book_url)) and not _SID_RE.search(url):
+            url += f"{'&' if '?' in url else '?'}sid={sid_match.group(1)}"
+        response = self.fph.fc.session.get(url, timeout=CONTACT_IMAGE_TIMEOUT)
+        if response.status_code != 200:
+            raise RequestException(f"HTTP {response.status_code}")
+        return response.content, response.headers.get("Content-Type")
 
     def get_phonebook_ids(self) -> list[int]:
         """Return list of phonebook ids."""
         return self.fph.phonebook_ids  # type: ignore[no-any-return]
 
-    def get_contact(self, number: str) -> Contact:
-        """Return a contact for a given phone number."""
-        number = re.sub(REGEX_NUMBER, "", str(number))
+    def get_phonebook_names(self) -> dict[int, str]:
+        """Return the names of all phonebooks on the box, by id."""
+        return {
+            phonebook_id: self.fph.phonebook_info(phonebook_id)["name"]
+            for phonebook_id in self.get_phonebook_ids()
+        }
 
-        with suppress(KeyError):
-            return self.number_dict[number]
+    def rebuild_index(self) -> None:
+        """Rebuild the number index for get_contact() from the loaded books.
 
-        if not self.prefixes:
-            return unknown_contact
+        See number_index.py for how numbers are canonicalized and matched.
+        Contacts are added in phonebook priority order, and the index keeps
+        the first contact added for a number. Everything is built on the
+        side and swapped in with the single assignment of _cached_contact
+        (the only thing get_contact() reads), so lookups running meanwhile
+        on the event loop see either the complete old or the complete new
+        index, never a half-built one.
+        """
+        contacts = [
+            contact
+            for phonebook_id in self.loaded_phonebook_ids
+            for contact in self._books.get(phonebook_id, ())
+        ]
+        number_index: NumberIndex[Contact] = NumberIndex(
+            self.dialing_codes, self.prefixes
+        )
+        for contact in contacts:
+            for number in contact.numbers:
+                number_index.add(number, contact)
 
-        for prefix in self.prefixes:
-            with suppress(KeyError):
-                return self.number_dict[prefix + number]
-            with suppress(KeyError):
-                return self.number_dict[prefix + number.lstrip("0")]
+        def lookup_contact(number: str) -> Contact:
+            return number_index.lookup(number) or unknown_contact
 
-        return unknown_contact
+        self.contacts = contacts
+        self.number_index = number_index
+        self._cached_contact = lru_cache(maxsize=CONTACT_LOOKUP_CACHE_SIZE)(
+            lookup_contact
+        )
+        self.revision += 1
+        _LOGGER.debug(
+            "Fritz!Box phone book(s) %s successfully updated",
+            self.loaded_phonebook_ids,
+        )
+
+    def get_contact(self, number: str) -> Contact:
+        """Return a contact for a given phone number."""
+        return self._cached_contact(number)
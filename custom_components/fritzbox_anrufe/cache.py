@@ -0,0 +1,172 @@
+"""Size-bounded on-disk file cache with LRU eviction.
+
+Used for data that is expensive to fetch from the FRITZ!Box but never
+changes under a given name - contact images are stored under the SHA-256
+of their content (see :meth:`DiskCache.put_content`), so the same picture
+used by several contacts/books is stored once and a cached file never goes
+stale; answering-machine recordings under a hash of the message's identity
+plus a file extension for their content type (see :meth:`DiskCache.find`
+and ``voicemail.py``). Recency is tracked through the files' mtime
+(touched on every hit), so the cache needs no index of its own and
+survives restarts as-is.
+
+All methods do file I/O and are BLOCKING - executor only.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import mimetypes
+import os
+from pathlib import Path
+import shutil
+import tempfile
+
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+_TMP_SUFFIX = ".tmp"
+
+
+def entry_cache_dir(hass: HomeAssistant, entry_id: str, *parts: str) -> Path:
+    """Return (a subdirectory of) a config entry's cache directory."""
+    return Path(hass.config.path(".cache", DOMAIN, entry_id, *parts))
+
+
+def remove_entry_cache(hass: HomeAssistant, entry_id: str) -> None:
+    """Delete all cached files of a config entry - executor only."""
+    shutil.rmtree(entry_cache_dir(hass, entry_id), ignore_errors=True)
+
+
+class DiskCache:
+    """Directory of cached files, evicting the least recently used ones."""
+
+    def __init__(self, directory: Path, max_bytes: int) -> None:
+        """Initialize the cache; the directory is created on first write."""
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def _path(self, name: str) -> Path | None:
+        """Return the path for a file name, None if it is not a plain name."""
+        if not name or Path(name).name != name or name.endswith(_TMP_SUFFIX):
+            return None
+        return self.directory / name
+
+    def get(self, name: str) -> Path | None:
+        """Return the path of a cached file and mark it as recently used."""
+        if (path := self._path(name)) is None:
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            return None
+        return path
+
+    def find(self, stem: str) -> Path | None:
+        """Return the cached file named ``stem`` plus any extension, if any."""
+        if self._path(stem) is None:
+            return None
+        for path in self.directory.glob(f"{stem}*"):
+            if path.name.endswith(_TMP_SUFFIX) or path.stem != stem:
+                continue
+            return self.get(path.name)
+        return None
+
+    def put(self, name: str, data: bytes) -> Path:
+        """Store a file under the given name, then enforce the size cap."""
+        writer = self.writer(name)
+        try:
+            writer.write(data)
+        except OSError:
+            writer.abort()
+            raise
+        return writer.commit()
+
+    def writer(self, name: str) -> CacheWriter:
+        """Return a writer adding a file chunk by chunk (e.g. while streaming)."""
+        if (path := self._path(name)) is None:
+            raise ValueError(f"invalid cache file name: {name!r}")
+        self.directory.mkdir(parents=True, exist_ok=True)
+        return CacheWriter(self, path)
+
+    def put_content(self, data: bytes, content_type: str | None = None) -> str:
+        """Store data under the hash of its content; return the file name."""
+        suffix = ""
+        if content_type:
+            suffix = mimetypes.guess_extension(content_type.split(";")[0].strip()) or ""
+        name = hashlib.sha256(data).hexdigest() + suffix
+        if self.get(name) is None:
+            self.put(name, data)
+        return name
+
+    def _evict(self, keep: Path) -> None:
+        """Delete the least recently used files until the cap is met."""
+        files = []
+        total = 0
+        for entry in os.scandir(self.directory):
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            if entry.name.endswith(_TMP_SUFFIX) or not entry.is_file():
+                continue
+            files.append((stat.st_mtime, stat.st_size, entry.path))
+            total += stat.st_size
+        files.sort()
+        for _mtime, size, path in files:
+            if total <= self.max_bytes:
+                break
+            if path == str(keep):
+                continue
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+            _LOGGER.debug("Evicted %s from cache %s", path, self.directory)
+
+
+class CacheWriter:
+    """A cache file being written - invisible to readers until committed.
+
+    Data goes to a temporary file that :meth:`commit` renames into place,
+    so a reader never sees a partially written file; :meth:`abort` (e.g.
+    after a failed download) discards it. The temporary file is written
+    unbuffered, so it can be read while it grows (see :attr:`temp_path`).
+    """
+
+    def __init__(self, cache: DiskCache, path: Path) -> None:
+        """Open the temporary file."""
+        self._cache = cache
+        self._path = path
+        self._file = tempfile.NamedTemporaryFile(  # noqa: SIM115 - closed in commit/abort
+            buffering=0, dir=cache.directory, suffix=_TMP_SUFFIX, delete=False
+        )
+
+    @property
+    def temp_path(self) -> Path:
+        """Return the temporary file - everything written so far is in it."""
+        return Path(self._file.name)
+
+    def write(self, data: bytes) -> None:
+        """Append a chunk."""
+        self._file.write(data)
+
+    def commit(self) -> Path:
+        """Move the file into place, then enforce the cache's size cap."""
+        self._file.close()
+        os.replace(self._file.name, self._path)
+        self._cache._evict(keep=self._path)  # noqa: SLF001
+        return self._path
+
+    def abort(self) -> None:
+        """Discard the file."""
+        self._file.close()
+        try:
+            os.remove(self._file.name)
+        except FileNotFoundError:
+            pass
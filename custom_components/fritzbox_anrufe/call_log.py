@@ -23,13 +23,12 @@ To still offer independent per-sensor limits (as configured via
 ``conf_call_log_count``/``conf_call_log_days``), this coordinator always
 downloads one generous, shared window - the last
 :data:`~.const.SHARED_CALL_LOG_FETCH_DAYS` days, combined across all call
-types - once per polling cycle, and then applies each sensor's own count/
-days limit *client-side*, after splitting the shared download by type. The
-practical consequence: if a sensor is configured for "days" mode, that
-sensor can never see further back than the shared fetch window (90 days by
-default); a "count" mode sensor will show fewer than its configured count
-if there simply weren't that many calls of that type within the shared
-window.
+types - keeps it up to date (incrementally, see "Incremental sync" below),
+and then applies each sensor's own count/days limit *client-side*, after
+splitting the shared window by type on every polling cycle. The
+practical consequence: a "count" mode sensor will show fewer than its
+configured count if there simply weren't that many calls of that type
+within the locally kept history (see "Persistent history" below).
 
 Failed outgoing calls are invisible to TR-064 (since v1.0.3)
 --------------------------------------------------------------
@@ -52,6 +51,40 @@ own background thread) and merged into the "ausgehend" bucket on every
 by (minute, called number) in case a future FRITZ!OS version ever does log
 them after all. Being in-memory only, they do not survive a Home Assistant
 restart - only attempts observed while this integration is running show up.
+
+Incremental sync
+----------------
+Re-downloading (and re-parsing) the whole shared window on every polling
+cycle is wasteful on a busy line - most cycles bring zero or one new call.
+``GetCallList``'s list URL accepts two further parameters besides
+``days``/``max``: ``id`` (only return calls with a newer ``Id`` than this)
+and ``timestamp`` (the list's own ``<timestamp>`` from the previous
+download). :class:`FritzCallLogCoordinator` therefore only downloads the
+full window once (:meth:`~FritzCallLogCoordinator._full_resync`) and from
+then on only asks for entries newer than the highest ``Id`` it has already
+seen, merging them by ``Id`` into its in-memory store (``_known_calls``).
+A full resync is only done again when the box reports a reset (its list
+timestamp went backwards, or a known ``Id`` came back with different
+content - e.g. after the call list was cleared on the box) or a gap (the
+first new ``Id`` does not directly follow the last one seen, so entries
+were missed). Calls still in progress (the two transient "active" raw
+types) hold the watermark back, so their finalized entry is picked up by
+the next incremental download instead of being skipped.
+
+Persistent history
+------------------
+The call store is also kept on disk (a ``homeassistant.helpers.storage``
+``Store`` per config entry under ``.storage``, keyed by call ``Id``, plus
+the incremental-sync watermark), loaded by
+:meth:`FritzCallLogCoordinator.async_load_history` before the first
+refresh. A Home Assistant restart therefore only tops the store up
+incrementally instead of downloading the full window again. It also means
+calls the box itself has already dropped stay available - up to
+:data:`~.const.MAX_CALL_LOG_DAYS` days, which is why a "days" mode sensor
+may look further back than the :data:`~.const.SHARED_CALL_LOG_FETCH_DAYS`
+days a full download covers. A full resync only replaces what lies
+*inside* that window (the box is authoritative there); older stored calls
+are kept, unless the box has since reused their ``Id`` after a reset.
 """
 
 from __future__ import annotations
@@ -60,24 +93,32 @@ from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 import logging
 from threading import Lock
+from typing import Any
+from urllib.parse import urlencode
 
 from fritzconnection.core.exceptions import FritzConnectionException, FritzSecurityError
 from fritzconnection.lib.fritzcall import (
-    ALL_CALL_TYPES,
+    ACTIVE_OUT_CALL_TYPE,
+    ACTIVE_RECEIVED_CALL_TYPE,
     MISSED_CALL_TYPE,
     OUT_CALL_TYPE,
     RECEIVED_CALL_TYPE,
     REJECTED_CALL_TYPE,
+    SERVICE as ONTEL_SERVICE,
+    AttributeConverter,
     Call,
     FritzCall,
 )
 from requests.exceptions import ConnectionError as RequestsConnectionError
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .const import (
+    CALL_HISTORY_SAVE_DELAY_SECONDS,
+    CALL_HISTORY_STORAGE_VERSION,
     CALL_LOG_LIMIT_DAYS,
     CALL_OUTCOME_ANSWERED,
     CALL_OUTCOME_CONNECTED,
@@ -93,20 +134,140 @@ from .const import (
     DEFAULT_CALL_LOG_DAYS,
     DEFAULT_CALL_LOG_LIMIT_TYPE,
     DEVICE_ANSWERING_MACHINE,
+    DOMAIN,
+    MAX_CALL_LOG_DAYS,
     SHARED_CALL_LOG_FETCH_DAYS,
     conf_call_log_count,
     conf_call_log_days,
     conf_call_log_limit_type,
 )
+from .dates import parse_fritz_datetime
+from .number_index import intern_number
+from .refresh import adapt_update_interval, post_call_debouncer
 from .tam import TamMessage
 from .voicemail import FritzTamCoordinator
+from .xmlstream import stream_records
 
 _LOGGER = logging.getLogger(__name__)
 
 CALL_LOG_UPDATE_INTERVAL = timedelta(minutes=5)
 
+# Raw call types the FRITZ!Box reports for calls still in progress - see
+# the module docstring ("Incremental sync") for why these matter there.
+_ACTIVE_CALL_TYPES = (ACTIVE_RECEIVED_CALL_TYPE, ACTIVE_OUT_CALL_TYPE)
+
+
+class CallRecord(Call):
+    """A fritzconnection Call whose ``date`` uses the fast timestamp parser.
+
+    ``Call.date`` converts ``Date`` with strptime on every access, and every
+    poll reads it many times per call (history cutoff, sorting, TAM
+    matching, sensor rows) - see dates.py.
+    """
+
+    date = AttributeConverter("Date", parse_fritz_datetime)
+
+
+@dataclass
+class CallListDownload:
+    """One (partial) call-list download: its calls and list <timestamp>."""
+
+    calls: list[Call]
+    timestamp: str | None
+
+
+# Raw (XML node) attributes of a fritzconnection Call that are persisted in
+# the local call history - everything GetCallList delivers per call.
+_STORED_CALL_FIELDS = (
+    "Id",
+    "Type",
+    "Called",
+    "Caller",
+    "CallerNumber",
+    "CalledNumber",
+    "Name",
+    "Device",
+    "Port",
+    "Date",
+    "Duration",
+    "Count",
+    "Path",
+)
+
+# Number fields interned at parse time, see number_index.intern_number().
+_NUMBER_FIELDS = ("Called", "Caller", "CallerNumber", "CalledNumber")
+
+
+def _intern_numbers(call: Call) -> Call:
+    """Intern a freshly parsed call's number strings (in place)."""
+    for name in _NUMBER_FIELDS:
+        setattr(call, name, intern_number(getattr(call, name, None)))
+    return call
+
+
+def _call_to_stored(call: Call) -> dict[str, str | None]:
+    """Serialize one Call's raw fields for the local call history."""
+    return {name: getattr(call, name) for name in _STORED_CALL_FIELDS}
+
+
+def _call_from_stored(stored: dict[str, str | None]) -> Call:
+    """Rebuild one Call from its serialized raw fields."""
+    call = CallRecord()
+    for name in _STORED_CALL_FIELDS:
+        setattr(call, name, stored.get(name))
+    return _intern_numbers(call)
+
+
+def _call_history_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    """Return the local call-history Store of one config entry."""
+    return Store(hass, CALL_HISTORY_STORAGE_VERSION, f"{DOMAIN}.{entry_id}.call_history")
 
-def _find_matching_tam_message(call: Call, tam_messages: list[TamMessage]) -> TamMessage | None:
+
+async def async_remove_call_history(hass: HomeAssistant, entry_id: str) -> None:
+    """Delete the local call history of a removed config entry."""
+    await _call_history_store(hass, entry_id).async_remove()
+
+
+def _int_or_none(value: object) -> int | None:
+    """Return ``value`` as int, or None if it isn't a plain integer string."""
+    try:
+        return int(value)  # type: ignore[call-overload]
+    except (TypeError, ValueError):
+        return None
+
+
+def _call_sort_key(call: Call) -> tuple[datetime, int]:
+    """Sort key reproducing the box's own list order (newest first, reversed)."""
+    date = call.date if isinstance(call.date, datetime) else datetime.min
+    return date, _int_or_none(call.Id) or 0
+
+
+# (minute, number) -> (list position, message), see _build_tam_index. The
+# number part is the message's caller number, "" for messages without one,
+# or None for the "any number" fallback bucket of that minute.
+type TamMessageIndex = dict[tuple[datetime, str | None], tuple[int, TamMessage]]
+
+
+def _build_tam_index(tam_messages: list[TamMessage]) -> TamMessageIndex:
+    """Index the answering-machine messages once per poll for O(1) matching.
+
+    Every message lands in up to two buckets of its minute: its own caller
+    number ("" if it has none) and the ``None`` fallback bucket used for
+    calls without a caller number. Only the *first* message per bucket is
+    kept, together with its list position, so ``_find_matching_tam_message``
+    returns exactly what a linear scan over ``tam_messages`` would.
+    """
+    index: TamMessageIndex = {}
+    for position, message in enumerate(tam_messages):
+        if not isinstance(message.date, datetime):
+            continue
+        entry = (position, message)
+        index.setdefault((message.date, message.Number or ""), entry)
+        index.setdefault((message.date, None), entry)
+    return index
+
+
+def _find_matching_tam_message(call: Call, tam_index: TamMessageIndex) -> TamMessage | None:
     """Find the answering-machine message (if any) this call produced.
 
     Both ``Call.date`` and ``TamMessage.date`` are minute-precision only -
@@ -122,17 +283,27 @@ def _find_matching_tam_message(call: Call, tam_messages: list[TamMessage]) -> Ta
     minute. Per Thorsten's suggestion (based on his own FRITZ!Box), this is
     what makes CALL_OUTCOME_VOICEMAIL vs. CALL_OUTCOME_UNREACHED trustworthy
     in practice.
+
+    A dict lookup in ``tam_index`` (see ``_build_tam_index``) rather than a
+    scan over all messages, since this runs for every call on every poll:
+    with a caller number, the earlier of "same number" and "message without
+    a number" wins - the same message the scan used to stop at.
     """
     if not isinstance(call.date, datetime):
         return None
     caller_number = call.Caller or None
-    for message in tam_messages:
-        if not isinstance(message.date, datetime) or message.date != call.date:
-            continue
-        if caller_number and message.Number and message.Number != caller_number:
-            continue
-        return message
-    return None
+    if not caller_number:
+        entry = tam_index.get((call.date, None))
+        return entry[1] if entry is not None else None
+    candidates = [
+        entry
+        for entry in (
+            tam_index.get((call.date, caller_number)),
+            tam_index.get((call.date, "")),
+        )
+        if entry is not None
+    ]
+    return min(candidates, key=lambda entry: entry[0])[1] if candidates else None
 
 
 def _classify_call(call: Call, matched_message: TamMessage | None) -> tuple[str | None, str | None]:
@@ -249,14 +420,66 @@ def _log_raw_call_for_diagnostics(
 
 @dataclass
 class CallLogData:
-    """Container bundling the three call lists for one polling cycle."""
+    """Container bundling the three call lists for one polling cycle.
+
+    ``fingerprints`` holds one content hash per bucket (see
+    ``_bucket_fingerprint``), so the sensors can skip their state write
+    when a refresh didn't change what they show.
+    """
 
     calls_by_type: dict[str, list[Call]] = field(default_factory=dict)
+    fingerprints: dict[str, int] = field(default_factory=dict)
 
     def calls(self, call_type: str) -> list[Call]:
         """Return the calls of the given type ("eingehend"/"ausgehend"/"verpasst")."""
         return self.calls_by_type.get(call_type, [])
 
+    def fingerprint(self, call_type: str) -> int | None:
+        """Return the content fingerprint of one bucket, if computed."""
+        return self.fingerprints.get(call_type)
+
+
+def _limits_satisfied(
+    calls_by_type: dict[str, list[Call]],
+    limits: dict[str, tuple[str, int]],
+    now: datetime,
+    next_call: Call,
+) -> bool:
+    """Return whether no bucket can take ``next_call`` or anything older.
+
+    The raw calls are classified newest first, so a "count" bucket is done
+    once it holds its count, and a "days" bucket once the next call lies
+    before its cutoff (or has no parseable date - see _apply_limit).
+    """
+    date = next_call.date
+    for call_type, (limit_type, value) in limits.items():
+        if limit_type == CALL_LOG_LIMIT_DAYS:
+            if isinstance(date, datetime) and date >= now - timedelta(days=value):
+                return False
+        elif len(calls_by_type[call_type]) < value:
+            return False
+    return True
+
+
+def _bucket_fingerprint(calls: list[Call]) -> int:
+    """Hash what a call-list sensor shows of one (already limited) bucket.
+
+    A call's ``Id`` stands for all of its raw fields (the box never changes
+    a finished call's entry), so only the classification added on top of
+    it - ``outcome`` and the matched answering-machine message, which picks
+    the ``media_url`` - has to be hashed alongside.
+    """
+    return hash(
+        tuple(
+            (
+                call.Id,
+                getattr(call, "outcome", None),
+                getattr(getattr(call, "tam_message", None), "Index", None),
+            )
+            for call in calls
+        )
+    )
+
 
 class FritzCallLogCoordinator(DataUpdateCoordinator[CallLogData]):
     """Coordinator that periodically fetches the FRITZ!Box call list via TR-064."""
@@ -280,6 +503,7 @@ class FritzCallLogCoordinator(DataUpdateCoordinator[CallLogData]):
             _LOGGER,
             name="fritzbox_anrufe call log",
             update_interval=CALL_LOG_UPDATE_INTERVAL,
+            request_refresh_debouncer=post_call_debouncer(hass, _LOGGER),
         )
         self.config_entry = config_entry
         self._fritz_call = fritz_call
@@ -291,6 +515,23 @@ class FritzCallLogCoordinator(DataUpdateCoordinator[CallLogData]):
         # hence the lock, rather than relying on GIL-level atomicity.
         self._synthetic_outgoing_lock = Lock()
         self._synthetic_outgoing_calls: list[Call] = []
+        # Incremental-sync state - see the module docstring ("Incremental
+        # sync") and _sync_calls() below. Only ever changed from
+        # _fetch_calls() (one executor job at a time), but read on the event
+        # loop by _history_to_store() - every change and that read hold
+        # _history_lock, so a snapshot never pairs the calls with a
+        # revision they don't belong to.
+        self._history_lock = Lock()
+        self._known_calls: dict[str, Call] = {}
+        self._sync_id: int | None = None
+        self._sync_timestamp: int | None = None
+        # Local, persistent copy of the above - see the module docstring
+        # ("Persistent history"). _history_revision is bumped by every
+        # sync that actually changed the store, so unchanged cycles don't
+        # rewrite the file.
+        self._store = _call_history_store(hass, config_entry.entry_id)
+        self._history_revision = 0
+        self._saved_history_revision = 0
 
     def _limit_for(self, call_type: str) -> tuple[str, int]:
         """Return (limit_type, value) for one call-list sensor's own option."""
@@ -310,12 +551,218 @@ class FritzCallLogCoordinator(DataUpdateCoordinator[CallLogData]):
             return [call for call in calls if isinstance(call.date, datetime) and call.date >= cutoff]
         return calls[:value]
 
+    def _download_calls(self, **params: int) -> CallListDownload:
+        """Download (part of) the raw call list, passing extra list-URL params.
+
+        Same two steps as ``FritzCall.get_calls()`` (``GetCallList`` for a
+        session-authenticated list URL, then download and parse it), but
+        with arbitrary extra query parameters - ``FritzCall`` itself only
+        supports ``days``/``max``, not the ``id``/``timestamp`` pair the
+        incremental sync needs - and parsed while streaming (see
+        xmlstream.py), never holding the whole document in memory.
+        """
+        fc = self._fritz_call.fc
+        url = fc.call_action(ONTEL_SERVICE, "GetCallList")["NewCallListURL"]
+        if params:
+            url += f"&{urlencode(params)}"
+        header: dict[str, str | None] = {}
+        calls = [
+            _intern_numbers(call)
+            for call in stream_records(url, fc.session, "Call", CallRecord, header)
+        ]
+        return CallListDownload(calls=calls, timestamp=header.get("timestamp"))
+
+    async def async_load_history(self) -> None:
+        """Load the locally persisted call history, if any (before 1st refresh)."""
+        try:
+            stored = await self._store.async_load()
+        except Exception as ex:  # noqa: BLE001 - a broken file just means a cold start
+            _LOGGER.warning(
+                "Lokaler Anrufverlauf konnte nicht geladen werden (%s) - die"
+                " Anrufliste wird vollständig neu von der FRITZ!Box abgerufen.",
+                ex,
+            )
+            return
+        if not stored:
+            return
+        self._known_calls = {
+            str(entry["Id"]): _call_from_stored(entry)
+            for entry in stored.get("calls", [])
+            if entry.get("Id") is not None
+        }
+        self._sync_id = stored.get("sync_id")
+        self._sync_timestamp = stored.get("sync_timestamp")
+        _LOGGER.debug(
+            "Lokaler Anrufverlauf geladen: %s Einträge, Id-Stand %s",
+            len(self._known_calls),
+            self._sync_id,
+        )
+
+    async def async_save_history(self) -> None:
+        """Write pending call-history changes now (on unload).
+
+        Replaces a still-pending async_delay_save, so no delayed write can
+        fire after the entry is gone - it would recreate the file
+        async_remove_call_history just deleted.
+        """
+        if self._history_revision != self._saved_history_revision:
+            await self._store.async_save(self._history_to_store())
+
+    @callback
+    def _history_to_store(self) -> dict[str, Any]:
+        """Return the call store in its on-disk form (see async_delay_save)."""
+        with self._history_lock:
+            revision = self._history_revision
+            stored = {
+                "sync_id": self._sync_id,
+                "sync_timestamp": self._sync_timestamp,
+                "calls": [_call_to_stored(call) for call in self._known_calls.values()],
+            }
+        self._saved_history_revision = revision
+        return stored
+
+    def _full_resync(self) -> None:
+        """Refresh the call store from a fresh download of the shared window.
+
+        Within the downloaded window the box is authoritative - stored
+        calls it no longer lists there are dropped. Older stored calls are
+        kept (see the module docstring, "Persistent history"), except where
+        their ``Id`` now belongs to a different, downloaded call.
+        """
+        collection = self._download_calls(days=SHARED_CALL_LOG_FETCH_DAYS)
+        downloaded = {
+            str(call.Id): call for call in collection.calls if call.Id is not None
+        }
+        window_start = datetime.now() - timedelta(days=SHARED_CALL_LOG_FETCH_DAYS)
+        with self._history_lock:
+            kept = {
+                call_id: call
+                for call_id, call in self._known_calls.items()
+                if call_id not in downloaded
+                and isinstance(call.date, datetime)
+                and call.date < window_start
+            }
+            self._known_calls = {**downloaded, **kept}
+            self._history_revision += 1
+            self._sync_timestamp = _int_or_none(collection.timestamp)
+            # 0 rather than None for an empty list, so the next cycle syncs
+            # incrementally ("everything newer than Id 0") instead of
+            # repeating the full download until the very first call comes in.
+            self._sync_id = 0
+            self._advance_watermark(collection.calls)
+        _LOGGER.debug(
+            "Anrufliste vollständig neu geladen: %s Einträge, Id-Stand %s",
+            len(self._known_calls),
+            self._sync_id,
+        )
+
+    def _advance_watermark(self, calls: list[Call]) -> None:
+        """Move the "newest Id seen" watermark past ``calls``.
+
+        Calls still in progress (``_ACTIVE_CALL_TYPES``) hold it back just
+        below their own ``Id``, so the finalized entry for the same call is
+        downloaded again by the next incremental sync.
+        """
+        ids = [call_id for call in calls if (call_id := _int_or_none(call.Id)) is not None]
+        if not ids:
+            return
+        active_ids = [
+            call_id
+            for call in calls
+            if call.type in _ACTIVE_CALL_TYPES
+            and (call_id := _int_or_none(call.Id)) is not None
+        ]
+        if active_ids:
+            self._sync_id = min(active_ids) - 1
+        else:
+            self._sync_id = max(max(ids), self._sync_id or 0)
+
+    def _needs_full_resync(self, collection: CallListDownload) -> str | None:
+        """Return why an incremental download can't be merged, or None if it can."""
+        timestamp = _int_or_none(collection.timestamp)
+        if (
+            timestamp is not None
+            and self._sync_timestamp is not None
+            and timestamp < self._sync_timestamp
+        ):
+            return "Zeitstempel der Anrufliste ist zurückgesprungen"
+
+        new_ids: list[int] = []
+        for call in collection.calls:
+            call_id = _int_or_none(call.Id)
+            if call_id is None:
+                continue
+            known = self._known_calls.get(str(call_id))
+            if call_id <= (self._sync_id or 0):
+                # Either the box includes the watermark entry itself, or a
+                # held-back in-progress call got finalized - both fine as
+                # long as it is still the same call.
+                if known is not None and known.Date != call.Date:
+                    return f"bekannte Id {call_id} mit anderem Inhalt"
+                continue
+            new_ids.append(call_id)
+
+        if (
+            new_ids
+            and self._known_calls
+            and self._sync_id is not None
+            and min(new_ids) > self._sync_id + 1
+        ):
+            return f"Lücke zwischen Id {self._sync_id} und {min(new_ids)}"
+        return None
+
+    def _sync_calls(self) -> list[Call]:
+        """Bring the call store up to date and return it, newest first.
+
+        See the module docstring ("Incremental sync"): a full download of
+        the shared window only on the very first cycle, or after the box
+        reported a reset/gap (see _needs_full_resync), otherwise just the
+        entries newer than the watermark, merged by ``Id``.
+        """
+        if self._sync_id is None:
+            self._full_resync()
+        else:
+            params = {"id": self._sync_id}
+            if self._sync_timestamp is not None:
+                params["timestamp"] = self._sync_timestamp
+            collection = self._download_calls(**params)
+            if (reason := self._needs_full_resync(collection)) is not None:
+                _LOGGER.debug("Anrufliste: vollständiger Neuabruf (%s)", reason)
+                self._full_resync()
+            elif collection.calls:
+                with self._history_lock:
+                    self._known_calls = {
+                        **self._known_calls,
+                        **{
+                            str(call.Id): call
+                            for call in collection.calls
+                            if call.Id is not None
+                        },
+                    }
+                    if (timestamp := _int_or_none(collection.timestamp)) is not None:
+                        self._sync_timestamp = timestamp
+                    self._advance_watermark(collection.calls)
+                    self._history_revision += 1
+
+        cutoff = datetime.now() - timedelta(days=MAX_CALL_LOG_DAYS)
+        with self._history_lock:
+            known_calls = {
+                call_id: call
+                for call_id, call in self._known_calls.items()
+                if not isinstance(call.date, datetime) or call.date >= cutoff
+            }
+            if len(known_calls) != len(self._known_calls):
+                self._history_revision += 1
+            self._known_calls = known_calls
+        return sorted(known_calls.values(), key=_call_sort_key, reverse=True)
+
     def _fetch_calls(self) -> CallLogData:
-        """Download the shared call list once and split/limit it per bucket.
+        """Sync the shared call list and split/limit it per bucket.
 
-        A single ``get_calls(calltype=ALL_CALL_TYPES, update=True, ...)``
-        downloads the raw, combined call list from the FRITZ!Box exactly
-        once per polling cycle; every call is then matched against the
+        A single :meth:`_sync_calls` brings the raw, combined call list up
+        to date with at most one download per polling cycle (usually just
+        the handful of entries added since the last one, see the module
+        docstring); every call is then matched against the
         answering-machine coordinator's currently-known messages (see
         ``_find_matching_tam_message`` - uses whatever ``self._tam_coordinator.data``
         already holds, does NOT trigger its own TAM refresh, to keep this a
@@ -331,18 +778,21 @@ class FritzCallLogCoordinator(DataUpdateCoordinator[CallLogData]):
         unconfirmed call-list one whenever a confident match exists (see
         ``sensor.py:_call_to_dict``).
         """
-        raw_calls = self._fritz_call.get_calls(
-            calltype=ALL_CALL_TYPES,
-            update=True,
-            days=SHARED_CALL_LOG_FETCH_DAYS,
-        )
+        raw_calls = self._sync_calls()
         tam_messages: list[TamMessage] = (
             (self._tam_coordinator.data if self._tam_coordinator is not None else None) or []
         )
+        tam_index = _build_tam_index(tam_messages)
 
         unsorted_by_type: dict[str, list[Call]] = {call_type: [] for call_type in CALL_TYPES}
+        limits = {call_type: self._limit_for(call_type) for call_type in CALL_TYPES}
+        now = datetime.now()
         for call in raw_calls:
-            matched_message = _find_matching_tam_message(call, tam_messages)
+            if _limits_satisfied(unsorted_by_type, limits, now, call):
+                # Everything from here on is older and would be cut by
+                # _apply_limit anyway - no need to match/classify it.
+                break
+            matched_message = _find_matching_tam_message(call, tam_index)
             bucket, outcome = _classify_call(call, matched_message)
             if _LOGGER.isEnabledFor(logging.DEBUG):
                 _log_raw_call_for_diagnostics(call, bucket, outcome, matched_message)
@@ -378,7 +828,13 @@ class FritzCallLogCoordinator(DataUpdateCoordinator[CallLogData]):
             call_type: self._apply_limit(calls, call_type)
             for call_type, calls in unsorted_by_type.items()
         }
-        return CallLogData(calls_by_type=calls_by_type)
+        return CallLogData(
+            calls_by_type=calls_by_type,
+            fingerprints={
+                call_type: _bucket_fingerprint(calls)
+                for call_type, calls in calls_by_type.items()
+            },
+        )
 
     def add_synthetic_outgoing_call(self, call: Call) -> None:
         """Record a failed outgoing dial attempt observed via the live callmonitor.
@@ -388,8 +844,8 @@ class FritzCallLogCoordinator(DataUpdateCoordinator[CallLogData]):
         NOT the Home Assistant event loop. Just buffers the call; it is
         merged into the "ausgehend" bucket on the next _fetch_calls() (see
         the module docstring for why this exists at all) - typically only
-        a few seconds later, via the post-call refresh already scheduled by
-        set_state() for this same call ending.
+        a few seconds later, via the post-call refresh already requested
+        for this same DISCONNECT (see refresh.py).
         """
         with self._synthetic_outgoing_lock:
             self._synthetic_outgoing_calls.append(call)
@@ -421,7 +877,7 @@ class FritzCallLogCoordinator(DataUpdateCoordinator[CallLogData]):
     async def _async_update_data(self) -> CallLogData:
         """Fetch the current call lists from the FRITZ!Box (executor job)."""
         try:
-            return await self.hass.async_add_executor_job(self._fetch_calls)
+            data = await self.hass.async_add_executor_job(self._fetch_calls)
         except FritzSecurityError as ex:
             raise UpdateFailed(
                 "Dem FRITZ!Box-Konto fehlt die Berechtigung 'Sprachnachrichten,"
@@ -430,3 +886,13 @@ class FritzCallLogCoordinator(DataUpdateCoordinator[CallLogData]):
             ) from ex
         except (FritzConnectionException, RequestsConnectionError) as ex:
             raise UpdateFailed(f"Fehler beim Abrufen der FRITZ!Box-Anrufliste: {ex}") from ex
+        if self._history_revision != self._saved_history_revision:
+            self._store.async_delay_save(
+                self._history_to_store, CALL_HISTORY_SAVE_DELAY_SECONDS
+            )
+        adapt_update_interval(
+            self,
+            CALL_LOG_UPDATE_INTERVAL,
+            changed=self.data is None or data.fingerprints != self.data.fingerprints,
+        )
+        return data
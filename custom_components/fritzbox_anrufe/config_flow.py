@@ -14,6 +14,7 @@ import voluptuous as vol
 
 from homeassistant.config_entries import (
     ConfigEntry,
+    ConfigEntryState,
     ConfigFlow,
     ConfigFlowResult,
     OptionsFlowWithReload,
@@ -28,14 +29,21 @@ from .const import (
     CALL_LOG_LIMIT_COUNT,
     CALL_LOG_LIMIT_DAYS,
     CALL_TYPES,
+    CONF_ADDITIONAL_PHONEBOOKS,
+    CONF_AREA_CODE,
+    CONF_ASYNC_CALLMONITOR,
+    CONF_COUNTRY_CODE,
     CONF_PHONEBOOK,
+    CONF_PREFETCH_RECORDINGS,
     CONF_PREFIXES,
+    DEFAULT_ASYNC_CALLMONITOR,
     DEFAULT_CALL_LOG_COUNT,
     DEFAULT_CALL_LOG_DAYS,
     DEFAULT_CALL_LOG_LIMIT_TYPE,
     DEFAULT_HOST,
     DEFAULT_PHONEBOOK,
     DEFAULT_PORT,
+    DEFAULT_PREFETCH_RECORDINGS,
     DEFAULT_USERNAME,
     DOMAIN,
     FRITZ_ATTR_NAME,
@@ -66,6 +74,7 @@ class ConnectResult(StrEnum):
     INVALID_AUTH = "invalid_auth"
     INSUFFICIENT_PERMISSIONS = "insufficient_permissions"
     MALFORMED_PREFIXES = "malformed_prefixes"
+    MALFORMED_DIALING_CODES = "malformed_dialing_codes"
     NO_DEVIES_FOUND = "no_devices_found"
     UNKNOWN = "unknown"
     SUCCESS = "success"
@@ -386,7 +395,35 @@ class FritzBoxCallMonitorOptionsFlowHandler(OptionsFlowWithReload):
             return None
         return [prefix.strip() for prefix in prefixes.split(",")]
 
-    def _get_option_schema(self) -> vol.Schema:
+    @classmethod
+    def _are_dialing_codes_valid(cls, *codes: str | None) -> bool:
+        """Check that country/area codes (if given) are digits only."""
+        return all(code.strip().lstrip("+").isdecimal() for code in codes if code)
+
+    async def _async_get_phonebook_options(self) -> list[selector.SelectOptionDict]:
+        """Return the box's other phonebooks as select options.
+
+        Needs the entry's already connected FritzBoxPhonebook - if the entry
+        isn't loaded (or the box doesn't answer), the field is left out of
+        the form and the current selection kept.
+        """
+        if self.config_entry.state is not ConfigEntryState.LOADED:
+            return []
+        phonebook = self.config_entry.runtime_data.phonebook
+        try:
+            names = await self.hass.async_add_executor_job(phonebook.get_phonebook_names)
+        except (FritzConnectionException, RequestsConnectionError) as ex:
+            _LOGGER.debug("Could not list phonebooks: %s", ex)
+            return []
+        return [
+            selector.SelectOptionDict(value=str(phonebook_id), label=name)
+            for phonebook_id, name in names.items()
+            if phonebook_id != self.config_entry.data[CONF_PHONEBOOK]
+        ]
+
+    def _get_option_schema(
+        self, phonebook_options: list[selector.SelectOptionDict]
+    ) -> vol.Schema:
         """Get the option schema for prefixes and each sensor's history depth.
 
         Each of the three call-list sensors (fritzbox_anrufe_eingehend/
@@ -394,11 +431,46 @@ class FritzBoxCallMonitorOptionsFlowHandler(OptionsFlowWithReload):
         Anzahl-oder-Tage setting - see :func:`_history_schema_dict`.
         """
         options = self.config_entry.options
-        schema: dict[Any, Any] = {
+        schema: dict[Any, Any] = {}
+        if phonebook_options:
+            schema[
+                vol.Optional(
+                    CONF_ADDITIONAL_PHONEBOOKS,
+                    default=[
+                        str(phonebook_id)
+                        for phonebook_id in options.get(CONF_ADDITIONAL_PHONEBOOKS, [])
+                    ],
+                )
+            ] = selector.SelectSelector(
+                selector.SelectSelectorConfig(
+                    options=phonebook_options,
+                    multiple=True,
+                    mode=selector.SelectSelectorMode.LIST,
+                )
+            )
+        schema |= {
             vol.Optional(
                 CONF_PREFIXES,
                 description={"suggested_value": options.get(CONF_PREFIXES)},
             ): str,
+            vol.Optional(
+                CONF_COUNTRY_CODE,
+                description={"suggested_value": options.get(CONF_COUNTRY_CODE)},
+            ): str,
+            vol.Optional(
+                CONF_AREA_CODE,
+                description={"suggested_value": options.get(CONF_AREA_CODE)},
+            ): str,
+            vol.Optional(
+                CONF_ASYNC_CALLMONITOR,
+                default=options.get(CONF_ASYNC_CALLMONITOR, DEFAULT_ASYNC_CALLMONITOR),
+            ): bool,
+            vol.Optional(
+                CONF_PREFETCH_RECORDINGS,
+                default=options.get(
+                    CONF_PREFETCH_RECORDINGS, DEFAULT_PREFETCH_RECORDINGS
+                ),
+            ): bool,
         }
         schema.update(_history_schema_dict(options))
         return vol.Schema(schema)
@@ -408,7 +480,9 @@ class FritzBoxCallMonitorOptionsFlowHandler(OptionsFlowWithReload):
     ) -> ConfigFlowResult:
         """Manage the options."""
 
-        option_schema = self._get_option_schema()
+        option_schema = self._get_option_schema(
+            await self._async_get_phonebook_options()
+        )
 
         if user_input is None:
             return self.async_show_form(
@@ -426,10 +500,31 @@ class FritzBoxCallMonitorOptionsFlowHandler(OptionsFlowWithReload):
                 errors={"base": ConnectResult.MALFORMED_PREFIXES},
             )
 
+        country_code: str | None = user_input.get(CONF_COUNTRY_CODE)
+        area_code: str | None = user_input.get(CONF_AREA_CODE)
+
+        if not self._are_dialing_codes_valid(country_code, area_code):
+            return self.async_show_form(
+                step_id="init",
+                data_schema=option_schema,
+                errors={"base": ConnectResult.MALFORMED_DIALING_CODES},
+            )
+
+        additional_phonebooks: list[int] = (
+            [int(phonebook_id) for phonebook_id in user_input[CONF_ADDITIONAL_PHONEBOOKS]]
+            if CONF_ADDITIONAL_PHONEBOOKS in user_input
+            else self.config_entry.options.get(CONF_ADDITIONAL_PHONEBOOKS, [])
+        )
+
         return self.async_create_entry(
             title="",
             data={
+                CONF_ADDITIONAL_PHONEBOOKS: additional_phonebooks,
                 CONF_PREFIXES: self._get_list_of_prefixes(prefixes),
+                CONF_COUNTRY_CODE: country_code.strip() if country_code else None,
+                CONF_AREA_CODE: area_code.strip() if area_code else None,
+                CONF_ASYNC_CALLMONITOR: user_input[CONF_ASYNC_CALLMONITOR],
+                CONF_PREFETCH_RECORDINGS: user_input[CONF_PREFETCH_RECORDINGS],
                 **_parse_history_input(user_input),
             },
         )
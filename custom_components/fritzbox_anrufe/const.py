@@ -1,5 +1,6 @@
 """Constants for the AVM Fritz!Box call monitor integration."""
 
+from datetime import timedelta
 from enum import StrEnum
 from typing import Final
 
@@ -25,16 +26,22 @@ FRITZ_ATTR_SERIAL_NUMBER = "Serial"
 # to_name/with_name) und damit auch in der Dashboard-Karte.
 UNKNOWN_NAME = "Unbekannt"
 SERIAL_NUMBER = "serial_number"
-REGEX_NUMBER = r"[^\d\+]"
 
 CONF_PHONEBOOK = "phonebook"
 CONF_PHONEBOOK_NAME = "phonebook_name"
 CONF_PREFIXES = "prefixes"
+CONF_ADDITIONAL_PHONEBOOKS = "additional_phonebooks"
+CONF_ASYNC_CALLMONITOR = "async_callmonitor"
+CONF_PREFETCH_RECORDINGS = "prefetch_recordings"
+CONF_COUNTRY_CODE = "country_code"
+CONF_AREA_CODE = "area_code"
 
 DEFAULT_HOST = "169.254.1.1"  # IP valid for all Fritz!Box routers
 DEFAULT_PORT = 1012
 DEFAULT_USERNAME = "admin"
 DEFAULT_PHONEBOOK = 0
+DEFAULT_ASYNC_CALLMONITOR = False
+DEFAULT_PREFETCH_RECORDINGS = False
 DEFAULT_NAME = "Phone"
 
 DOMAIN: Final = "fritzbox_anrufe"
@@ -73,6 +80,27 @@ TAM_MEDIA_URL_BASE = "/api/fritzbox_anrufe/tam_media"
 # f"{CALL_MEDIA_URL_BASE}/{config_entry_id}/{call_type}/{call_id}".
 CALL_MEDIA_URL_BASE = "/api/fritzbox_anrufe/call_media"
 
+# Basis-URL der authentifizierten Route für Kontaktbilder aus dem
+# Telefonbuch (siehe http.py:FritzBoxContactImageView). Die Bilder werden
+# einmal pro Telefonbuch-Änderung von der FRITZ!Box geladen und lokal
+# zwischengespeichert (siehe phonebook.py). Vollständiger Pfad:
+# f"{CONTACT_IMAGE_URL_BASE}/{config_entry_id}/{dateiname}".
+CONTACT_IMAGE_URL_BASE = "/api/fritzbox_anrufe/contact_image"
+
+# Obergrenze für den lokalen Kontaktbild-Zwischenspeicher je Eintrag (Bytes);
+# darüber werden die am längsten nicht abgerufenen Bilder gelöscht.
+CONTACT_IMAGE_CACHE_MAX_BYTES = 20 * 1024 * 1024
+
+# Zuordnung Bild-URL -> Datei im Bild-Cache unter .storage, damit nach einem
+# Neustart nur neue/geänderte Kontaktbilder geladen werden (siehe
+# phonebook.py).
+CONTACT_IMAGES_STORAGE_VERSION = 1
+
+# Obergrenze für den lokalen Zwischenspeicher abgespielter Anrufbeantworter-
+# Aufnahmen je Eintrag (Bytes, siehe voicemail.py) - eine Minute Aufnahme
+# sind rund 1 MB.
+TAM_AUDIO_CACHE_MAX_BYTES = 200 * 1024 * 1024
+
 # --- "Weiterverarbeitung" (optionale Zusatzzeile pro Anruf in der Karte) --
 # Klassifiziert, wie ein einzelner Anruf ausgegangen ist - zusätzlich zur
 # (weiterhin bestehenden) Zuordnung zu genau einem der drei
@@ -119,16 +147,29 @@ CALL_OUTCOME_UNREACHED = "nicht_erreicht"
 CALL_OUTCOME_CONNECTED = "verbunden"
 CALL_OUTCOME_NOT_CONNECTED = "nicht_verbunden"
 
-# --- Zusätzliche Aktualisierung nach einem Gespräch --------------------
-# Neben der regulären 5-Minuten-Pollingintervalle beider Coordinator
-# (CALL_LOG_UPDATE_INTERVAL/TAM_UPDATE_INTERVAL) löst der Live-Callmonitor-
-# Sensor (FritzBoxCallSensor, siehe sensor.py) zusätzlich eine gezielte
-# Aktualisierung aus, sobald sein Zustand nach einem Klingeln/Wählen/
-# Gespräch wieder auf "idle" wechselt - deckt damit auch verpasste Anrufe
-# ab, nicht nur tatsächlich geführte Gespräche. Die kurze Verzögerung gibt
-# der FRITZ!Box Zeit, den Anrufliste-Eintrag zu finalisieren bzw. eine ggf.
-# aufgezeichnete Nachricht zu verarbeiten, bevor abgefragt wird.
-POST_CALL_REFRESH_DELAY_SECONDS: Final = 5
+# --- Aktualisierung nach einem Gespräch ---------------------------------
+# Beide Coordinator (Anrufliste/Anrufbeantworter) werden gezielt nach jedem
+# DISCONNECT-Ereignis des Live-Callmonitors aktualisiert (siehe refresh.py)
+# - deckt damit auch verpasste Anrufe ab, nicht nur tatsächlich geführte
+# Gespräche. Alle Anforderungen innerhalb dieses Fensters werden zu genau
+# EINER Aktualisierung an dessen Ende zusammengefasst (max. eine pro
+# Fenster); die Verzögerung gibt der FRITZ!Box außerdem Zeit, den
+# Anrufliste-Eintrag zu finalisieren bzw. eine ggf. aufgezeichnete
+# Nachricht zu verarbeiten, bevor abgefragt wird.
+POST_CALL_REFRESH_DELAY_SECONDS: Final = 10
+
+# Obergrenze, bis zu der sich das reguläre Abfrageintervall beider
+# Coordinator verdoppelt, solange Abfragen keine Änderung bringen (ruhige
+# Leitung) - siehe refresh.py:adapt_update_interval. Ein beendetes
+# Gespräch setzt es wieder auf das 5-Minuten-Grundintervall zurück.
+IDLE_UPDATE_INTERVAL_MAX: Final = timedelta(minutes=30)
+
+# Wartezeit bis zum erneuten Verbindungsaufbau des asyncio-Callmonitors
+# (Option "async_callmonitor", siehe sensor.py:AsyncFritzBoxCallMonitor) -
+# verdoppelt sich nach jedem Fehlschlag bis zur Obergrenze und beginnt nach
+# einer erfolgreichen Verbindung wieder beim Minimum.
+CALLMONITOR_RECONNECT_DELAY_MIN: Final = 5
+CALLMONITOR_RECONNECT_DELAY_MAX: Final = 300
 
 # Konfigurierbare Verlaufstiefe der drei Anruflisten-Sensoren - jeder Typ
 # (eingehend/ausgehend/verpasst) hat seine EIGENEN, unabhängig einstellbaren
@@ -141,7 +182,10 @@ DEFAULT_CALL_LOG_COUNT = 10
 DEFAULT_CALL_LOG_DAYS = 7
 
 MIN_CALL_LOG_DAYS = 1
-MAX_CALL_LOG_DAYS = 90
+# Seit dem lokalen Anrufverlauf (siehe call_log.py, "Persistent history")
+# nicht mehr durch die FRITZ!Box-eigene Aufbewahrungsdauer begrenzt - so
+# lange werden Anrufe lokal vorgehalten.
+MAX_CALL_LOG_DAYS = 365
 
 # Feste Auswahlwerte für das "Anzahl"-Dropdown (pro Sensor).
 CALL_LOG_COUNT_PRESETS: Final[tuple[int, ...]] = (5, 10, 20, 50, 100, 200)
@@ -151,7 +195,13 @@ CALL_LOG_COUNT_PRESETS: Final[tuple[int, ...]] = (5, 10, 20, 50, 100, 200)
 # eigener Einstellung (Anzahl oder Tage) gefiltert werden. Die FRITZ!Box/
 # fritzconnection-API kennt keinen "letzte N Anrufe von Typ X"-Parameter,
 # sondern begrenzt immer den gemischten Gesamtabruf - siehe call_log.py.
-SHARED_CALL_LOG_FETCH_DAYS: Final = MAX_CALL_LOG_DAYS
+# Nur noch für den vollständigen Abruf relevant; ältere Anrufe bleiben im
+# lokalen Anrufverlauf (bis MAX_CALL_LOG_DAYS) erhalten.
+SHARED_CALL_LOG_FETCH_DAYS: Final = 90
+
+# Lokaler Anrufverlauf unter .storage (siehe call_log.py).
+CALL_HISTORY_STORAGE_VERSION: Final = 1
+CALL_HISTORY_SAVE_DELAY_SECONDS: Final = 30
 
 
 def conf_call_log_limit_type(call_type: str) -> str:
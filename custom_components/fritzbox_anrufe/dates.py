@@ -0,0 +1,79 @@
+"""Fast parsing of the FRITZ!Box's fixed-format timestamps.
+
+The call list and the answering-machine list carry their dates as
+``"%d.%m.%y %H:%M"`` (e.g. ``"24.12.24 18:05"``), callmonitor events as
+``"%d.%m.%y %H:%M:%S"``. ``datetime.strptime`` handles these, but goes
+through a regex match and a locale-aware format parser for every single
+record - by far the largest cost of parsing a long call list. Since both
+formats are fixed-width, :func:`parse_fritz_datetime` slices the string
+instead, looking the date part up in a small per-day cache (a call list
+spans a few hundred distinct days at most). Anything not in the exact
+fixed-width form falls back to ``strptime``, so the results - including
+the ``ValueError`` for malformed input - are the same.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from functools import lru_cache
+
+FRITZ_DATETIME_FORMAT = "%d.%m.%y %H:%M"
+FRITZ_DATETIME_SECONDS_FORMAT = "%d.%m.%y %H:%M:%S"
+
+# Distinct "dd.mm.yy" strings remembered - more than the longest call
+# history kept (see MAX_CALL_LOG_DAYS) spans.
+_DAY_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=_DAY_CACHE_SIZE)
+def _parse_day(day_string: str) -> tuple[int, int, int]:
+    """Return (year, month, day) of a "dd.mm.yy" string."""
+    year = int(day_string[6:8])
+    # strptime's %y pivot: 69-99 -> 19xx, 00-68 -> 20xx.
+    year += 1900 if year >= 69 else 2000
+    return year, int(day_string[3:5]), int(day_string[0:2])
+
+
+def _is_fixed_width(value: str) -> bool:
+    """Return whether a timestamp is in the exact fixed-width form."""
+    length = len(value)
+    return (
+        (length == 14 or (length == 17 and value[14] == ":"))
+        and value[2] == "."
+        and value[5] == "."
+        and value[8] == " "
+        and value[11] == ":"
+        and value.replace(".", "").replace(" ", "").replace(":", "").isdigit()
+    )
+
+
+def parse_fritz_datetime(value: str) -> datetime:
+    """Parse a FRITZ!Box timestamp, with or without seconds.
+
+    Raises ValueError for anything that is not a valid timestamp in one of
+    the two formats.
+    """
+    if not _is_fixed_width(value):
+        return datetime.strptime(
+            value,
+            FRITZ_DATETIME_SECONDS_FORMAT
+            if value.count(":") == 2
+            else FRITZ_DATETIME_FORMAT,
+        )
+    year, month, day = _parse_day(value[:8])
+    return datetime(
+        year,
+        month,
+        day,
+        int(value[9:11]),
+        int(value[12:14]),
+        int(value[15:17]) if len(value) == 17 else 0,
+    )
+
+
+def format_fritz_datetime(value: datetime) -> str:
+    """Format a datetime as minute-precision FRITZ!Box timestamp."""
+    return (
+        f"{value.day:02d}.{value.month:02d}.{value.year % 100:02d}"
+        f" {value.hour:02d}:{value.minute:02d}"
+    )
@@ -0,0 +1,31 @@
+"""Diagnostics support for FRITZ!Box Anrufe.
+
+Only runtime statistics that can't be seen anywhere else - no credentials
+and no phonebook/call data, so a dump can be attached to a GitHub issue
+as-is.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from . import FritzBoxCallMonitorConfigEntry
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, config_entry: FritzBoxCallMonitorConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    tam_coordinator = config_entry.runtime_data.tam_coordinator
+    recording_downloads: dict[str, Any] | None = None
+    if tam_coordinator is not None:
+        recording_downloads = {
+            "sid_cache_hits": tam_coordinator.sid_cache_hits,
+            "sid_cache_misses": tam_coordinator.sid_cache_misses,
+        }
+    return {
+        "options": dict(config_entry.options),
+        "recording_downloads": recording_downloads,
+    }
@@ -1,4 +1,4 @@
-"""Authenticated proxy view for FRITZ!Box answering-machine (TAM) audio.
+"""Authenticated proxy views for FRITZ!Box answering-machine (TAM) audio.
 
 EXPERIMENTAL - see :mod:`.tam`. The FRITZ!Box audio recording itself
 requires a FRITZ!Box-session-authenticated request (not a Home Assistant
@@ -7,23 +7,130 @@ view fetches the audio bytes server-side, using the FRITZ!Box session the
 integration already opened, and streams them to the browser - the browser
 only ever needs to be authenticated with Home Assistant
 (``requires_auth = True``).
+
+A recording is downloaded from the box straight into the local recording
+cache (see voicemail.py) - at the box's speed, independent of any
+browser - and passed on chunk by chunk as it arrives there, so playback
+starts right away and no recording is ever held in memory as a whole.
+Once cached, it is served as a plain file - with HTTP ``Range`` support,
+so the browser's ``<audio>`` element can seek without downloading it
+again. Contact images from the phonebook are served
+the same way, from a local cache (see :class:`FritzBoxContactImageView`).
 """
 
 from __future__ import annotations
 
 import logging
 
-from aiohttp import web
+from aiohttp import hdrs, web
+from fritzconnection.lib.fritzcall import Call
 from requests.exceptions import RequestException
 
 from homeassistant.components.http import KEY_HASS, HomeAssistantView
 from homeassistant.config_entries import ConfigEntryState
 
-from .const import CALL_MEDIA_URL_BASE, DOMAIN, TAM_MEDIA_URL_BASE
+from .const import (
+    CALL_MEDIA_URL_BASE,
+    CONTACT_IMAGE_URL_BASE,
+    DOMAIN,
+    TAM_MEDIA_URL_BASE,
+)
+from .tam import TamMessage
+from .voicemail import AUDIO_CHUNK_SIZE, FritzTamCoordinator, RecordingDownload
 
 _LOGGER = logging.getLogger(__name__)
 
 
+async def _async_audio_response(
+    request: web.Request,
+    tam_coordinator: FritzTamCoordinator,
+    message: TamMessage | Call,
+) -> web.StreamResponse:
+    """Serve a recording from the cache, or while it is downloaded there.
+
+    Every request for a recording being downloaded follows that one
+    download (see ``FritzTamCoordinator.async_recording``). Raises
+    RequestException if the download can't be started. A download failing
+    midway can no longer be reported by status code - the connection is
+    closed instead (and nothing is cached).
+    """
+    recording = await tam_coordinator.async_recording(message)
+    if not isinstance(recording, RecordingDownload):
+        path, content_type = recording
+        return web.FileResponse(path, headers={hdrs.CONTENT_TYPE: content_type})
+    await recording.async_wait_for(
+        lambda: recording.temp_path is not None or recording.done
+    )
+    return await _async_tail_recording(request, recording)
+
+
+def _cached_response(download: RecordingDownload) -> web.StreamResponse:
+    """Serve the result of a finished download."""
+    if download.path is None:
+        raise download.error or RequestException("Anrufbeantworter-Download abgebrochen")
+    return web.FileResponse(
+        download.path, headers={hdrs.CONTENT_TYPE: download.content_type}
+    )
+
+
+async def _async_tail_recording(
+    request: web.Request, download: RecordingDownload
+) -> web.StreamResponse:
+    """Stream a recording from its growing cache file, up to the end.
+
+    A client slower than the box only falls behind the download - it
+    never holds it up.
+    """
+    hass = request.app[KEY_HASS]
+    if download.temp_path is None:
+        return _cached_response(download)
+    try:
+        file = await hass.async_add_executor_job(download.temp_path.open, "rb")
+    except FileNotFoundError:
+        # Committed (or discarded) in the meantime.
+        await download.async_wait_for(lambda: download.done)
+        return _cached_response(download)
+    try:
+        response = web.StreamResponse(
+            headers={
+                hdrs.CONTENT_TYPE: download.content_type,
+                hdrs.ACCEPT_RANGES: "none",
+            }
+        )
+        if download.content_length is not None:
+            response.content_length = download.content_length
+        await response.prepare(request)
+        offset = 0
+        try:
+            while True:
+                await download.async_wait_for(
+                    lambda: download.size > offset or download.done
+                )
+                if download.size > offset:
+                    chunk = await hass.async_add_executor_job(
+                        file.read, min(download.size - offset, AUDIO_CHUNK_SIZE)
+                    )
+                    if not chunk:
+                        raise RequestException("Zwischengespeicherte Aufnahme unvollständig")
+                    offset += len(chunk)
+                    await response.write(chunk)
+                elif download.error is not None:
+                    raise download.error
+                else:
+                    break
+        except RequestException as ex:
+            _LOGGER.warning("Aufnahme-Download abgebrochen: %s", ex)
+            # Drop the connection, so the browser sees an error instead of
+            # a (seemingly complete) truncated recording.
+            if request.transport is not None:
+                request.transport.close()
+        else:
+            await response.write_eof()
+    finally:
+        await hass.async_add_executor_job(file.close)
+    return response
+
+
 class FritzBoxTamMediaView(HomeAssistantView):
     """Stream one answering-machine message's audio recording."""
 
@@ -33,7 +140,7 @@ class FritzBoxTamMediaView(HomeAssistantView):
 
     async def get(
         self, request: web.Request, entry_id: str, message_id: str
-    ) -> web.Response:
+    ) -> web.StreamResponse:
         """Return the audio bytes for one TAM message, if available."""
         hass = request.app[KEY_HASS]
 
@@ -54,9 +161,7 @@ class FritzBoxTamMediaView(HomeAssistantView):
             return web.Response(status=404)
 
         try:
-            audio_bytes, content_type = await hass.async_add_executor_job(
-                tam_coordinator.fetch_audio, message
-            )
+            return await _async_audio_response(request, tam_coordinator, message)
         except RequestException as ex:
             _LOGGER.warning(
                 "Fehler beim Abrufen der Anrufbeantworter-Nachricht %s: %s",
@@ -65,15 +170,14 @@ class FritzBoxTamMediaView(HomeAssistantView):
             )
             return web.Response(status=502)
 
-        return web.Response(body=audio_bytes, content_type=content_type)
-
 
 class FritzBoxCallMediaView(HomeAssistantView):
     """Stream the recording linked from a call-list entry (since v1.0.3).
 
     EXPERIMENTAL, same caveat as FritzBoxTamMediaView / see tam.py's module
-    docstring: reuses ``FritzTamCoordinator.fetch_audio()`` completely
-    unchanged - it only ever reads a ``.Path`` attribute, and
+    docstring: reuses the answering machine's download path
+    (``FritzTamCoordinator.async_recording()``) completely unchanged - it
+    only ever reads a ``.Path`` attribute, and
     fritzconnection's call-list ``Call`` objects carry a ``Path`` in the
     same "/download.lua?path=..." format as an answering-machine
     ``TamMessage`` (both ultimately point at the same kind of recording
@@ -89,7 +193,7 @@ class FritzBoxCallMediaView(HomeAssistantView):
 
     async def get(
         self, request: web.Request, entry_id: str, call_type: str, call_id: str
-    ) -> web.Response:
+    ) -> web.StreamResponse:
         """Return the audio bytes for one call-list entry's recording, if any."""
         hass = request.app[KEY_HASS]
 
@@ -111,9 +215,7 @@ class FritzBoxCallMediaView(HomeAssistantView):
             return web.Response(status=404)
 
         try:
-            audio_bytes, content_type = await hass.async_add_executor_job(
-                tam_coordinator.fetch_audio, call
-            )
+            return await _async_audio_response(request, tam_coordinator, call)
         except RequestException as ex:
             _LOGGER.warning(
                 "Fehler beim Abrufen der Anruf-Aufnahme %s/%s: %s",
@@ -123,4 +225,44 @@ class FritzBoxCallMediaView(HomeAssistantView):
             )
             return web.Response(status=502)
 
-        return web.Response(body=audio_bytes, content_type=content_type)
+
+class FritzBoxContactImageView(HomeAssistantView):
+    """Serve one cached phonebook contact image.
+
+    Unlike the audio views, nothing is fetched from the box here: images
+    are downloaded once per phonebook change into a local cache (see
+    phonebook.py), and file names are the SHA-256 of the content - so a
+    URL's content never changes and the browser may keep it as long as it
+    likes. Only names the phonebook currently maps an image to are served.
+    """
+
+    url = f"{CONTACT_IMAGE_URL_BASE}/{{entry_id}}/{{file_name}}"
+    name = "api:fritzbox_anrufe:contact_image"
+    requires_auth = True
+
+    async def get(
+        self, request: web.Request, entry_id: str, file_name: str
+    ) -> web.StreamResponse:
+        """Return one contact image from the local cache, if available."""
+        hass = request.app[KEY_HASS]
+
+        entry = hass.config_entries.async_get_entry(entry_id)
+        if (
+            entry is None
+            or entry.domain != DOMAIN
+            or entry.state is not ConfigEntryState.LOADED
+        ):
+            return web.Response(status=404)
+
+        runtime_data = entry.runtime_data
+        if file_name not in runtime_data.phonebook.image_files.values():
+            return web.Response(status=404)
+
+        path = await hass.async_add_executor_job(
+            runtime_data.phonebook_coordinator.image_cache.get, file_name
+        )
+        if path is None:
+            return web.Response(status=404)
+        return web.FileResponse(
+            path, headers={"Cache-Control": "private, max-age=31536000, immutable"}
+        )
@@ -0,0 +1,223 @@
+"""Phone number canonicalization and the phonebook's number lookup index.
+
+The same number reaches this integration in many spellings: the phonebook
+may store ``+49 30 123456``, ``0049 30 123456``, ``030 123456`` or just
+``123456``, while the callmonitor/call list report ``030123456`` or
+``123456`` depending on the line. Every stored and every queried number is
+therefore first brought into E.164 form (``+4930123456``) by
+:func:`canonicalize_number`, using the box's (or the configured) country
+and area code, see :class:`DialingCodes`. Internal numbers and service
+codes (``**610``, ``*21#``) are left exactly as they are.
+
+:class:`NumberIndex` then resolves a queried number in this order:
+
+1. exact match of the canonical form - one dict probe;
+2. the legacy "Präfixe" option (stored ``<prefix><number>``, see
+   :meth:`NumberIndex._lookup_prefixed`) - at most two dict probes;
+3. longest-suffix match on a trie of the reversed digits, for whatever
+   canonicalization could not unify (e.g. the box reports a local number
+   without area code) - O(length of the number). Only stored numbers in
+   E.164 form are in the trie, and only queries that could not be brought
+   into E.164 form are matched against it: a complete ``+`` number is never
+   the tail of another one (``+301234567`` is a Greek number, not the end
+   of ``+49301234567``), and the digits of a number that could not be
+   canonicalized may still include trunk/international prefixes.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import sys
+from typing import Generic, TypeVar
+
+_T = TypeVar("_T")
+
+# Minimum number of trailing digits two numbers must share for a suffix
+# match - keeps short numbers (extensions, emergency numbers) from matching
+# the tail of some unrelated long number.
+MIN_SUFFIX_MATCH_DIGITS = 6
+
+
+def normalize_number(number: str) -> str:
+    """Strip everything but digits, "+", "*" and "#" from a phone number."""
+    return "".join(
+        char for char in number if char.isdecimal() or char in "+*#"
+    )
+
+
+def intern_number(number: str | None) -> str | None:
+    """Return the interned form of a parsed number string.
+
+    The same few numbers recur across hundreds of calls, messages and
+    contacts; interning them at parse time keeps a single string object
+    per distinct number instead of one per record.
+    """
+    return sys.intern(number) if number else number
+
+
+@dataclass(frozen=True, slots=True)
+class DialingCodes:
+    """Dialing codes used to canonicalize numbers, e.g. 49/30/00/0."""
+
+    country_code: str | None = None
+    area_code: str | None = None
+    international_prefix: str = "00"
+    national_prefix: str = "0"
+
+
+def canonicalize_number(number: str, codes: DialingCodes) -> str:
+    """Return the E.164 form of a number, or its normalized form if unknown."""
+    number = normalize_number(str(number))
+    if not number.removeprefix("+").isdecimal():
+        # Internal numbers/service codes ("**610", "*21#") and garbage.
+        return number
+    if number.startswith("+") or not codes.country_code:
+        return number
+    if codes.international_prefix and number.startswith(codes.international_prefix):
+        return "+" + number[len(codes.international_prefix) :]
+    if codes.national_prefix and number.startswith(codes.national_prefix):
+        return f"+{codes.country_code}{number[len(codes.national_prefix) :]}"
+    if codes.area_code:
+        return f"+{codes.country_code}{codes.area_code}{number}"
+    return number
+
+
+class _AmbiguousType:
+    """Marker for a trie subtree holding numbers of several entries."""
+
+
+_AMBIGUOUS = _AmbiguousType()
+
+
+class _TrieNode(Generic[_T]):
+    """One digit of the reversed-number trie."""
+
+    __slots__ = ("children", "subtree", "value")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _TrieNode[_T]] = {}
+        # The entry of the number ending exactly here, if any.
+        self.value: _T | None = None
+        # The single entry all numbers below this node belong to, or
+        # _AMBIGUOUS if they belong to more than one.
+        self.subtree: _T | _AmbiguousType | None = None
+
+
+class NumberIndex(Generic[_T]):
+    """Lookup index of phone numbers; entries added first win on conflicts."""
+
+    def __init__(
+        self, codes: DialingCodes, prefixes: list[str] | None = None
+    ) -> None:
+        """Initialize an empty index."""
+        self._codes = codes
+        self._prefixes = prefixes or []
+        self._exact: dict[str, _T] = {}
+        # "rest" -> (position of the prefix, entry) for every stored number
+        # that reads "<configured prefix><rest>".
+        self._prefixed: dict[str, tuple[int, _T]] = {}
+        self._suffix_trie: _TrieNode[_T] = _TrieNode()
+
+    def __len__(self) -> int:
+        """Return the number of distinct canonical numbers."""
+        return len(self._exact)
+
+    def add(self, number: str, entry: _T) -> None:
+        """Add one stored number of an entry."""
+        canonical = canonicalize_number(number, self._codes)
+        if not canonical:
+            return
+        self._exact.setdefault(canonical, entry)
+
+        normalized = normalize_number(number)
+        for position, prefix in enumerate(self._prefixes):
+            if not normalized.startswith(prefix):
+                continue
+            rest = normalized[len(prefix) :]
+            known = self._prefixed.get(rest)
+            if known is None or known[0] > position:
+                self._prefixed[rest] = (position, entry)
+
+        if not canonical.startswith("+") or not canonical[1:].isdecimal():
+            return
+        digits = canonical[1:]
+        node = self._suffix_trie
+        for digit in reversed(digits):
+            node = node.children.setdefault(digit, _TrieNode())
+            if node.subtree is None:
+                node.subtree = entry
+            elif node.subtree is not entry:
+                node.subtree = _AMBIGUOUS
+        if node.value is None:
+            node.value = entry
+
+    def lookup(self, number: str) -> _T | None:
+        """Return the entry for a queried number, None if there is none.
+
+        >>> index = NumberIndex(DialingCodes("49"))
+        >>> index.add("+49 30 1234567", "Berlin")
+        >>> index.add("+44 20 7946 0958", "London")
+        >>> index.lookup("1234567")  # local number, area code unknown
+        'Berlin'
+        >>> index.lookup("+301234567") is None  # Greece, not Berlin
+        True
+        >>> index.lookup("+2079460958") is None
+        True
+
+        Without dialing codes, stored numbers keep their prefixes and are
+        only found by exact (or "Präfixe") match:
+
+        >>> index = NumberIndex(DialingCodes())
+        >>> index.add("030123456", "A")
+        >>> index.add("0123456", "B")
+        >>> index.lookup("+4930123456") is None
+        True
+        >>> index.lookup("030123456")
+        'A'
+        """
+        canonical = canonicalize_number(number, self._codes)
+        if (entry := self._exact.get(canonical)) is not None:
+            return entry
+        if (entry := self._lookup_prefixed(normalize_number(str(number)))) is not None:
+            return entry
+        if canonical.startswith("+"):
+            return None
+        return self._lookup_suffix(canonical)
+
+    def _lookup_prefixed(self, number: str) -> _T | None:
+        """Match "<prefix><number>" or "<prefix><number without leading 0>".
+
+        First configured prefix wins; for the same prefix, the number as-is
+        wins over its zero-stripped variant.
+        """
+        if not self._prefixed:
+            return None
+        as_is = self._prefixed.get(number)
+        stripped = self._prefixed.get(number.lstrip("0"))
+        if stripped is None or (as_is is not None and as_is[0] <= stripped[0]):
+            return as_is[1] if as_is is not None else None
+        return stripped[1]
+
+    def _lookup_suffix(self, digits: str) -> _T | None:
+        """Longest-suffix match of a digit string against the stored numbers.
+
+        Either a stored number is a suffix of the queried one (the longest
+        such number wins), or the queried number is a suffix of stored
+        numbers that all belong to the same entry - in both cases with at
+        least MIN_SUFFIX_MATCH_DIGITS shared digits. Numbers that merely
+        share some trailing digits and then differ never match.
+        """
+        if len(digits) < MIN_SUFFIX_MATCH_DIGITS or not digits.isdecimal():
+            return None
+        node = self._suffix_trie
+        best: _T | None = None
+        for depth, digit in enumerate(reversed(digits), start=1):
+            if (child := node.children.get(digit)) is None:
+                return best
+            node = child
+            if node.value is not None and depth >= MIN_SUFFIX_MATCH_DIGITS:
+                best = node.value
+        # The whole queried number is a suffix of the stored one(s).
+        if node.subtree is not None and not isinstance(node.subtree, _AmbiguousType):
+            return node.subtree
+        return best
@@ -0,0 +1,112 @@
+"""Flat, table-friendly dict representations of calls and TAM messages.
+
+Shared by the call-list/answering-machine sensors (their ``calls``/
+``messages`` attributes, see ``sensor.py``) and the paged websocket API
+(``websocket_api.py``), so both always deliver exactly the same row format
+to the dashboard card.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Any
+
+from fritzconnection.lib.fritzcall import Call
+
+from .base import Contact, FritzBoxPhonebook
+from .const import (
+    CALL_MEDIA_URL_BASE,
+    CALL_TYPE_OUTGOING,
+    CONTACT_IMAGE_URL_BASE,
+    TAM_MEDIA_URL_BASE,
+)
+from .tam import TamMessage
+
+
+def contact_image_url(
+    contact: Contact | None, phonebook: FritzBoxPhonebook, config_entry_id: str
+) -> str | None:
+    """Return the URL of a contact's cached image, None if there is none."""
+    if contact is None or not contact.image_url:
+        return None
+    file_name = phonebook.image_files.get(contact.image_url)
+    if file_name is None:
+        return None
+    return f"{CONTACT_IMAGE_URL_BASE}/{config_entry_id}/{file_name}"
+
+
+def call_to_dict(
+    call: Call,
+    call_type: str,
+    phonebook: FritzBoxPhonebook,
+    config_entry_id: str,
+) -> dict[str, Any]:
+    """Convert one Call instance into a flat, table-friendly dict."""
+    is_outgoing = call_type == CALL_TYPE_OUTGOING
+    external_number = call.Called if is_outgoing else call.Caller
+    own_number = call.Caller if is_outgoing else call.Called
+
+    contact = None
+    if external_number:
+        contact = phonebook.get_contact(external_number)
+
+    duration = call.duration
+    # "outcome" and "tam_message" are set by
+    # FritzCallLogCoordinator._fetch_calls() (see
+    # call_log.py:_classify_call/_find_matching_tam_message) as dynamic
+    # attributes directly on the Call instance. "outcome" is used by the
+    # dashboard card's optional "Weiterverarbeitung" row (since v1.0.3)
+    # to pick an icon/action. For media_url, a confidently matched
+    # tam_message is preferred - it points at the TAM sensor's own,
+    # already real-hardware-confirmed media proxy (see http.py:
+    # FritzBoxTamMediaView) instead of the newer, unconfirmed call-list
+    # one; call.Path alone is only used as a fallback when no match was
+    # found (e.g. the TAM coordinator hasn't polled yet).
+    outcome = getattr(call, "outcome", None)
+    tam_message = getattr(call, "tam_message", None)
+    media_url = None
+    if tam_message is not None and tam_message.Path:
+        media_url = f"{TAM_MEDIA_URL_BASE}/{config_entry_id}/{tam_message.Index}"
+    elif call.Path:
+        media_url = f"{CALL_MEDIA_URL_BASE}/{config_entry_id}/{call_type}/{call.id}"
+    return {
+        "type": call_type,
+        "date": call.date.isoformat() if isinstance(call.date, datetime) else None,
+        "name": call.Name or (contact.name if contact else None),
+        "number": external_number or None,
+        "own_number": own_number or None,
+        "device": call.Device or None,
+        "duration": str(duration) if isinstance(duration, timedelta) else None,
+        "vip": contact.vip if contact else False,
+        "image_url": contact_image_url(contact, phonebook, config_entry_id),
+        "outcome": outcome,
+        "media_url": media_url,
+    }
+
+
+def message_to_dict(
+    message: TamMessage,
+    phonebook: FritzBoxPhonebook,
+    config_entry_id: str,
+) -> dict[str, Any]:
+    """Convert one TamMessage instance into a flat, table-friendly dict."""
+    contact = None
+    if message.Number:
+        contact = phonebook.get_contact(message.Number)
+
+    duration = message.duration
+    media_url = (
+        f"{TAM_MEDIA_URL_BASE}/{config_entry_id}/{message.Index}"
+        if message.Path
+        else None
+    )
+    return {
+        "name": message.Name or (contact.name if contact else None),
+        "number": message.Number or None,
+        "date": message.date.isoformat() if isinstance(message.date, datetime) else None,
+        "duration": str(duration) if isinstance(duration, timedelta) else None,
+        "new": bool(message.new),
+        "vip": contact.vip if contact else False,
+        "image_url": contact_image_url(contact, phonebook, config_entry_id),
+        "media_url": media_url,
+    }
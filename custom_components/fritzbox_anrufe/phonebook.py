@@ -0,0 +1,199 @@
+"""Coordinator keeping the phonebook contact index up to date.
+
+Replaces the former synchronous, throttled ``update_phonebook()`` run from
+the live sensor's entity poll: checking/downloading the phonebook(s) is a
+blocking TR-064 round trip per book, which used to occupy an executor
+worker on behalf of the live call sensor. Now the books are checked here,
+in parallel executor jobs, and the rebuilt index is swapped into the
+shared :class:`~.base.FritzBoxPhonebook` atomically (see
+``FritzBoxPhonebook.rebuild_index``) - callmonitor events and sensor state
+writes never wait for a phonebook refresh.
+
+Contact images are fetched here as well, into a size-bounded on-disk cache
+(see ``cache.py``) the dashboard loads them from via
+``http.py:FritzBoxContactImageView`` - rendering a row never hits the box.
+Which image URL is stored in which cache file is kept under ``.storage``,
+so after a phonebook change or a restart only images with a new URL (or
+whose file was evicted) are downloaded.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+import logging
+from typing import Any
+from xml.etree.ElementTree import ParseError
+
+from fritzconnection.core.exceptions import FritzConnectionException
+from requests.exceptions import RequestException
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .base import FritzBoxPhonebook
+from .cache import DiskCache, entry_cache_dir
+from .const import (
+    CONTACT_IMAGE_CACHE_MAX_BYTES,
+    CONTACT_IMAGES_STORAGE_VERSION,
+    DOMAIN,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# How often the phonebook(s) are checked for changes. A check is cheap (see
+# FritzBoxPhonebook.download_contacts): a book is only transferred in full
+# and re-indexed when its timestamp on the box changed.
+PHONEBOOK_UPDATE_INTERVAL = timedelta(minutes=5)
+
+
+def contact_image_cache(hass: HomeAssistant, entry_id: str) -> DiskCache:
+    """Return the contact image cache of a config entry."""
+    return DiskCache(
+        entry_cache_dir(hass, entry_id, "contact_images"),
+        CONTACT_IMAGE_CACHE_MAX_BYTES,
+    )
+
+
+def _contact_images_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    """Return the Store of a config entry's image URL -> cache file mapping."""
+    return Store(
+        hass, CONTACT_IMAGES_STORAGE_VERSION, f"{DOMAIN}.{entry_id}.contact_images"
+    )
+
+
+async def async_remove_contact_images(hass: HomeAssistant, entry_id: str) -> None:
+    """Delete the image mapping of a removed config entry."""
+    await _contact_images_store(hass, entry_id).async_remove()
+
+
+class FritzPhonebookCoordinator(DataUpdateCoordinator[int]):
+    """Coordinator that refreshes the shared phonebook index.
+
+    Its data is the phonebook's revision, so listeners (the call-list and
+    answering-machine sensors) are told whenever names/VIP flags/contact
+    images may have changed and can re-render their rows right away.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        phonebook: FritzBoxPhonebook,
+    ) -> None:
+        """Initialize the phonebook coordinator."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name="fritzbox_anrufe phonebook",
+            update_interval=PHONEBOOK_UPDATE_INTERVAL,
+        )
+        self.config_entry = config_entry
+        self.phonebook = phonebook
+        self.image_cache = contact_image_cache(hass, config_entry.entry_id)
+        self._image_store = _contact_images_store(hass, config_entry.entry_id)
+        self._image_task: asyncio.Task[None] | None = None
+
+    async def async_load_image_files(self) -> None:
+        """Load the image mapping saved by the last run (before 1st load)."""
+        try:
+            stored = await self._image_store.async_load()
+        except Exception as ex:  # noqa: BLE001 - images are just fetched again
+            _LOGGER.debug("Could not load the contact image mapping: %s", ex)
+            return
+        if stored:
+            self.phonebook.image_files = dict(stored.get("image_files", {}))
+
+    async def async_load_phonebooks(self) -> int:
+        """Check all phonebooks in parallel and re-index if any changed.
+
+        Raises the underlying fritzconnection/requests exceptions as-is -
+        see _async_update_data() for the coordinator-managed variant.
+        """
+        phonebook = self.phonebook
+        phonebook_ids = phonebook.loaded_phonebook_ids
+        changed = await asyncio.gather(
+            *(
+                self.hass.async_add_executor_job(phonebook.download_contacts, phonebook_id)
+                for phonebook_id in phonebook_ids
+            )
+        )
+        if any(changed):
+            self._async_cancel_image_task()
+            await self.hass.async_add_executor_job(phonebook.rebuild_index)
+            self._image_task = self.config_entry.async_create_background_task(
+                self.hass,
+                self._async_cache_contact_images(),
+                "fritzbox_anrufe contact images",
+            )
+        else:
+            _LOGGER.debug("Fritz!Box phone book(s) %s unchanged", phonebook_ids)
+        return phonebook.revision
+
+    async def _async_update_data(self) -> int:
+        """Check the phonebook(s) for changes."""
+        try:
+            return await self.async_load_phonebooks()
+        except (FritzConnectionException, RequestException, ParseError) as ex:
+            raise UpdateFailed(f"Fehler beim Aktualisieren des Telefonbuchs: {ex}") from ex
+
+    @callback
+    def _async_cancel_image_task(self) -> None:
+        """Stop fetching the images of an outdated phonebook state."""
+        if self._image_task is not None and not self._image_task.done():
+            self._image_task.cancel()
+        self._image_task = None
+
+    async def _async_cache_contact_images(self) -> None:
+        """Bring the cached contact images in line with the (re)loaded books.
+
+        Only images whose URL isn't cached yet (or whose file was evicted)
+        are downloaded - one after the other, a background job not worth
+        loading the box with parallel requests; URLs no contact uses any
+        more are dropped from the mapping (their files age out of the
+        cache). An image that fails to download keeps its previously
+        cached file, if any. If anything changed, the mapping is saved and
+        the phonebook revision is bumped so the sensors pick up the new
+        image URLs.
+        """
+        phonebook = self.phonebook
+        cached = await self.hass.async_add_executor_job(
+            self._cached_image_files, dict(phonebook.image_files)
+        )
+        image_files: dict[str, str] = {}
+        for contact in phonebook.contacts:
+            image_url = contact.image_url
+            if not image_url or image_url in image_files:
+                continue
+            if (file_name := cached.get(image_url)) is not None:
+                image_files[image_url] = file_name
+                continue
+            try:
+                data, content_type = await self.hass.async_add_executor_job(
+                    phonebook.fetch_contact_image, contact
+                )
+                image_files[image_url] = await self.hass.async_add_executor_job(
+                    self.image_cache.put_content, data, content_type
+                )
+            except (RequestException, OSError) as ex:
+                _LOGGER.debug("Could not cache contact image %s: %s", image_url, ex)
+                if (known := phonebook.image_files.get(image_url)) is not None:
+                    image_files[image_url] = known
+        self._image_task = None
+        if image_files == phonebook.image_files:
+            return
+        _LOGGER.debug("Cached %d contact image(s)", len(image_files))
+        phonebook.image_files = image_files
+        phonebook.revision += 1
+        self.async_set_updated_data(phonebook.revision)
+        await self._image_store.async_save({"image_files": image_files})
+
+    def _cached_image_files(self, image_files: dict[str, str]) -> dict[str, str]:
+        """Return the part of a mapping whose files are still cached. BLOCKING."""
+        return {
+            image_url: file_name
+            for image_url, file_name in image_files.items()
+            if self.image_cache.get(file_name) is not None
+        }
@@ -0,0 +1,83 @@
+"""Call-driven refresh scheduling for the call-list and TAM coordinators.
+
+Both coordinators poll the FRITZ!Box on a fixed base interval
+(CALL_LOG_UPDATE_INTERVAL/TAM_UPDATE_INTERVAL), but what they show only
+ever changes when a call ends. So instead of one extra refresh per finished
+call on top of a fixed poll, refreshes are driven by the live call
+monitor's DISCONNECT events (see :class:`PostCallRefreshScheduler`), and
+the regular poll only remains as a fallback that backs off while the line
+is quiet:
+
+- Post-call refresh requests go through each coordinator's
+  ``request_refresh_debouncer`` (see :func:`post_call_debouncer`): the
+  first request starts a window of POST_CALL_REFRESH_DELAY_SECONDS, every
+  further request inside it is coalesced into the one refresh at its end,
+  and at most one refresh per window ever reaches the box - a burst of
+  back-to-back calls costs one download, not one per call. The delay also
+  gives the box time to finalize the new call-list entry/recording.
+- Every regular poll that brought no change doubles the coordinator's
+  ``update_interval`` (see :func:`adapt_update_interval`), up to
+  IDLE_UPDATE_INTERVAL_MAX; a poll with changes, or a finished call, resets
+  it to the base interval.
+"""
+
+from __future__ import annotations
+
+from datetime import timedelta
+import logging
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from .const import IDLE_UPDATE_INTERVAL_MAX, POST_CALL_REFRESH_DELAY_SECONDS
+
+
+def post_call_debouncer(hass: HomeAssistant, logger: logging.Logger) -> Debouncer:
+    """Return the coalescing, rate-capping refresh debouncer for a coordinator."""
+    return Debouncer(
+        hass,
+        logger,
+        cooldown=POST_CALL_REFRESH_DELAY_SECONDS,
+        immediate=False,
+    )
+
+
+def adapt_update_interval(
+    coordinator: DataUpdateCoordinator, base_interval: timedelta, changed: bool
+) -> None:
+    """Back the idle poll off after an unchanged refresh, reset it otherwise."""
+    current = coordinator.update_interval or base_interval
+    if changed:
+        new_interval = base_interval
+    else:
+        new_interval = min(current * 2, max(IDLE_UPDATE_INTERVAL_MAX, base_interval))
+    if new_interval != current:
+        coordinator.logger.debug(
+            "%s: Abfrageintervall %s -> %s", coordinator.name, current, new_interval
+        )
+    coordinator.update_interval = new_interval
+
+
+class PostCallRefreshScheduler:
+    """Turn finished calls into (debounced) coordinator refreshes."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        coordinators: list[tuple[DataUpdateCoordinator, timedelta]],
+    ) -> None:
+        """Initialize with (coordinator, base update interval) pairs."""
+        self._hass = hass
+        self._coordinators = coordinators
+
+    @callback
+    def async_call_ended(self) -> None:
+        """Handle a callmonitor DISCONNECT - event loop only.
+
+        Resets every coordinator to its base poll interval (the line is
+        evidently not quiet) and requests a refresh through its debouncer.
+        """
+        for coordinator, base_interval in self._coordinators:
+            coordinator.update_interval = base_interval
+            self._hass.async_create_task(coordinator.async_request_refresh())
@@ -1,12 +1,12 @@
 """Sensor to monitor incoming/outgoing phone calls on a Fritz!Box router."""
 
-from collections.abc import Mapping
-from datetime import datetime, timedelta
+import asyncio
+from collections.abc import Callable, Mapping
 from enum import StrEnum
 import logging
 import queue
-from threading import Event as ThreadingEvent, Thread
-from time import sleep
+import socket
+from threading import Event as ThreadingEvent, Thread, get_ident
 from typing import Any, cast, override
 
 from fritzconnection.core.fritzmonitor import FritzMonitor
@@ -17,36 +17,37 @@ from homeassistant.const import CONF_HOST, CONF_PORT, EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
-from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import FritzBoxCallMonitorConfigEntry, FritzBoxRuntimeData
 from .base import Contact, FritzBoxPhonebook
-from .call_log import FritzCallLogCoordinator
+from .call_log import CALL_LOG_UPDATE_INTERVAL, CallRecord, FritzCallLogCoordinator
 from .const import (
     ATTR_PREFIXES,
-    CALL_MEDIA_URL_BASE,
+    CALLMONITOR_RECONNECT_DELAY_MAX,
+    CALLMONITOR_RECONNECT_DELAY_MIN,
     CALL_OUTCOME_NOT_CONNECTED,
     CALL_TYPE_LIVE,
-    CALL_TYPE_OUTGOING,
     CALL_TYPE_VOICEMAIL,
     CALL_TYPES,
+    CONF_ASYNC_CALLMONITOR,
     CONF_PHONEBOOK,
     CONF_PREFIXES,
+    DEFAULT_ASYNC_CALLMONITOR,
     DOMAIN,
     MANUFACTURER,
-    POST_CALL_REFRESH_DELAY_SECONDS,
     SERIAL_NUMBER,
-    TAM_MEDIA_URL_BASE,
     FritzState,
 )
-from .tam import TamMessage
-from .voicemail import FritzTamCoordinator
+from .dates import format_fritz_datetime, parse_fritz_datetime
+from .payload import call_to_dict, message_to_dict
+from .phonebook import FritzPhonebookCoordinator
+from .refresh import PostCallRefreshScheduler
+from .tam import TamMessage, message_list_fingerprint
+from .voicemail import TAM_UPDATE_INTERVAL, FritzTamCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
-SCAN_INTERVAL = timedelta(hours=3)
-
 
 class CallState(StrEnum):
     """Fritz sensor call states."""
@@ -57,6 +58,22 @@ class CallState(StrEnum):
     IDLE = "idle"
 
 
+# Which state the live sensor shows while several lines are active at once:
+# the most "engaged" one wins (talking > ringing > dialing > idle).
+_CALL_STATE_PRIORITY: dict[CallState, int] = {
+    CallState.IDLE: 0,
+    CallState.DIALING: 1,
+    CallState.RINGING: 2,
+    CallState.TALKING: 3,
+}
+
+ATTR_ACTIVE_CALLS = "active_calls"
+
+# Put into the threaded reader's event queue (in line with the events) by
+# _ReconnectingFritzMonitor whenever it got its connection back.
+_RECONNECTED = "reconnected"
+
+
 def _build_device_info(fritzbox_phonebook: FritzBoxPhonebook, unique_id: str) -> DeviceInfo:
     """Build the shared device info for all sensors of one FRITZ!Box account."""
     return DeviceInfo(
@@ -77,6 +94,7 @@ async def async_setup_entry(
     """Set up the fritzbox_anrufe sensors from config_entry."""
     runtime_data: FritzBoxRuntimeData = config_entry.runtime_data
     fritzbox_phonebook = runtime_data.phonebook
+    phonebook_coordinator = runtime_data.phonebook_coordinator
     call_log_coordinator = runtime_data.call_log_coordinator
     tam_coordinator = runtime_data.tam_coordinator
 
@@ -99,6 +117,9 @@ async def async_setup_entry(
         device_info=device_info,
         call_log_coordinator=call_log_coordinator,
         tam_coordinator=tam_coordinator,
+        use_async_callmonitor=config_entry.options.get(
+            CONF_ASYNC_CALLMONITOR, DEFAULT_ASYNC_CALLMONITOR
+        ),
     )
 
     call_list_sensors = [
@@ -108,6 +129,7 @@ async def async_setup_entry(
             unique_id=f"{unique_id}-{call_type}",
             phonebook_name=config_entry.title,
             fritzbox_phonebook=fritzbox_phonebook,
+            phonebook_coordinator=phonebook_coordinator,
             device_info=device_info,
             config_entry_id=config_entry.entry_id,
         )
@@ -127,6 +149,7 @@ async def async_setup_entry(
                 unique_id=f"{unique_id}-{CALL_TYPE_VOICEMAIL}",
                 phonebook_name=config_entry.title,
                 fritzbox_phonebook=fritzbox_phonebook,
+                phonebook_coordinator=phonebook_coordinator,
                 device_info=device_info,
                 config_entry_id=config_entry.entry_id,
             )
@@ -142,6 +165,9 @@ class FritzBoxCallSensor(SensorEntity):
     _attr_translation_key = f"{DOMAIN}_{CALL_TYPE_LIVE}"
     _attr_device_class = SensorDeviceClass.ENUM
     _attr_options = list(CallState)
+    # Pushed by the callmonitor; the phonebook it resolves numbers with is
+    # kept up to date by FritzPhonebookCoordinator (see phonebook.py).
+    _attr_should_poll = False
 
     def __init__(
         self,
@@ -154,19 +180,31 @@ class FritzBoxCallSensor(SensorEntity):
         device_info: DeviceInfo,
         call_log_coordinator: FritzCallLogCoordinator,
         tam_coordinator: FritzTamCoordinator | None,
+        use_async_callmonitor: bool = DEFAULT_ASYNC_CALLMONITOR,
     ) -> None:
         """Initialize the sensor."""
         self._fritzbox_phonebook = fritzbox_phonebook
         self._prefixes = prefixes
         self._host = host
         self._port = port
+        self._use_async_callmonitor = use_async_callmonitor
         self._monitor: FritzBoxCallMonitor | None = None
-        self._attributes: dict[str, str | list[str] | bool] = {}
-        # Used by _schedule_post_call_refresh() (since v1.0.3, see its
-        # docstring) to trigger an extra call-list/AB refresh shortly after
-        # a call ends, on top of both coordinators' regular 5-minute polling.
+        self._attributes: dict[str, str | bool] = {}
+        # One entry per currently active callmonitor ConnectionID (see
+        # _async_apply_event) - the sensor state is aggregated over these,
+        # so parallel calls on several lines/MSNs don't overwrite each other.
+        self._active_calls: dict[str, dict[str, str | bool]] = {}
+        # Used by call_ended() (since v1.0.3, see its docstring) to refresh
+        # the call-list/AB coordinators shortly after each call ends - their
+        # own regular polling is only a fallback that backs off while the
+        # line is quiet (see refresh.py).
         self._call_log_coordinator = call_log_coordinator
-        self._tam_coordinator = tam_coordinator
+        refresh_targets = [(call_log_coordinator, CALL_LOG_UPDATE_INTERVAL)]
+        if tam_coordinator is not None:
+            refresh_targets.append((tam_coordinator, TAM_UPDATE_INTERVAL))
+        self._refresh_scheduler = PostCallRefreshScheduler(
+            call_log_coordinator.hass, refresh_targets
+        )
 
         self._attr_translation_placeholders = {"phonebook_name": phonebook_name}
         self._attr_unique_id = unique_id
@@ -177,6 +215,15 @@ class FritzBoxCallSensor(SensorEntity):
     async def async_added_to_hass(self) -> None:
         """Connect to FRITZ!Box to monitor its call state."""
         await super().async_added_to_hass()
+        if self._use_async_callmonitor:
+            _LOGGER.debug("Starting asyncio monitor for: %s", self.entity_id)
+            monitor = AsyncFritzBoxCallMonitor(
+                self.hass, host=self._host, port=self._port, sensor=self
+            )
+            self._monitor = monitor
+            monitor.async_start()
+            self.async_on_remove(monitor.async_stop)
+            return
         await self.hass.async_add_executor_job(self._start_call_monitor)
         self.async_on_remove(
             self.hass.bus.async_listen_once(
@@ -213,55 +260,120 @@ class FritzBoxCallSensor(SensorEntity):
             self._monitor.connection.stop()
             _LOGGER.debug("Stopped monitor for: %s", self.entity_id)
 
-    def set_state(self, state: CallState) -> None:
-        """Set the state; also triggers a post-call refresh (see below)."""
-        previous_state = self._attr_native_value
-        self._attr_native_value = state
-        # Any transition back to idle after a non-idle state means a call
-        # just ended - whether it was actually answered (RINGING/DIALING ->
-        # TALKING -> IDLE) or missed (RINGING -> IDLE with no TALKING in
-        # between). Either way, the call-list/AB coordinators' data is now
-        # stale until their next regular 5-minute poll - refresh them early
-        # instead of waiting.
-        if state == CallState.IDLE and previous_state != CallState.IDLE:
-            self._schedule_post_call_refresh()
-
-    def _schedule_post_call_refresh(self) -> None:
-        """Schedule an extra coordinator refresh shortly after a call ends.
-
-        This runs on FritzBoxCallMonitor's background thread (see
-        _process_events/_parse below), NOT the Home Assistant event loop -
-        same constraint as schedule_update_ha_state(), which uses the same
-        call_soon_threadsafe hand-off. A short delay
-        (POST_CALL_REFRESH_DELAY_SECONDS, see const.py) gives the FRITZ!Box
-        a moment to finalize the new call-list entry and, if applicable,
-        process a freshly recorded answering-machine message before this
-        integration asks for it - polling immediately on disconnect risked
-        a race where the entry (or the TAM message used to match it, see
-        call_log.py:_find_matching_tam_message) wasn't there yet.
+    def _run_on_loop(self, target: Callable[..., None], *args: Any) -> None:
+        """Run an event-loop callback from the callmonitor, on any thread.
+
+        FritzBoxCallMonitor calls in from its background thread and needs the
+        call_soon_threadsafe hand-off; AsyncFritzBoxCallMonitor already runs
+        on the loop, where the callback is simply invoked right away.
         """
         if self.hass is None:
             return
-        self.hass.loop.call_soon_threadsafe(self._async_schedule_post_call_refresh)
+        if self.hass.loop_thread_id == get_ident():
+            target(*args)
+        else:
+            self.hass.loop.call_soon_threadsafe(target, *args)
+
+    def publish_event(
+        self,
+        connection_id: str,
+        state: CallState,
+        attributes: Mapping[str, str | bool],
+    ) -> None:
+        """Hand one parsed callmonitor event over to the event loop.
+
+        Called by the callmonitor for every event, without any throttling.
+        state and attributes are passed along as a snapshot (instead of
+        being set on the entity here and read back by a later
+        schedule_update_ha_state()), so a quick RING -> DISCONNECT still
+        produces both state writes in order, no matter how far the loop is
+        behind - see _async_apply_event() for the write side.
+        """
+        self._run_on_loop(
+            self._async_apply_event, connection_id, state, dict(attributes)
+        )
 
     @callback
-    def _async_schedule_post_call_refresh(self) -> None:
-        """Event-loop-side half of _schedule_post_call_refresh()."""
-        async_call_later(
-            self.hass, POST_CALL_REFRESH_DELAY_SECONDS, self._async_refresh_after_call
+    def _async_apply_event(
+        self,
+        connection_id: str,
+        state: CallState,
+        attributes: dict[str, str | bool],
+    ) -> None:
+        """Event-loop-side half of publish_event(): write the new state.
+
+        Each event updates its own ConnectionID's entry in the active-call
+        table (RING/CALL open it, CONNECT adds to it, DISCONNECT closes it);
+        the sensor state is the highest-priority state over all still
+        active calls (see _CALL_STATE_PRIORITY), idle once none are left.
+        The flat legacy attributes keep describing the most recent event,
+        as before. Writes that would not change anything (e.g. a repeated
+        event for the same call) are coalesced away here instead of being
+        throttled on the reader side.
+        """
+        active_calls = dict(self._active_calls)
+        if state == CallState.IDLE:
+            active_calls.pop(connection_id, None)
+        else:
+            active_calls[connection_id] = {
+                **active_calls.get(connection_id, {}),
+                **attributes,
+                "state": state,
+            }
+        aggregate_state = max(
+            (cast(CallState, call["state"]) for call in active_calls.values()),
+            key=_CALL_STATE_PRIORITY.__getitem__,
+            default=CallState.IDLE,
         )
+        if (
+            aggregate_state == self._attr_native_value
+            and attributes == self._attributes
+            and active_calls == self._active_calls
+        ):
+            return
+        self._attr_native_value = aggregate_state
+        self._attributes = attributes
+        self._active_calls = active_calls
+        self.async_write_ha_state()
+
+    def connection_reset(self) -> None:
+        """Forget all active calls after the callmonitor (re)connected.
+
+        Events for calls that ended while the connection was down are lost
+        for good - without this, such a call would stay in the active-call
+        table (and keep the sensor "talking") until its ConnectionID
+        happens to be reused. Same threading as publish_event().
+        """
+        self._run_on_loop(self._async_reset_active_calls)
 
-    async def _async_refresh_after_call(self, _now: Any = None) -> None:
-        """Refresh the call-list coordinator, and the AB one if present."""
-        await self._call_log_coordinator.async_request_refresh()
-        if self._tam_coordinator is not None:
-            await self._tam_coordinator.async_request_refresh()
+    @callback
+    def _async_reset_active_calls(self) -> None:
+        """Event-loop-side half of connection_reset()."""
+        if not self._active_calls and self._attr_native_value == CallState.IDLE:
+            return
+        self._active_calls = {}
+        self._attr_native_value = CallState.IDLE
+        self.async_write_ha_state()
+
+    def call_ended(self) -> None:
+        """Request the post-call coordinator refresh for a DISCONNECT.
+
+        With the default FritzBoxCallMonitor this runs on its background
+        thread (see _process_events/_parse below), NOT the Home Assistant
+        event loop - same constraint, and the same hand-off, as
+        publish_event() above. Every DISCONNECT counts - answered
+        and missed calls alike - and is handed to the
+        PostCallRefreshScheduler (see refresh.py), which coalesces it with
+        any other call ending shortly before/after into a single, delayed
+        refresh per coordinator.
+        """
+        self._run_on_loop(self._refresh_scheduler.async_call_ended)
 
     def record_failed_outgoing_call(self, pending: Mapping[str, str]) -> None:
         """Build and hand off a synthetic Call for a failed outgoing dial.
 
         Called by FritzBoxCallMonitor._parse() (same background thread as
-        set_state()/_schedule_post_call_refresh() above) when a DISCONNECT
+        publish_event()/call_ended() above) when a DISCONNECT
         arrives for a ConnectionID that reached CALL (dialing) but never
         CONNECT (talking) - i.e. an outgoing call that was busy, unanswered,
         or cancelled before pickup. Per Thorsten (confirmed on his own
@@ -271,10 +383,10 @@ class FritzBoxCallSensor(SensorEntity):
         established. add_synthetic_outgoing_call() itself is a plain,
         lock-protected append, safe to call directly from this thread - see
         call_log.py for how it's merged into the "ausgehend" bucket on the
-        next _fetch_calls() (including the already-scheduled post-call
-        refresh triggered by set_state() for this very same DISCONNECT).
+        next _fetch_calls() (including the post-call refresh requested by
+        call_ended() for this very same DISCONNECT).
         """
-        call = Call()
+        call = CallRecord()
         call.Id = f"live-{pending['raw_date']}-{pending['number']}"
         call.Type = str(OUT_CALL_TYPE)
         call.Date = pending["call_date"]
@@ -287,26 +399,25 @@ class FritzBoxCallSensor(SensorEntity):
         call.tam_message = None
         self._call_log_coordinator.add_synthetic_outgoing_call(call)
 
-    def set_attributes(self, attributes: Mapping[str, str | bool]) -> None:
-        """Set the state attributes."""
-        self._attributes = {**attributes}
-
     @property
     @override
-    def extra_state_attributes(self) -> dict[str, str | list[str] | bool]:
+    def extra_state_attributes(self) -> dict[str, Any]:
         """Return the state attributes."""
+        attributes: dict[str, Any] = {
+            **self._attributes,
+            ATTR_ACTIVE_CALLS: [
+                {"connection_id": connection_id, **call}
+                for connection_id, call in self._active_calls.items()
+            ],
+        }
         if self._prefixes:
-            self._attributes[ATTR_PREFIXES] = self._prefixes
-        return self._attributes
+            attributes[ATTR_PREFIXES] = self._prefixes
+        return attributes
 
     def number_to_contact(self, number: str) -> Contact:
         """Return a contact for a given phone number."""
         return self._fritzbox_phonebook.get_contact(number)
 
-    def update(self) -> None:
-        """Update the phonebook if it is defined."""
-        self._fritzbox_phonebook.update_phonebook()
-
 
 class FritzBoxCallListSensor(CoordinatorEntity[FritzCallLogCoordinator], SensorEntity):
     """Historical call-list sensor: fritzbox_anrufe_eingehend/ausgehend/verpasst.
@@ -320,6 +431,10 @@ class FritzBoxCallListSensor(CoordinatorEntity[FritzCallLogCoordinator], SensorE
 
     _attr_has_entity_name = True
     _attr_native_unit_of_measurement = "Anrufe"
+    # Up to 200 call dicts per state - far too bulky for the recorder's
+    # state history. Dashboards needing more than the live attribute can
+    # page through the same rows via websocket_api.py instead.
+    _unrecorded_attributes = frozenset({"calls"})
 
     def __init__(
         self,
@@ -328,6 +443,7 @@ class FritzBoxCallListSensor(CoordinatorEntity[FritzCallLogCoordinator], SensorE
         unique_id: str,
         phonebook_name: str,
         fritzbox_phonebook: FritzBoxPhonebook,
+        phonebook_coordinator: FritzPhonebookCoordinator,
         device_info: DeviceInfo,
         config_entry_id: str,
     ) -> None:
@@ -335,6 +451,7 @@ class FritzBoxCallListSensor(CoordinatorEntity[FritzCallLogCoordinator], SensorE
         super().__init__(coordinator)
         self._call_type = call_type
         self._fritzbox_phonebook = fritzbox_phonebook
+        self._phonebook_coordinator = phonebook_coordinator
         self._config_entry_id = config_entry_id
 
         # translation_key selects the matching icon (icons.json) and the
@@ -352,6 +469,87 @@ class FritzBoxCallListSensor(CoordinatorEntity[FritzCallLogCoordinator], SensorE
         self._attr_unique_id = unique_id
         self._attr_device_info = device_info
 
+        # The "calls" attribute payload, built once per coordinator update
+        # (see _rebuild_calls_payload) instead of on every state read.
+        # _payload_cache maps a call's Id to (signature, dict) so entries of
+        # calls that didn't change since the last refresh are reused as-is;
+        # it is dropped whenever the phonebook was reloaded, since names/VIP
+        # flags may have changed then.
+        self._calls_payload: tuple[dict[str, Any], ...] = ()
+        self._payload_cache: dict[str, tuple[tuple[Any, ...], dict[str, Any]]] = {}
+        self._payload_phonebook_revision = fritzbox_phonebook.revision
+        self._rebuild_calls_payload()
+        self._written_content_key = self._content_key()
+
+    @override
+    async def async_added_to_hass(self) -> None:
+        """Also re-render when the phonebook changed (names/VIP flags)."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self._phonebook_coordinator.async_add_listener(
+                self._handle_coordinator_update
+            )
+        )
+
+    def _content_key(self) -> tuple[Any, ...]:
+        """Everything a state write of this sensor depends on, see below."""
+        data = self.coordinator.data
+        return (
+            data.fingerprint(self._call_type) if data is not None else None,
+            self.coordinator.last_update_success,
+            self._fritzbox_phonebook.revision,
+        )
+
+    @callback
+    @override
+    def _handle_coordinator_update(self) -> None:
+        """Rebuild the cached "calls" payload and write the state - if changed.
+
+        Most refreshes change nothing for a given bucket; writing anyway
+        would push the whole, identical call list through the recorder and
+        every websocket subscriber again. The bucket's fingerprint (see
+        call_log.py:_bucket_fingerprint), availability and the phonebook
+        revision (names/VIP flags) cover everything the state shows.
+        """
+        content_key = self._content_key()
+        if content_key == self._written_content_key:
+            return
+        self._written_content_key = content_key
+        self._rebuild_calls_payload()
+        super()._handle_coordinator_update()
+
+    def _rebuild_calls_payload(self) -> None:
+        """Rebuild the "calls" attribute, reusing entries of unchanged calls."""
+        if self._payload_phonebook_revision != self._fritzbox_phonebook.revision:
+            self._payload_phonebook_revision = self._fritzbox_phonebook.revision
+            self._payload_cache = {}
+
+        payload_cache: dict[str, tuple[tuple[Any, ...], dict[str, Any]]] = {}
+        payload: list[dict[str, Any]] = []
+        for call in self._calls:
+            tam_message = getattr(call, "tam_message", None)
+            signature = (
+                call.Date,
+                call.Duration,
+                call.Name,
+                call.Caller,
+                call.Called,
+                call.Device,
+                call.Path,
+                getattr(call, "outcome", None),
+                tam_message.Index if tam_message is not None else None,
+            )
+            cached = self._payload_cache.get(call.Id)
+            if cached is not None and cached[0] == signature:
+                entry = cached[1]
+            else:
+                entry = self._call_to_dict(call)
+            payload_cache[call.Id] = (signature, entry)
+            payload.append(entry)
+
+        self._payload_cache = payload_cache
+        self._calls_payload = tuple(payload)
+
     @property
     def _calls(self) -> list[Call]:
         """Return the raw Call objects for this sensor's call type."""
@@ -367,51 +565,15 @@ class FritzBoxCallListSensor(CoordinatorEntity[FritzCallLogCoordinator], SensorE
 
     @property
     @override
-    def extra_state_attributes(self) -> dict[str, list[dict[str, Any]]]:
+    def extra_state_attributes(self) -> dict[str, tuple[dict[str, Any], ...]]:
         """Return the calls as a list of dicts, e.g. for a dashboard table."""
-        return {"calls": [self._call_to_dict(call) for call in self._calls]}
+        return {"calls": self._calls_payload}
 
     def _call_to_dict(self, call: Call) -> dict[str, Any]:
         """Convert one Call instance into a flat, table-friendly dict."""
-        is_outgoing = self._call_type == CALL_TYPE_OUTGOING
-        external_number = call.Called if is_outgoing else call.Caller
-        own_number = call.Caller if is_outgoing else call.Called
-
-        contact = None
-        if external_number:
-            contact = self._fritzbox_phonebook.get_contact(external_number)
-
-        duration = call.duration
-        # "outcome" and "tam_message" are set by
-        # FritzCallLogCoordinator._fetch_calls() (see
-        # call_log.py:_classify_call/_find_matching_tam_message) as dynamic
-        # attributes directly on the Call instance. "outcome" is used by the
-        # dashboard card's optional "Weiterverarbeitung" row (since v1.0.3)
-        # to pick an icon/action. For media_url, a confidently matched
-        # tam_message is preferred - it points at the TAM sensor's own,
-        # already real-hardware-confirmed media proxy (see http.py:
-        # FritzBoxTamMediaView) instead of the newer, unconfirmed call-list
-        # one; call.Path alone is only used as a fallback when no match was
-        # found (e.g. the TAM coordinator hasn't polled yet).
-        outcome = getattr(call, "outcome", None)
-        tam_message = getattr(call, "tam_message", None)
-        media_url = None
-        if tam_message is not None and tam_message.Path:
-            media_url = f"{TAM_MEDIA_URL_BASE}/{self._config_entry_id}/{tam_message.Index}"
-        elif call.Path:
-            media_url = f"{CALL_MEDIA_URL_BASE}/{self._config_entry_id}/{self._call_type}/{call.id}"
-        return {
-            "type": self._call_type,
-            "date": call.date.isoformat() if isinstance(call.date, datetime) else None,
-            "name": call.Name or (contact.name if contact else None),
-            "number": external_number or None,
-            "own_number": own_number or None,
-            "device": call.Device or None,
-            "duration": str(duration) if isinstance(duration, timedelta) else None,
-            "vip": contact.vip if contact else False,
-            "outcome": outcome,
-            "media_url": media_url,
-        }
+        return call_to_dict(
+            call, self._call_type, self._fritzbox_phonebook, self._config_entry_id
+        )
 
 
 class FritzBoxVoicemailSensor(CoordinatorEntity[FritzTamCoordinator], SensorEntity):
@@ -428,6 +590,8 @@ class FritzBoxVoicemailSensor(CoordinatorEntity[FritzTamCoordinator], SensorEnti
     _attr_has_entity_name = True
     _attr_native_unit_of_measurement = "Nachrichten"
     _attr_icon = "mdi:voicemail"
+    # See FritzBoxCallListSensor._unrecorded_attributes.
+    _unrecorded_attributes = frozenset({"messages"})
 
     def __init__(
         self,
@@ -435,18 +599,52 @@ class FritzBoxVoicemailSensor(CoordinatorEntity[FritzTamCoordinator], SensorEnti
         unique_id: str,
         phonebook_name: str,
         fritzbox_phonebook: FritzBoxPhonebook,
+        phonebook_coordinator: FritzPhonebookCoordinator,
         device_info: DeviceInfo,
         config_entry_id: str,
     ) -> None:
         """Initialize the answering-machine sensor."""
         super().__init__(coordinator)
         self._fritzbox_phonebook = fritzbox_phonebook
+        self._phonebook_coordinator = phonebook_coordinator
         self._config_entry_id = config_entry_id
 
         self._attr_translation_key = f"{DOMAIN}_{CALL_TYPE_VOICEMAIL}"
         self._attr_translation_placeholders = {"phonebook_name": phonebook_name}
         self._attr_unique_id = unique_id
         self._attr_device_info = device_info
+        self._written_content_key = self._content_key()
+
+    @override
+    async def async_added_to_hass(self) -> None:
+        """Also re-render when the phonebook changed (names/VIP flags)."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self._phonebook_coordinator.async_add_listener(
+                self._handle_coordinator_update
+            )
+        )
+
+    def _content_key(self) -> tuple[Any, ...]:
+        """Everything a state write of this sensor depends on."""
+        return (
+            message_list_fingerprint(self._messages),
+            self.coordinator.last_update_success,
+            self._fritzbox_phonebook.revision,
+        )
+
+    @callback
+    @override
+    def _handle_coordinator_update(self) -> None:
+        """Write the state only if the message list actually changed.
+
+        Same reasoning as FritzBoxCallListSensor._handle_coordinator_update.
+        """
+        content_key = self._content_key()
+        if content_key == self._written_content_key:
+            return
+        self._written_content_key = content_key
+        super()._handle_coordinator_update()
 
     @property
     def _messages(self) -> list[TamMessage]:
@@ -467,25 +665,7 @@ class FritzBoxVoicemailSensor(CoordinatorEntity[FritzTamCoordinator], SensorEnti
 
     def _message_to_dict(self, message: TamMessage) -> dict[str, Any]:
         """Convert one TamMessage instance into a flat, table-friendly dict."""
-        contact = None
-        if message.Number:
-            contact = self._fritzbox_phonebook.get_contact(message.Number)
-
-        duration = message.duration
-        media_url = (
-            f"{TAM_MEDIA_URL_BASE}/{self._config_entry_id}/{message.Index}"
-            if message.Path
-            else None
-        )
-        return {
-            "name": message.Name or (contact.name if contact else None),
-            "number": message.Number or None,
-            "date": message.date.isoformat() if isinstance(message.date, datetime) else None,
-            "duration": str(duration) if isinstance(duration, timedelta) else None,
-            "new": bool(message.new),
-            "vip": contact.vip if contact else False,
-            "media_url": media_url,
-        }
+        return message_to_dict(message, self._fritzbox_phonebook, self._config_entry_id)
 
 
 class FritzBoxCallMonitor:
@@ -511,7 +691,9 @@ class FritzBoxCallMonitor:
         """Connect to the Fritz!Box."""
         _LOGGER.debug("Setting up socket connection")
         try:
-            self.connection = FritzMonitor(address=self.host, port=self.port)
+            self.connection = _ReconnectingFritzMonitor(
+                address=self.host, port=self.port
+            )
             kwargs: dict[str, Any] = {
                 "event_queue": self.connection.start(
                     reconnect_tries=50, reconnect_delay=120
@@ -539,27 +721,34 @@ class FritzBoxCallMonitor:
                 _LOGGER.debug("Empty event queue")
                 continue
             else:
+                if event == _RECONNECTED:
+                    _LOGGER.debug("Connection re-established")
+                    self._connection_reset()
+                    continue
                 _LOGGER.debug("Received event: %s", event)
                 self._parse(event)
-                sleep(1)
+
+    def _connection_reset(self) -> None:
+        """Drop all per-call state after a (re)connect, see connection_reset()."""
+        self._pending_outgoing.clear()
+        self._sensor.connection_reset()
 
     def _parse(self, event: str) -> None:
-        """Parse the call information and set the sensor states."""
+        """Parse the call information and publish it to the sensor."""
         line = event.split(";")
-        df_in = "%d.%m.%y %H:%M:%S"
-        df_out = "%Y-%m-%dT%H:%M:%S"
-        call_date = datetime.strptime(line[0], df_in)
-        isotime = call_date.strftime(df_out)
+        call_date = parse_fritz_datetime(line[0])
+        isotime = call_date.isoformat()
         # Same event timestamp, but reformatted to the minute-precision
         # "%d.%m.%y %H:%M" the FRITZ!Box's own TR-064 call list uses for
         # its Date field (see call_log.py:_find_matching_tam_message for
         # the other place this exact format matters) - used only if this
         # turns out to be a failed outgoing dial, see FritzState.CALL below.
-        call_date_str = call_date.strftime("%d.%m.%y %H:%M")
+        call_date_str = format_fritz_datetime(call_date)
         connection_id = line[2]
         att: dict[str, str | bool]
+        state: CallState
         if line[1] == FritzState.RING:
-            self._sensor.set_state(CallState.RINGING)
+            state = CallState.RINGING
             contact = self._sensor.number_to_contact(line[3])
             att = {
                 "type": "incoming",
@@ -570,9 +759,8 @@ class FritzBoxCallMonitor:
                 "from_name": contact.name,
                 "vip": contact.vip,
             }
-            self._sensor.set_attributes(att)
         elif line[1] == FritzState.CALL:
-            self._sensor.set_state(CallState.DIALING)
+            state = CallState.DIALING
             # Remember this dial attempt until we know whether it succeeds
             # (CONNECT) or not (DISCONNECT with no CONNECT in between) -
             # see those branches below.
@@ -593,9 +781,8 @@ class FritzBoxCallMonitor:
                 "to_name": contact.name,
                 "vip": contact.vip,
             }
-            self._sensor.set_attributes(att)
         elif line[1] == FritzState.CONNECT:
-            self._sensor.set_state(CallState.TALKING)
+            state = CallState.TALKING
             # This ConnectionID connected - a dial attempt that reaches
             # here succeeded, the FRITZ!Box's own call list will log it
             # normally, so nothing further to track for it.
@@ -608,9 +795,9 @@ class FritzBoxCallMonitor:
                 "with_name": contact.name,
                 "vip": contact.vip,
             }
-            self._sensor.set_attributes(att)
         elif line[1] == FritzState.DISCONNECT:
-            self._sensor.set_state(CallState.IDLE)
+            state = CallState.IDLE
+            self._sensor.call_ended()
             pending = self._pending_outgoing.pop(connection_id, None)
             if pending is not None:
                 # Reached CALL but never CONNECT for this ConnectionID - a
@@ -620,5 +807,124 @@ class FritzBoxCallMonitor:
                 # this needs to be synthesized here at all.
                 self._sensor.record_failed_outgoing_call(pending)
             att = {"duration": line[3], "closed": isotime}
-            self._sensor.set_attributes(att)
-        self._sensor.schedule_update_ha_state()
+        else:
+            return
+        self._sensor.publish_event(connection_id, state, att)
+
+
+class _ReconnectingFritzMonitor(FritzMonitor):
+    """FritzMonitor that reports each successful reconnect in its queue.
+
+    FritzMonitor reconnects silently inside its own thread; the marker lets
+    FritzBoxCallMonitor._process_events() reset the call state exactly
+    between the events before and after the gap. Hooks into FritzMonitor's
+    private _monitor/_reconnect_socket (fritzconnection is pinned in
+    manifest.json).
+    """
+
+    _event_queue: queue.Queue[str] | None = None
+
+    def _monitor(self, **kwargs: Any) -> None:
+        """Remember the event queue, then run the monitor loop."""
+        self._event_queue = kwargs["monitor_queue"]
+        super()._monitor(**kwargs)
+
+    def _reconnect_socket(self, *args: Any, **kwargs: Any) -> socket.socket | None:
+        """Reconnect; on success put the reconnect marker into the queue."""
+        sock = super()._reconnect_socket(*args, **kwargs)
+        if sock is not None and self._event_queue is not None:
+            try:
+                self._event_queue.put(_RECONNECTED, block=False)
+            except queue.Full:
+                pass
+        return sock
+
+
+class AsyncFritzBoxCallMonitor(FritzBoxCallMonitor):
+    """Asyncio-native callmonitor reader (option "async_callmonitor").
+
+    Reads the callmonitor port with asyncio.open_connection() directly on
+    the event loop instead of fritzconnection's FritzMonitor thread plus the
+    queue-polling _process_events() thread: no threads and no queue
+    hand-off per config entry, and _parse() - hence the sensor's state
+    write - runs as soon as a line arrives. A lost connection is retried
+    with an exponential backoff between CALLMONITOR_RECONNECT_DELAY_MIN
+    and CALLMONITOR_RECONNECT_DELAY_MAX seconds (see const.py).
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, host: str, port: int, sensor: FritzBoxCallSensor
+    ) -> None:
+        """Initialize the asyncio monitor instance."""
+        super().__init__(host=host, port=port, sensor=sensor)
+        self._hass = hass
+        self._task: asyncio.Task[None] | None = None
+
+    @callback
+    def async_start(self) -> None:
+        """Start reading the callmonitor in a background task."""
+        self._task = self._hass.async_create_background_task(
+            self._async_run(), name=f"{DOMAIN} callmonitor {self.host}:{self.port}"
+        )
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop reading and close the connection."""
+        self.stopped.set()
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _async_run(self) -> None:
+        """Connect, read until the connection drops, reconnect with backoff."""
+        delay = CALLMONITOR_RECONNECT_DELAY_MIN
+        while not self.stopped.is_set():
+            _LOGGER.debug("Setting up socket connection")
+            try:
+                reader, writer = await asyncio.open_connection(self.host, self.port)
+            except OSError as err:
+                _LOGGER.error(
+                    "Cannot connect to %s on port %s: %s (retrying in %s s)",
+                    self.host,
+                    self.port,
+                    err,
+                    delay,
+                )
+            else:
+                delay = CALLMONITOR_RECONNECT_DELAY_MIN
+                self._connection_reset()
+                # Same as FritzMonitor: detect a silently dead box/route
+                # instead of waiting forever on a half-open connection.
+                if (sock := writer.get_extra_info("socket")) is not None:
+                    sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+                try:
+                    await self._async_read_events(reader)
+                except (OSError, ValueError) as err:
+                    # ValueError: a line over the StreamReader's limit -
+                    # start over as if the connection had dropped, rather
+                    # than guess where the next line begins.
+                    _LOGGER.debug("Callmonitor read failed: %s", err)
+                finally:
+                    writer.close()
+                if self.stopped.is_set():
+                    return
+                _LOGGER.error(
+                    "Connection has abruptly ended (retrying in %s s)", delay
+                )
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, CALLMONITOR_RECONNECT_DELAY_MAX)
+
+    async def _async_read_events(self, reader: asyncio.StreamReader) -> None:
+        """Parse callmonitor lines as they arrive, until EOF."""
+        _LOGGER.debug("Connection established, waiting for events")
+        while raw_line := await reader.readline():
+            event = raw_line.decode("utf-8", errors="replace").strip()
+            if not event:
+                continue
+            _LOGGER.debug("Received event: %s", event)
+            try:
+                self._parse(event)
+            except (IndexError, ValueError):
+                # A thread-based reader would just die on such a line - here
+                # it would take the whole reconnect loop down with it.
+                _LOGGER.warning("Ignoring malformed callmonitor event: %s", event)
@@ -15,11 +15,11 @@ list in :mod:`fritzconnection.lib.fritzcall`:
 2. Download that URL using the already-authenticated
    :class:`~fritzconnection.core.fritzconnection.FritzConnection` session
    (``fc.session``, a :class:`requests.Session` with FRITZ!Box digest auth
-   already attached) via :func:`fritzconnection.core.utils.get_xml_root`.
+   already attached), streamed through :func:`~.xmlstream.stream_records`.
 3. Parse the resulting XML into plain Python objects using
    :mod:`fritzconnection`'s own generic node processor
    (:mod:`fritzconnection.core.processor`), exactly like ``CallCollection``
-   does for calls.
+   does for calls - one ``<Message>`` element at a time, as it arrives.
 
 This part (message list) has been confirmed working against real hardware.
 AVM's own documentation and third-party references are inconsistent about
@@ -62,7 +62,7 @@ several revisions:
    response URL, while the iobroker script performs a completely separate
    classic-web-UI login (the same challenge-response flow ``FritzHttp``
    already implements). Rather than gamble on a fourth single theory,
-   :meth:`FritzTamCoordinator.fetch_audio` in ``voicemail.py`` now tries
+   :meth:`FritzTamCoordinator._open_audio` in ``voicemail.py`` now tries
    both, in order (the embedded sid first since it costs no extra login,
    then a fresh ``FritzHttp`` login as fallback) against the corrected
    web-UI origin, and only gives up once every combination has failed.
@@ -80,13 +80,11 @@ import re
 from urllib.parse import parse_qs, urlencode, urljoin, urlsplit
 
 from fritzconnection.core.fritzconnection import FritzConnection
-from fritzconnection.core.processor import (
-    InstanceAttributeFactory,
-    Storage,
-    process_node,
-    processor,
-)
-from fritzconnection.core.utils import get_xml_root
+from fritzconnection.core.processor import processor
+
+from .dates import parse_fritz_datetime
+from .number_index import intern_number
+from .xmlstream import stream_records
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -115,7 +113,7 @@ _SID_RE = re.compile(r"[?&]sid=([a-fA-F0-9]+)")
 def _datetime_converter(date_string: str | None) -> datetime.datetime | str | None:
     if not date_string:
         return date_string
-    return datetime.datetime.strptime(date_string, "%d.%m.%y %H:%M")
+    return parse_fritz_datetime(date_string)
 
 
 def _timedelta_converter(duration_string: str | None) -> datetime.timedelta | str | None:
@@ -129,22 +127,12 @@ def _bool_converter(value: str | None) -> bool:
     return str(value) == "1"
 
 
-class _AttributeConverter:
-    """Data descriptor returning a converted attribute value (read-only)."""
-
-    def __init__(self, attribute_name: str, converter=str) -> None:
-        self.attribute_name = attribute_name
-        self.converter = converter
-
-    def __set__(self, obj, value):
-        return NotImplemented
-
-    def __get__(self, obj, objtype):
-        attr = getattr(obj, self.attribute_name)
-        try:
-            return self.converter(attr)
-        except (TypeError, ValueError):
-            return attr
+def _convert(converter, value):
+    """Return the converted value, or the raw one if it doesn't convert."""
+    try:
+        return converter(value)
+    except (TypeError, ValueError):
+        return value
 
 
 @processor
@@ -158,13 +146,30 @@ class TamMessage:
     ``"/download.lua?path=/data/tam/rec/rec.0.009"`` - kept verbatim, NOT a
     directly-fetchable URL; see :meth:`FritzTam.get_download_url` for how
     the actual recording is downloaded), ``New`` ("1"/"0") and ``Count``.
-    Lowercase convenience properties expose converted values: ``date``
-    (datetime), ``duration`` (timedelta), ``new`` (bool).
+    Lowercase attributes hold the converted values: ``date`` (datetime),
+    ``duration`` (timedelta), ``new`` (bool) - computed once by
+    :meth:`convert` when the message list is parsed (see
+    :meth:`FritzTam.get_messages`), not on every access: the call-list
+    matching and the sensor rows read them many times per poll.
+
+    Slotted: message lists are kept per poll by the TAM coordinator and
+    referenced from every matched call, so there is no per-instance
+    ``__dict__``.
     """
 
-    date = _AttributeConverter("Date", _datetime_converter)
-    duration = _AttributeConverter("Duration", _timedelta_converter)
-    new = _AttributeConverter("New", _bool_converter)
+    __slots__ = (
+        "Count",
+        "Date",
+        "Duration",
+        "Index",
+        "Name",
+        "New",
+        "Number",
+        "Path",
+        "date",
+        "duration",
+        "new",
+    )
 
     def __init__(self) -> None:
         self.Index: str | None = None
@@ -175,20 +180,37 @@ class TamMessage:
         self.Path: str | None = None
         self.New: str | None = None
         self.Count: str | None = None
+        self.date: datetime.datetime | str | None = None
+        self.duration: datetime.timedelta | str | None = None
+        self.new = False
 
+    def convert(self) -> None:
+        """Set the typed attributes from the raw XML fields."""
+        self.Number = intern_number(self.Number)
+        self.date = _convert(_datetime_converter, self.Date)
+        self.duration = _convert(_timedelta_converter, self.Duration)
+        self.new = _bool_converter(self.New)
 
-class TamMessageCollection(Storage):
-    """Container for a sequence of :class:`TamMessage` instances."""
 
-    Message = InstanceAttributeFactory(TamMessage)
+def message_list_fingerprint(messages: list[TamMessage]) -> int:
+    """Hash everything the answering-machine sensor shows of a message list.
 
-    def __init__(self, root) -> None:
-        self.messages: list[TamMessage] = []
-        super().__init__(self.messages)
-        process_node(self, root)
-
-    def __iter__(self):
-        return iter(self.messages)
+    Lets the sensor skip its state write when a poll brought no change.
+    """
+    return hash(
+        tuple(
+            (
+                message.Index,
+                message.Number,
+                message.Date,
+                message.Duration,
+                message.Name,
+                message.Path,
+                message.New,
+            )
+            for message in messages
+        )
+    )
 
 
 class FritzTam:
@@ -228,8 +250,11 @@ class FritzTam:
         url = self._message_list_url()
         if not url:
             return []
-        root = get_xml_root(url, session=self.fc.session)
-        return list(TamMessageCollection(root))
+        messages = []
+        for message in stream_records(url, self.fc.session, "Message", TamMessage):
+            message.convert()
+            messages.append(message)
+        return messages
 
     def get_message_list_sid(self) -> str | None:
         """Issue a fresh GetMessageList call and return its embedded sid.
@@ -6,25 +6,183 @@ could and could not be verified against real hardware while building this.
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Callable
 from datetime import timedelta
+import hashlib
 import logging
 import mimetypes
+from pathlib import Path
+from threading import Lock
+import time
 
 from fritzconnection.core.exceptions import FritzConnectionException, FritzSecurityError
 from fritzconnection.core.fritzhttp import FritzHttp
+from fritzconnection.lib.fritzcall import Call
+from requests import Response
 from requests.exceptions import ConnectionError as RequestsConnectionError, RequestException
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .tam import FritzTam, TamMessage
+from .cache import CacheWriter, DiskCache, entry_cache_dir
+from .const import (
+    CONF_PREFETCH_RECORDINGS,
+    DEFAULT_PREFETCH_RECORDINGS,
+    TAM_AUDIO_CACHE_MAX_BYTES,
+)
+from .refresh import adapt_update_interval, post_call_debouncer
+from .tam import FritzTam, TamMessage, message_list_fingerprint
 
 _LOGGER = logging.getLogger(__name__)
 
 TAM_UPDATE_INTERVAL = timedelta(minutes=5)
 _DEFAULT_CONTENT_TYPE = "audio/wav"
 
+# Recordings are passed on (to the browser/the cache) in chunks this big.
+AUDIO_CHUNK_SIZE = 64 * 1024
+# At most this many recordings are downloaded from the box at once -
+# playback and prefetch together, see _async_download.
+DOWNLOAD_CONCURRENCY = 3
+# A download is given up after DOWNLOAD_TIMEOUT in total, or after
+# DOWNLOAD_REQUEST_TIMEOUT without a byte from the box - so a stuck box
+# never holds one of the slots above for long.
+DOWNLOAD_TIMEOUT = timedelta(minutes=2)
+DOWNLOAD_REQUEST_TIMEOUT = timedelta(seconds=15)
+# Playback (or prefetch) waiting for a download gives up after this long
+# without progress - e.g. while all slots are busy.
+DOWNLOAD_WAIT_TIMEOUT = timedelta(seconds=30)
+
+# Recording prefetch (option "prefetch_recordings"): at most this many
+# downloads at once, each holding its slot for PREFETCH_SPACING afterwards -
+# so the prefetch never issues more than PREFETCH_CONCURRENCY requests per
+# PREFETCH_SPACING and leaves the box free for the call-list/TAM polls.
+PREFETCH_CONCURRENCY = 2
+PREFETCH_SPACING = timedelta(seconds=2)
+# A failed download (the endpoint is still experimental, see tam.py) is
+# retried after 10 s, then 20 s, ... - PREFETCH_ATTEMPTS tries in total.
+PREFETCH_ATTEMPTS = 3
+PREFETCH_RETRY_DELAY = timedelta(seconds=10)
+
+# The box ends a web session after 20 minutes without use - a sid that
+# worked for a download is reused for a little less than that after its
+# last successful use, instead of negotiating a new one every time.
+DOWNLOAD_SID_TTL = timedelta(minutes=15)
+# Download answers that mean "this sid is no longer valid" - only these make
+# a cached sid be dropped and a new one negotiated.
+_SID_REJECTED_STATUSES = (403, 404)
+
+
+def _recording_cache_key(message: TamMessage | Call) -> str:
+    """Return the cache file stem of a message's (or call's) recording.
+
+    Keyed by the recording's ``Path`` together with the message date: the
+    box reuses file names like ``rec.0.009`` once older messages are
+    deleted, so the path alone doesn't identify one recording for good.
+    """
+    identity = f"{message.Path}\n{message.Date}"
+    return hashlib.sha256(identity.encode()).hexdigest()
+
+
+def _is_recording(response: Response) -> bool:
+    """Return whether a download response carries the recording.
+
+    An expired sid may also be answered with the web UI's login page
+    (HTTP 200, HTML) instead of an error status.
+    """
+    return response.status_code == 200 and not (
+        response.headers.get("Content-Type", "").startswith("text/html")
+    )
+
+
+def _content_type(response: Response) -> str:
+    """Return the content type of a recording download."""
+    return (
+        response.headers.get("Content-Type")
+        or mimetypes.guess_type(response.url)[0]
+        or _DEFAULT_CONTENT_TYPE
+    )
+
+
+class RecordingStream:
+    """A recording being downloaded from the box into the recording cache.
+
+    Every method is BLOCKING - run in executor. The data goes to a
+    temporary cache file (see :class:`~.cache.CacheWriter`) that is only
+    committed once the recording was read to the end (:meth:`commit`);
+    after a failed download it is discarded (:meth:`abort`).
+    """
+
+    def __init__(self, response: Response, writer: CacheWriter) -> None:
+        """Initialize with the open upstream response and a cache writer."""
+        self._response = response
+        self._chunks = response.iter_content(AUDIO_CHUNK_SIZE)
+        self._writer = writer
+        self.temp_path = writer.temp_path
+        length = response.headers.get("Content-Length")
+        self.content_length = int(length) if length and length.isdecimal() else None
+
+    def read(self) -> int:
+        """Copy the next chunk into the cache file; return its size, 0 at the end."""
+        chunk = next(self._chunks, b"")
+        self._writer.write(chunk)
+        return len(chunk)
+
+    def commit(self) -> Path:
+        """Close the complete download; return the cached file."""
+        self._response.close()
+        return self._writer.commit()
+
+    def abort(self) -> None:
+        """Close the download and discard what was cached of it."""
+        self._response.close()
+        self._writer.abort()
+
+
+class RecordingDownload:
+    """A recording being downloaded into the cache, for playback to tail.
+
+    The download itself runs in a background task of the coordinator (see
+    :meth:`FritzTamCoordinator._async_download`) at the box's speed, no
+    matter how fast - or whether at all - anyone plays it. Playback reads
+    the growing temporary file (:attr:`temp_path`) up to :attr:`size`;
+    once :attr:`done`, the recording is either cached (:attr:`path`) or
+    the download failed (:attr:`error`). Only touched on the event loop.
+    """
+
+    def __init__(self) -> None:
+        """Initialize a download that hasn't reached the box yet."""
+        self.content_type = _DEFAULT_CONTENT_TYPE
+        self.content_length: int | None = None
+        self.temp_path: Path | None = None
+        self.size = 0
+        self.done = False
+        self.path: Path | None = None
+        self.error: RequestException | None = None
+        self._changed = asyncio.Event()
+
+    @callback
+    def async_changed(self) -> None:
+        """Wake up everyone waiting for the download."""
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    async def async_wait_for(self, ready: Callable[[], bool]) -> None:
+        """Wait until ready() holds.
+
+        Raises RequestException if the download makes no progress for
+        DOWNLOAD_WAIT_TIMEOUT.
+        """
+        while not ready():
+            try:
+                async with asyncio.timeout(DOWNLOAD_WAIT_TIMEOUT.total_seconds()):
+                    await self._changed.wait()
+            except TimeoutError as ex:
+                raise RequestException(
+                    "Zeitüberschreitung beim Warten auf den Anrufbeantworter-Download"
+                ) from ex
+
 
 class FritzTamCoordinator(DataUpdateCoordinator[list[TamMessage]]):
     """Coordinator that periodically fetches the FRITZ!Box answering-machine list.
@@ -43,20 +201,48 @@ class FritzTamCoordinator(DataUpdateCoordinator[list[TamMessage]]):
             _LOGGER,
             name="fritzbox_anrufe tam",
             update_interval=TAM_UPDATE_INTERVAL,
+            request_refresh_debouncer=post_call_debouncer(hass, _LOGGER),
         )
         self.config_entry = config_entry
         self._fritz_tam = fritz_tam
         # Only used as a *fallback* sid source for recording downloads
-        # (see fetch_audio/_sid_candidates below) - also conveniently
+        # (see _open_audio/_sid_candidates below) - also conveniently
         # provides router_url, the FRITZ!Box's normal web-UI origin
         # (port 80/443), which is needed for every download attempt
         # regardless of which sid ends up working.
         self._http = FritzHttp(fritz_tam.fc)
+        # Recordings already played once - repeated playback is served
+        # from here instead of another sid negotiation and download.
+        self._recordings = DiskCache(
+            entry_cache_dir(hass, config_entry.entry_id, "tam_audio"),
+            TAM_AUDIO_CACHE_MAX_BYTES,
+        )
+        self._prefetch = config_entry.options.get(
+            CONF_PREFETCH_RECORDINGS, DEFAULT_PREFETCH_RECORDINGS
+        )
+        self._prefetch_slots = asyncio.Semaphore(PREFETCH_CONCURRENCY)
+        # Cache keys of the current recordings a prefetch is running or
+        # done for - a key whose prefetch failed for good is dropped again,
+        # so the next update retries it.
+        self._prefetched: set[str] = set()
+        self._download_slots = asyncio.Semaphore(DOWNLOAD_CONCURRENCY)
+        # Cache key -> every recording being downloaded into the cache.
+        self._downloads: dict[str, RecordingDownload] = {}
+        # Last sid a download succeeded with, and when to stop trusting it
+        # (time.monotonic()) - see _open_audio. Downloads run in several
+        # executor jobs at once, so these and the counters below are only
+        # touched under _download_sid_lock.
+        self._download_sid_lock = Lock()
+        self._download_sid: str | None = None
+        self._download_sid_expires = 0.0
+        # How often a download could reuse that sid / had to negotiate one.
+        self.sid_cache_hits = 0
+        self.sid_cache_misses = 0
 
     async def _async_update_data(self) -> list[TamMessage]:
         """Fetch the current answering-machine messages (executor job)."""
         try:
-            return await self.hass.async_add_executor_job(self._fritz_tam.get_messages)
+            messages = await self.hass.async_add_executor_job(self._fritz_tam.get_messages)
         except FritzSecurityError as ex:
             raise UpdateFailed(
                 "Dem FRITZ!Box-Konto fehlt die Berechtigung 'Sprachnachrichten,"
@@ -67,6 +253,64 @@ class FritzTamCoordinator(DataUpdateCoordinator[list[TamMessage]]):
             raise UpdateFailed(
                 f"Fehler beim Abrufen der Anrufbeantworter-Nachrichten: {ex}"
             ) from ex
+        adapt_update_interval(
+            self,
+            TAM_UPDATE_INTERVAL,
+            changed=self.data is None
+            or message_list_fingerprint(messages) != message_list_fingerprint(self.data),
+        )
+        if self._prefetch:
+            self._async_schedule_prefetch(messages)
+        return messages
+
+    @callback
+    def _async_schedule_prefetch(self, messages: list[TamMessage]) -> None:
+        """Start downloading recordings not seen before, in the background.
+
+        Keys of messages deleted on the box meanwhile are forgotten here.
+        """
+        current = {
+            _recording_cache_key(message): message for message in messages if message.Path
+        }
+        self._prefetched &= current.keys()
+        new_messages = [
+            message for key, message in current.items() if key not in self._prefetched
+        ]
+        self._prefetched.update(current.keys())
+        for message in new_messages:
+            self.config_entry.async_create_background_task(
+                self.hass,
+                self._async_prefetch_recording(message),
+                f"fritzbox_anrufe prefetch {message.Index}",
+            )
+
+    async def _async_prefetch_recording(self, message: TamMessage) -> None:
+        """Download one recording into the cache, retrying with backoff."""
+        for attempt in range(PREFETCH_ATTEMPTS):
+            if attempt:
+                await asyncio.sleep(
+                    PREFETCH_RETRY_DELAY.total_seconds() * 2 ** (attempt - 1)
+                )
+            async with self._prefetch_slots:
+                try:
+                    recording = await self.async_recording(message)
+                    if isinstance(recording, RecordingDownload):
+                        await recording.async_wait_for(lambda: recording.done)
+                        if recording.error is not None:
+                            raise recording.error
+                except (RequestException, OSError) as ex:
+                    _LOGGER.debug(
+                        "Prefetch of recording %s failed (attempt %d/%d): %s",
+                        message.Index,
+                        attempt + 1,
+                        PREFETCH_ATTEMPTS,
+                        ex,
+                    )
+                    continue
+                finally:
+                    await asyncio.sleep(PREFETCH_SPACING.total_seconds())
+            return
+        self._prefetched.discard(_recording_cache_key(message))
 
     def get_message(self, message_id: str) -> TamMessage | None:
         """Look up one currently-known message by its raw ``Index`` string."""
@@ -75,8 +319,118 @@ class FritzTamCoordinator(DataUpdateCoordinator[list[TamMessage]]):
                 return message
         return None
 
-    def fetch_audio(self, message: TamMessage) -> tuple[bytes, str]:
-        """Download one message's audio recording. BLOCKING - run in executor.
+    async def async_recording(
+        self, message: TamMessage | Call
+    ) -> tuple[Path, str] | RecordingDownload:
+        """Return the cached recording, or its download into the cache.
+
+        A recording not cached yet is downloaded by one background task,
+        shared by every caller asking for it meanwhile (see
+        :meth:`_async_download`).
+        """
+        cached = await self.hass.async_add_executor_job(self.cached_audio, message)
+        if cached is not None:
+            return cached
+        key = _recording_cache_key(message)
+        if (download := self._downloads.get(key)) is None:
+            download = self._downloads[key] = RecordingDownload()
+            self.config_entry.async_create_background_task(
+                self.hass,
+                self._async_download(key, message, download),
+                f"fritzbox_anrufe recording {message.Path}",
+            )
+        return download
+
+    async def _async_download(
+        self, key: str, message: TamMessage | Call, download: RecordingDownload
+    ) -> None:
+        """Download a recording into the cache, publishing its progress.
+
+        Holds one of DOWNLOAD_CONCURRENCY slots for the download only -
+        never while a client plays it - and at most for about
+        DOWNLOAD_TIMEOUT.
+        """
+        try:
+            async with self._download_slots:
+                download.path = await self._async_fetch_recording(message, download)
+        except RequestException as ex:
+            download.error = ex
+        except OSError as ex:
+            download.error = RequestException(
+                f"Aufnahme konnte nicht zwischengespeichert werden: {ex}"
+            )
+        finally:
+            del self._downloads[key]
+            if download.path is None and download.error is None:
+                download.error = RequestException("Anrufbeantworter-Download abgebrochen")
+            download.done = True
+            download.async_changed()
+
+    async def _async_fetch_recording(
+        self, message: TamMessage | Call, download: RecordingDownload
+    ) -> Path:
+        """Copy a recording from the box into the cache; return the file."""
+        # Cached by a download that finished just before this one started.
+        cached = await self.hass.async_add_executor_job(self.cached_audio, message)
+        if cached is not None:
+            path, download.content_type = cached
+            return path
+        stream, download.content_type = await self.hass.async_add_executor_job(
+            self.open_audio_stream, message
+        )
+        download.content_length = stream.content_length
+        download.temp_path = stream.temp_path
+        download.async_changed()
+        deadline = self.hass.loop.time() + DOWNLOAD_TIMEOUT.total_seconds()
+        try:
+            while size := await self.hass.async_add_executor_job(stream.read):
+                download.size += size
+                download.async_changed()
+                if self.hass.loop.time() > deadline:
+                    raise RequestException(
+                        "Anrufbeantworter-Download fehlgeschlagen (Zeitüberschreitung)"
+                    )
+        except BaseException:
+            await self.hass.async_add_executor_job(stream.abort)
+            raise
+        return await self.hass.async_add_executor_job(stream.commit)
+
+    def cached_audio(self, message: TamMessage | Call) -> tuple[Path, str] | None:
+        """Return (file, content type) of a cached recording. BLOCKING."""
+        if not message.Path:
+            return None
+        path = self._recordings.find(_recording_cache_key(message))
+        if path is None:
+            return None
+        return path, mimetypes.guess_type(path.name)[0] or _DEFAULT_CONTENT_TYPE
+
+    def open_audio_stream(
+        self, message: TamMessage | Call
+    ) -> tuple[RecordingStream, str]:
+        """Start downloading a recording; return (stream, content type).
+
+        BLOCKING - run in executor, as is every read from the returned
+        stream. The stream copies the recording into the local cache as it
+        is read (see :class:`RecordingStream`). Raises RequestException if
+        the download can't be started (see :meth:`_open_audio`), OSError
+        if it can't be cached.
+        """
+        response, content_type = self._open_audio(message)
+        extension = mimetypes.guess_extension(content_type.split(";")[0].strip())
+        try:
+            writer = self._recordings.writer(
+                _recording_cache_key(message) + (extension or "")
+            )
+        except BaseException:
+            response.close()
+            raise
+        return RecordingStream(response, writer), content_type
+
+    def _open_audio(self, message: TamMessage | Call) -> tuple[Response, str]:
+        """Open the download of a recording from the box. BLOCKING.
+
+        Returns the streamed (not yet read) response and its content type;
+        the caller reads and closes it.
 
         Tries multiple (sid, origin) candidates in order until one returns
         HTTP 200 - see :meth:`_sid_candidates` and the module docstring in
@@ -85,6 +439,14 @@ class FritzTamCoordinator(DataUpdateCoordinator[list[TamMessage]]):
         never FRITZ!Box credentials directly - this whole exchange happens
         server-side.
 
+        The sid that last worked is reused for DOWNLOAD_SID_TTL after its
+        last successful use, so playing several messages in a row costs no
+        ``GetMessageList`` round-trip (or login) each. Only if the box
+        rejects it (HTTP 403/404, or its login page instead of the audio)
+        are the candidates negotiated again; any other error status is
+        reported as-is. ``sid_cache_hits``/``sid_cache_misses`` count both
+        cases (see diagnostics.py).
+
         Real-world bug fixed here (reported via a user of Thorsten's,
         HTTP 500 instead of the intended 502): determining ``origin``
         (:attr:`FritzHttp.router_url`, which can trigger its own TR-064 call
@@ -116,6 +478,27 @@ class FritzTamCoordinator(DataUpdateCoordinator[list[TamMessage]]):
                 f" ermitteln ({type(ex).__name__}: {ex})"
             ) from ex
 
+        if (sid := self._cached_download_sid()) is not None:
+            response = self._request_recording(message, sid, origin)
+            if _is_recording(response):
+                self._remember_download_sid(sid, hit=True)
+                return response, _content_type(response)
+            response.close()
+            if (
+                response.status_code != 200
+                and response.status_code not in _SID_REJECTED_STATUSES
+            ):
+                # Not a session problem - a new sid would not help.
+                raise RequestException(
+                    "Anrufbeantworter-Download fehlgeschlagen"
+                    f" (HTTP {response.status_code})"
+                )
+            _LOGGER.debug(
+                "Cached download sid rejected (HTTP %s), negotiating a new one",
+                response.status_code,
+            )
+        self._forget_download_sid(sid)
+
         last_status: int | None = None
         tried = 0
         sid_candidates = self._sid_candidates()
@@ -134,24 +517,13 @@ class FritzTamCoordinator(DataUpdateCoordinator[list[TamMessage]]):
                 )
                 continue
 
-            url = self._fritz_tam.build_download_url(message, sid, origin)
-            if not url:
-                raise RequestException("message has no audio path")
             tried += 1
-            try:
-                response = self._fritz_tam.fc.session.get(url)
-            except (FritzConnectionException, RequestsConnectionError) as ex:
-                raise RequestException(
-                    f"Anrufbeantworter-Download fehlgeschlagen: {ex}"
-                ) from ex
-            if response.status_code == 200:
-                content_type = (
-                    response.headers.get("Content-Type")
-                    or mimetypes.guess_type(url)[0]
-                    or _DEFAULT_CONTENT_TYPE
-                )
-                return response.content, content_type
+            response = self._request_recording(message, sid, origin)
+            if _is_recording(response):
+                self._remember_download_sid(sid)
+                return response, _content_type(response)
             last_status = response.status_code
+            response.close()
 
         if tried == 0:
             raise RequestException(
@@ -162,6 +534,50 @@ class FritzTamCoordinator(DataUpdateCoordinator[list[TamMessage]]):
             f" nach {tried} Versuch(en) mit unterschiedlichen Sitzungen"
         )
 
+    def _request_recording(
+        self, message: TamMessage | Call, sid: str, origin: str
+    ) -> Response:
+        """Request a recording with one sid; return the unread response."""
+        url = self._fritz_tam.build_download_url(message, sid, origin)
+        if not url:
+            raise RequestException("message has no audio path")
+        try:
+            return self._fritz_tam.fc.session.get(
+                url, stream=True, timeout=DOWNLOAD_REQUEST_TIMEOUT.total_seconds()
+            )
+        except (FritzConnectionException, RequestsConnectionError) as ex:
+            raise RequestException(
+                f"Anrufbeantworter-Download fehlgeschlagen: {ex}"
+            ) from ex
+
+    def _cached_download_sid(self) -> str | None:
+        """Return the remembered download sid, None if there is none/expired."""
+        with self._download_sid_lock:
+            if time.monotonic() < self._download_sid_expires:
+                return self._download_sid
+            return None
+
+    def _remember_download_sid(self, sid: str, hit: bool = False) -> None:
+        """Keep a sid that just worked for the next downloads."""
+        with self._download_sid_lock:
+            self._download_sid = sid
+            self._download_sid_expires = (
+                time.monotonic() + DOWNLOAD_SID_TTL.total_seconds()
+            )
+            if hit:
+                self.sid_cache_hits += 1
+
+    def _forget_download_sid(self, sid: str | None) -> None:
+        """Count a cache miss, dropping the sid that was found invalid.
+
+        A sid another download remembered in the meantime is kept.
+        """
+        with self._download_sid_lock:
+            if sid is not None and self._download_sid == sid:
+                self._download_sid = None
+                self._download_sid_expires = 0.0
+            self.sid_cache_misses += 1
+
     def _sid_candidates(self):
         """Yield sid candidates to try for a recording download, in order.
 
@@ -0,0 +1,138 @@
+"""Websocket API to page through the call lists and TAM messages.
+
+The ``calls``/``messages`` sensor attributes are excluded from the recorder
+(see ``sensor.py``) and always carry a sensor's complete list. A dashboard
+that only displays a few rows can instead fetch exactly those via the
+``fritzbox_anrufe/calls`` command, which reads straight from the
+coordinators' current data - no state write, no recorder involvement:
+
+.. code-block:: json
+
+    {"type": "fritzbox_anrufe/calls", "entry_id": "...", "call_type": "verpasst",
+     "offset": 0, "limit": 20, "since_id": "1234"}
+
+``call_type`` is one of the three call-list buckets or
+``"anrufbeantworter"`` for the answering-machine messages. Rows use the
+exact same format as the sensor attributes (see ``payload.py``), plus an
+``id`` (the call's ``Id`` / the message's ``Index``). ``since_id`` is an
+optional cursor: only entries newer than the one with that ``id`` are
+returned (the lists are ordered newest first) - pass the previous
+response's ``latest_id`` to poll for new rows only. An unknown
+``since_id`` (e.g. already dropped from the list) returns everything.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant, callback
+
+from .const import CALL_TYPE_VOICEMAIL, CALL_TYPES, DOMAIN
+from .payload import call_to_dict, message_to_dict
+
+WS_TYPE_CALLS = f"{DOMAIN}/calls"
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 200
+
+_WS_REGISTERED_KEY = f"{DOMAIN}_websocket_registered"
+
+
+@callback
+def async_register_websocket_commands(hass: HomeAssistant) -> None:
+    """Register the websocket commands, at most once per HA instance."""
+    if hass.data.get(_WS_REGISTERED_KEY):
+        return
+    hass.data[_WS_REGISTERED_KEY] = True
+    websocket_api.async_register_command(hass, websocket_calls)
+
+
+def _entries_since(entries: list[Any], since_id: str | None, id_of) -> list[Any]:
+    """Return the (newest-first) entries before the one with ``since_id``."""
+    if since_id is None:
+        return entries
+    for position, entry in enumerate(entries):
+        if id_of(entry) == since_id:
+            return entries[:position]
+    return entries
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): WS_TYPE_CALLS,
+        vol.Required("entry_id"): str,
+        vol.Required("call_type"): vol.In([*CALL_TYPES, CALL_TYPE_VOICEMAIL]),
+        vol.Optional("offset", default=0): vol.All(vol.Coerce(int), vol.Range(min=0)),
+        vol.Optional("limit", default=DEFAULT_PAGE_SIZE): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=MAX_PAGE_SIZE)
+        ),
+        vol.Optional("since_id"): vol.Coerce(str),
+    }
+)
+@callback
+def websocket_calls(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return one page of a call list (or of the TAM messages)."""
+    entry = hass.config_entries.async_get_entry(msg["entry_id"])
+    if (
+        entry is None
+        or entry.domain != DOMAIN
+        or entry.state is not ConfigEntryState.LOADED
+    ):
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "FRITZ!Box-Eintrag nicht gefunden"
+        )
+        return
+
+    runtime_data = entry.runtime_data
+    call_type: str = msg["call_type"]
+    rows: list[dict[str, Any]]
+
+    if call_type == CALL_TYPE_VOICEMAIL:
+        tam_coordinator = runtime_data.tam_coordinator
+        messages = (tam_coordinator.data if tam_coordinator is not None else None) or []
+        messages = _entries_since(messages, msg.get("since_id"), lambda m: str(m.Index))
+        latest_id = str(messages[0].Index) if messages else msg.get("since_id")
+        total = len(messages)
+        page = messages[msg["offset"] : msg["offset"] + msg["limit"]]
+        rows = [
+            {
+                "id": str(message.Index),
+                **message_to_dict(message, runtime_data.phonebook, entry.entry_id),
+            }
+            for message in page
+        ]
+    else:
+        data = runtime_data.call_log_coordinator.data
+        calls = data.calls(call_type) if data is not None else []
+        calls = _entries_since(calls, msg.get("since_id"), lambda c: str(c.Id))
+        latest_id = str(calls[0].Id) if calls else msg.get("since_id")
+        total = len(calls)
+        page = calls[msg["offset"] : msg["offset"] + msg["limit"]]
+        rows = [
+            {
+                "id": str(call.Id),
+                **call_to_dict(call, call_type, runtime_data.phonebook, entry.entry_id),
+            }
+            for call in page
+        ]
+
+    next_offset = msg["offset"] + len(rows)
+    connection.send_result(
+        msg["id"],
+        {
+            "call_type": call_type,
+            "total": total,
+            "offset": msg["offset"],
+            "next_offset": next_offset if next_offset < total else None,
+            "latest_id": latest_id,
+            "items": rows,
+        },
+    )
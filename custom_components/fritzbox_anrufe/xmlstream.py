@@ -0,0 +1,77 @@
+"""Streaming download/parse of the FRITZ!Box's flat XML lists.
+
+The call list and the answering-machine message list are flat documents -
+a root element with one child per record (``<Call>``/``<Message>``) plus a
+few header fields such as ``<timestamp>``. ``get_xml_root`` would first
+read the whole response into a string, then build the complete element
+tree, and only then could the records be turned into objects - the
+response text, the DOM and every record object all in memory at once.
+
+:func:`stream_records` instead feeds the response body straight into
+``iterparse`` as it arrives, turns each record element into its object
+(via ``fritzconnection``'s own ``process_node``, i.e. exactly the same
+attribute mapping as ``CallCollection``) the moment its end tag is read,
+and clears it right away - only the record currently being parsed is ever
+held as XML.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from typing import TypeVar
+from xml.etree.ElementTree import iterparse
+
+from fritzconnection.core.exceptions import FritzResourceError
+from fritzconnection.core.processor import process_node
+from requests import Session
+
+_T = TypeVar("_T")
+
+
+def stream_records(
+    url: str,
+    session: Session,
+    record_tag: str,
+    factory: Callable[[], _T],
+    header: dict[str, str | None] | None = None,
+) -> Iterator[_T]:
+    """Download a flat XML list and yield one object per record element.
+
+    Blocking - executor only. ``factory`` creates an empty record object
+    (a ``@processor`` class like ``Call``) that is filled from the element.
+    The text of every other top-level element is stored in ``header`` (if
+    given) as it is read, e.g. ``header["timestamp"]`` - note that a header
+    field following the records is only available once the generator is
+    exhausted. Closing the generator early (e.g. breaking out of the loop)
+    stops the download. Raises FritzResourceError like ``get_xml_root``
+    when the box answers with an HTML error page, ParseError for malformed
+    XML and RequestException for transport errors.
+    """
+    with session.get(url, stream=True) as response:
+        if response.headers.get("Content-type") == "text/html":
+            raise FritzResourceError(
+                f"Unable to retrieve resource '{url}' from the device."
+            )
+        response.raw.decode_content = True
+        depth = 0
+        root = None
+        for event, element in iterparse(response.raw, events=("start", "end")):
+            if event == "start":
+                if root is None:
+                    root = element
+                depth += 1
+                continue
+            depth -= 1
+            if depth != 1:
+                continue
+            if element.tag == record_tag:
+                record = factory()
+                process_node(record, element)
+                yield record
+            elif header is not None:
+                header[element.tag] = (element.text or "").strip() or None
+            # Drop the finished top-level element from the (otherwise
+            # ever-growing) root.
+            element.clear()
+            if root is not None:
+                root.remove(element)
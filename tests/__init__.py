@@ -0,0 +1 @@
+"""Tests for the FRITZ!Box Anrufe integration."""
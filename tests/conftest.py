@@ -0,0 +1,72 @@
+"""Common fixtures for the FRITZ!Box Anrufe tests."""
+
+from __future__ import annotations
+
+from collections.abc import Generator
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.fritzbox_anrufe.base import Contact
+from custom_components.fritzbox_anrufe.sensor import CallState, FritzBoxCallSensor
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations: None) -> None:
+    """Enable loading the integration from custom_components."""
+
+
+@pytest.fixture
+def config_dir(hass: HomeAssistant, tmp_path: Path) -> Path:
+    """Give the test its own config directory (and with it, own caches)."""
+    hass.config.config_dir = str(tmp_path)
+    return tmp_path
+
+
+def load_fixture_lines(name: str) -> list[str]:
+    """Return the non-empty lines of a fixture file."""
+    return [
+        line for line in (FIXTURES / name).read_text().splitlines() if line.strip()
+    ]
+
+
+@pytest.fixture
+def live_sensor(
+    hass: HomeAssistant,
+) -> Generator[tuple[FritzBoxCallSensor, list[tuple[float, CallState]]]]:
+    """Return a live call sensor plus the (loop time, state) of every write.
+
+    The sensor is not added to a platform - its state writes are recorded
+    instead, with the call-list coordinator and phonebook mocked out.
+    """
+    phonebook = MagicMock()
+    phonebook.get_contact.return_value = Contact("Unbekannt")
+    call_log_coordinator = MagicMock()
+    call_log_coordinator.hass = hass
+    call_log_coordinator.async_request_refresh = AsyncMock()
+    sensor = FritzBoxCallSensor(
+        phonebook_name="Telefonbuch",
+        unique_id="1234-0",
+        fritzbox_phonebook=phonebook,
+        prefixes=None,
+        host="127.0.0.1",
+        port=1012,
+        device_info=MagicMock(),
+        call_log_coordinator=call_log_coordinator,
+        tam_coordinator=None,
+    )
+    sensor.hass = hass
+    sensor.entity_id = "sensor.fritzbox_anrufe_live"
+    writes: list[tuple[float, CallState]] = []
+
+    def _record_write(*_args: Any) -> None:
+        writes.append((hass.loop.time(), sensor.native_value))
+
+    with patch.object(sensor, "async_write_ha_state", side_effect=_record_write):
+        yield sensor, writes
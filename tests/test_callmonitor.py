@@ -0,0 +1,286 @@
+"""Tests for the live callmonitor readers (see sensor.py)."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Generator
+import queue
+from threading import Thread
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+from fritzconnection.core.fritzmonitor import FritzMonitor
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.fritzbox_anrufe.sensor import (
+    AsyncFritzBoxCallMonitor,
+    CallState,
+    FritzBoxCallMonitor,
+    FritzBoxCallSensor,
+    _ReconnectingFritzMonitor,
+)
+
+from .conftest import load_fixture_lines
+
+SENSOR = "custom_components.fritzbox_anrufe.sensor"
+
+# The whole recorded burst must be through well within the time the old
+# reader (one sleep(1) per event) needed for its first two lines.
+MAX_BURST_LATENCY = 1.0
+
+
+async def _wait_for(condition: Any, timeout: float = 5.0) -> None:
+    """Wait until condition() is true, polling the event loop."""
+    async with asyncio.timeout(timeout):
+        while not condition():
+            await asyncio.sleep(0.01)
+
+
+async def test_replayed_burst_is_not_throttled(
+    hass: HomeAssistant,
+    live_sensor: tuple[FritzBoxCallSensor, list[tuple[float, CallState]]],
+) -> None:
+    """A burst of overlapping calls reaches the sensor and the refresh at once."""
+    sensor, writes = live_sensor
+    lines = load_fixture_lines("callmonitor_burst.txt")
+    disconnects = sum(";DISCONNECT;" in line for line in lines)
+    call_log_coordinator = sensor._call_log_coordinator
+    refresh_requests: list[float] = []
+    call_log_coordinator.async_request_refresh.side_effect = (
+        lambda: refresh_requests.append(hass.loop.time())
+    )
+
+    monitor = FritzBoxCallMonitor(host="127.0.0.1", port=1012, sensor=sensor)
+    monitor.connection = MagicMock(is_alive=True)
+    event_queue: queue.Queue[str] = queue.Queue()
+    for line in lines:
+        event_queue.put(line)
+    start = hass.loop.time()
+    thread = Thread(target=monitor._process_events, args=(event_queue,), daemon=True)
+    thread.start()
+    try:
+        await _wait_for(
+            lambda: event_queue.empty() and len(refresh_requests) == disconnects
+        )
+        await hass.async_block_till_done()
+    finally:
+        monitor.stopped.set()
+        # Wake the reader up from its blocking get().
+        event_queue.put("24.12.24 18:06:00;DISCONNECT;99;0;")
+        thread.join(timeout=5)
+
+    assert writes[-1][1] == CallState.IDLE
+    assert sensor._active_calls == {}
+    assert max(state for _, state in writes) == CallState.TALKING
+    assert writes[-1][0] - start < MAX_BURST_LATENCY
+    assert refresh_requests[-1] - start < MAX_BURST_LATENCY
+    # Two dial attempts (ConnectionID 2 and 9) ended without CONNECT.
+    assert call_log_coordinator.add_synthetic_outgoing_call.call_count == 2
+
+
+class FakeCallmonitor:
+    """Local TCP server sending scripted callmonitor lines per connection.
+
+    Each accepted connection gets the next script (a list of raw lines)
+    and is then closed; connections beyond the last script are closed
+    right away.
+    """
+
+    def __init__(self, scripts: list[list[bytes]]) -> None:
+        """Initialize with one script per expected connection."""
+        self._scripts = scripts
+        self.connections = 0
+        self.server: asyncio.Server | None = None
+
+    @property
+    def port(self) -> int:
+        """Return the port the server listens on."""
+        assert self.server is not None
+        return self.server.sockets[0].getsockname()[1]
+
+    async def start(self) -> None:
+        """Start listening on a free local port."""
+        self.server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+
+    async def stop(self) -> None:
+        """Stop listening."""
+        assert self.server is not None
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        script = (
+            self._scripts[self.connections]
+            if self.connections < len(self._scripts)
+            else []
+        )
+        self.connections += 1
+        for line in script:
+            writer.write(line)
+            await writer.drain()
+            # Give the client a chance to read each line on its own.
+            await asyncio.sleep(0.01)
+        writer.close()
+        await writer.wait_closed()
+
+
+@pytest.fixture
+def fast_reconnect() -> Generator[None]:
+    """Shorten the asyncio callmonitor's reconnect backoff."""
+    with (
+        patch(f"{SENSOR}.CALLMONITOR_RECONNECT_DELAY_MIN", 0.05),
+        patch(f"{SENSOR}.CALLMONITOR_RECONNECT_DELAY_MAX", 0.2),
+    ):
+        yield
+
+
+async def test_async_monitor_skips_malformed_lines(
+    hass: HomeAssistant,
+    live_sensor: tuple[FritzBoxCallSensor, list[tuple[float, CallState]]],
+    fast_reconnect: None,
+    socket_enabled: None,
+) -> None:
+    """Malformed and over-long lines don't end the asyncio reader."""
+    sensor, writes = live_sensor
+    fake = FakeCallmonitor(
+        [
+            [
+                b"24.12.24 18:05:01;RING;0;0301234567;123456;SIP0;\n",
+                b"garbage\n",
+                b"24.12.24 18:05:02;CONNECT;0;\n",
+                b"99.99.99 99:99:99;RING;1;0301234567;123456;SIP0;\n",
+                b"24.12.24 18:05:02;CONNECT;0;11;0301234567;\n",
+                # Over the StreamReader's 64 KiB line limit: dropped like a
+                # lost connection, the reader reconnects.
+                b"x" * 100_000 + b"\n",
+                b"24.12.24 18:05:03;RING;2;0307654321;123456;SIP0;\n",
+            ],
+            [b"24.12.24 18:05:09;DISCONNECT;0;7;\n"],
+        ]
+    )
+    await fake.start()
+    monitor = AsyncFritzBoxCallMonitor(hass, "127.0.0.1", fake.port, sensor)
+    monitor.async_start()
+    try:
+        await _wait_for(lambda: fake.connections >= 2 and len(writes) >= 3)
+        await hass.async_block_till_done()
+    finally:
+        monitor.async_stop()
+        await fake.stop()
+
+    assert [state for _, state in writes][:3] == [
+        CallState.RINGING,
+        CallState.TALKING,
+        CallState.IDLE,
+    ]
+    # Nothing after the over-long line on the first connection was used.
+    assert "2" not in sensor._active_calls
+
+
+async def test_async_monitor_reconnect_backoff(
+    hass: HomeAssistant,
+    live_sensor: tuple[FritzBoxCallSensor, list[tuple[float, CallState]]],
+    fast_reconnect: None,
+    socket_enabled: None,
+) -> None:
+    """Failed connects back off exponentially up to the cap, then reset."""
+    sensor, _writes = live_sensor
+    fake = FakeCallmonitor(
+        [[b"24.12.24 18:05:01;RING;0;0301234567;123456;SIP0;\n"]]
+    )
+    await fake.start()
+    open_connection = asyncio.open_connection
+    attempts: list[float] = []
+
+    async def _open_connection(host: str, port: int) -> Any:
+        attempts.append(hass.loop.time())
+        if len(attempts) <= 4:
+            raise ConnectionRefusedError("box not reachable")
+        return await open_connection(host, port)
+
+    monitor = AsyncFritzBoxCallMonitor(hass, "127.0.0.1", fake.port, sensor)
+    with patch("asyncio.open_connection", side_effect=_open_connection):
+        monitor.async_start()
+        try:
+            await _wait_for(lambda: len(attempts) >= 6)
+        finally:
+            monitor.async_stop()
+            await fake.stop()
+
+    gaps = [later - earlier for earlier, later in zip(attempts, attempts[1:])]
+    # 4 refused connects: 0.05, 0.1, 0.2 (capped), 0.2 s apart ...
+    for gap, expected in zip(gaps[:4], [0.05, 0.1, 0.2, 0.2]):
+        assert expected * 0.9 <= gap < expected + 0.15
+    # ... then a connection that worked for a while resets the backoff.
+    assert gaps[4] < 0.2 + 0.15
+    assert fake.connections >= 1
+
+
+async def test_async_monitor_reconnect_resets_active_calls(
+    hass: HomeAssistant,
+    live_sensor: tuple[FritzBoxCallSensor, list[tuple[float, CallState]]],
+    fast_reconnect: None,
+    socket_enabled: None,
+) -> None:
+    """A call whose DISCONNECT was lost with the connection is dropped."""
+    sensor, writes = live_sensor
+    fake = FakeCallmonitor(
+        [[b"24.12.24 18:05:01;CONNECT;0;11;0301234567;\n"], []]
+    )
+    await fake.start()
+    monitor = AsyncFritzBoxCallMonitor(hass, "127.0.0.1", fake.port, sensor)
+    monitor.async_start()
+    try:
+        await _wait_for(lambda: fake.connections >= 2 and len(writes) >= 2)
+        await hass.async_block_till_done()
+    finally:
+        monitor.async_stop()
+        await fake.stop()
+
+    assert [state for _, state in writes][:2] == [CallState.TALKING, CallState.IDLE]
+    assert sensor._active_calls == {}
+
+
+async def test_threaded_monitor_reconnect_resets_active_calls(
+    hass: HomeAssistant,
+    live_sensor: tuple[FritzBoxCallSensor, list[tuple[float, CallState]]],
+) -> None:
+    """FritzMonitor's silent reconnect resets the calls in event order."""
+    sensor, writes = live_sensor
+    connection = _ReconnectingFritzMonitor()
+    event_queue: queue.Queue[str] = queue.Queue()
+    connection._event_queue = event_queue
+    with patch.object(FritzMonitor, "_reconnect_socket", return_value=MagicMock()):
+        connection._reconnect_socket()
+
+    monitor = FritzBoxCallMonitor(host="127.0.0.1", port=1012, sensor=sensor)
+    monitor.connection = MagicMock(is_alive=True)
+    reconnected = event_queue.get_nowait()
+    for event in (
+        "24.12.24 18:05:01;CALL;0;10;123456;0309876543;SIP0;",
+        reconnected,
+        "24.12.24 18:07:00;RING;1;0301234567;123456;SIP0;",
+    ):
+        event_queue.put(event)
+    thread = Thread(target=monitor._process_events, args=(event_queue,), daemon=True)
+    thread.start()
+    try:
+        await _wait_for(lambda: len(writes) >= 3)
+        await hass.async_block_till_done()
+    finally:
+        monitor.stopped.set()
+        event_queue.put("24.12.24 18:08:00;DISCONNECT;99;0;")
+        thread.join(timeout=5)
+
+    assert [state for _, state in writes][:3] == [
+        CallState.DIALING,
+        CallState.IDLE,
+        CallState.RINGING,
+    ]
+    assert list(sensor._active_calls) == ["1"]
+    # The dial attempt cut off by the reconnect is not logged as failed.
+    assert monitor._pending_outgoing == {}
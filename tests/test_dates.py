@@ -0,0 +1,66 @@
+"""Tests for the fixed-width FRITZ!Box timestamp parser."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import random
+
+import pytest
+
+from custom_components.fritzbox_anrufe.dates import (
+    FRITZ_DATETIME_FORMAT,
+    FRITZ_DATETIME_SECONDS_FORMAT,
+    format_fritz_datetime,
+    parse_fritz_datetime,
+)
+
+
+def _strptime(value: str) -> datetime:
+    """Parse a timestamp the way the fast path has to match."""
+    return datetime.strptime(
+        value,
+        FRITZ_DATETIME_SECONDS_FORMAT if value.count(":") == 2 else FRITZ_DATETIME_FORMAT,
+    )
+
+
+def test_matches_strptime_on_random_timestamps() -> None:
+    """The fast path gives the same result as strptime."""
+    rng = random.Random(19)
+    start = datetime(1969, 1, 1)
+    for _ in range(5000):
+        moment = start + timedelta(seconds=rng.randrange(100 * 365 * 86400))
+        for date_format in (FRITZ_DATETIME_FORMAT, FRITZ_DATETIME_SECONDS_FORMAT):
+            value = moment.strftime(date_format)
+            assert parse_fritz_datetime(value) == _strptime(value), value
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "31.12.68 23:59",  # %y pivot: 2068
+        "01.01.69 00:00",  # %y pivot: 1969
+        "29.02.24 12:00",
+        "1.2.24 3:04",  # not fixed-width, but strptime accepts it
+        "24.12.24 18:05:07",
+    ],
+)
+def test_edge_cases_match_strptime(value: str) -> None:
+    """Pivot years, leap days and the strptime fallback."""
+    assert parse_fritz_datetime(value) == _strptime(value)
+
+
+@pytest.mark.parametrize(
+    "value",
+    ["", "29.02.23 12:00", "32.01.24 12:00", "24.12.24 24:00", "24-12-24 18:05", "xx.12.24 18:05"],
+)
+def test_invalid_timestamps_raise(value: str) -> None:
+    """Invalid input raises ValueError, like strptime."""
+    with pytest.raises(ValueError):
+        _strptime(value)
+    with pytest.raises(ValueError):
+        parse_fritz_datetime(value)
+
+
+def test_format_round_trip() -> None:
+    """Formatting gives back the minute-precision input."""
+    assert format_fritz_datetime(parse_fritz_datetime("05.03.26 07:09")) == "05.03.26 07:09"
@@ -0,0 +1,89 @@
+"""Tests for the contact image caching of the phonebook coordinator."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.fritzbox_anrufe.base import Contact
+from custom_components.fritzbox_anrufe.const import DOMAIN
+from custom_components.fritzbox_anrufe.phonebook import FritzPhonebookCoordinator
+
+
+def _phonebook(*image_urls: str) -> MagicMock:
+    """Return a phonebook mock with one contact per image URL."""
+    phonebook = MagicMock()
+    phonebook.revision = 0
+    phonebook.image_files = {}
+    phonebook.contacts = [
+        Contact(f"Kontakt {index}", image_url=image_url)
+        for index, image_url in enumerate(image_urls)
+    ]
+    phonebook.fetch_contact_image.side_effect = lambda contact: (
+        contact.image_url.encode(),
+        "image/jpeg",
+    )
+    return phonebook
+
+
+def _coordinator(
+    hass: HomeAssistant, phonebook: MagicMock
+) -> FritzPhonebookCoordinator:
+    """Return a phonebook coordinator for a fresh config entry."""
+    config_entry = MockConfigEntry(domain=DOMAIN, entry_id="phonebook-test")
+    config_entry.add_to_hass(hass)
+    return FritzPhonebookCoordinator(hass, config_entry, phonebook)
+
+
+async def test_only_new_contact_images_are_fetched(
+    hass: HomeAssistant, config_dir: Path
+) -> None:
+    """Known images are reused, new ones fetched and removed ones dropped."""
+    phonebook = _phonebook("a.jpg", "b.jpg")
+    coordinator = _coordinator(hass, phonebook)
+    await coordinator._async_cache_contact_images()
+    assert phonebook.fetch_contact_image.call_count == 2
+    assert set(phonebook.image_files) == {"a.jpg", "b.jpg"}
+    revision = phonebook.revision
+
+    # Unchanged images: nothing is downloaded, nothing is published.
+    phonebook.fetch_contact_image.reset_mock()
+    await coordinator._async_cache_contact_images()
+    phonebook.fetch_contact_image.assert_not_called()
+    assert phonebook.revision == revision
+
+    # One contact replaced by another: only the new image is fetched.
+    phonebook.contacts = [phonebook.contacts[0], Contact("Neu", image_url="c.jpg")]
+    await coordinator._async_cache_contact_images()
+    assert [
+        call.args[0].image_url for call in phonebook.fetch_contact_image.call_args_list
+    ] == ["c.jpg"]
+    assert set(phonebook.image_files) == {"a.jpg", "c.jpg"}
+    assert phonebook.revision == revision + 1
+
+
+async def test_contact_images_survive_a_restart(
+    hass: HomeAssistant, config_dir: Path
+) -> None:
+    """The saved mapping spares the downloads after a restart."""
+    phonebook = _phonebook("a.jpg")
+    await _coordinator(hass, phonebook)._async_cache_contact_images()
+    image_files = dict(phonebook.image_files)
+
+    restarted = _phonebook("a.jpg")
+    coordinator = FritzPhonebookCoordinator(
+        hass, hass.config_entries.async_get_entry("phonebook-test"), restarted
+    )
+    await coordinator.async_load_image_files()
+    assert restarted.image_files == image_files
+    await coordinator._async_cache_contact_images()
+    restarted.fetch_contact_image.assert_not_called()
+
+    # A file evicted from the cache meanwhile is downloaded again.
+    coordinator.image_cache.get(image_files["a.jpg"]).unlink()
+    await coordinator._async_cache_contact_images()
+    restarted.fetch_contact_image.assert_called_once()
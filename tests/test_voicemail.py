@@ -0,0 +1,236 @@
+"""Tests for the recording downloads of the answering-machine coordinator."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Generator, Iterator
+from datetime import timedelta
+from pathlib import Path
+from threading import Event
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+from aiohttp import ClientPayloadError, web
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from requests.exceptions import ChunkedEncodingError, RequestException
+
+from homeassistant.components.http import KEY_HASS
+from homeassistant.core import HomeAssistant
+
+from custom_components.fritzbox_anrufe.const import CONF_PREFETCH_RECORDINGS, DOMAIN
+from custom_components.fritzbox_anrufe.http import _async_audio_response
+from custom_components.fritzbox_anrufe.tam import TamMessage
+from custom_components.fritzbox_anrufe.voicemail import (
+    DOWNLOAD_CONCURRENCY,
+    FritzTamCoordinator,
+    RecordingDownload,
+    _recording_cache_key,
+)
+
+VOICEMAIL = "custom_components.fritzbox_anrufe.voicemail"
+
+CHUNKS = [b"RIFF" + bytes(1020), bytes(1024), bytes(512)]
+RECORDING = b"".join(CHUNKS)
+
+
+class FakeRecording:
+    """Streamed download response of the box.
+
+    The first chunk comes right away, the rest once released - optionally
+    followed by a broken connection instead of the end.
+    """
+
+    def __init__(self, fail: bool = False) -> None:
+        """Initialize a held-back response."""
+        self.headers = {"Content-Type": "audio/wav", "Content-Length": str(len(RECORDING))}
+        self.url = "http://fritz.box/download.lua"
+        self.release = Event()
+        self.closed = False
+        self._fail = fail
+
+    def iter_content(self, chunk_size: int) -> Iterator[bytes]:
+        """Yield the recording's chunks."""
+        yield CHUNKS[0]
+        self.release.wait(5)
+        if self._fail:
+            raise ChunkedEncodingError("connection broken")
+        yield from CHUNKS[1:]
+
+    def close(self) -> None:
+        """Close the response."""
+        self.closed = True
+
+
+def _message(index: int) -> TamMessage:
+    """Return a message with a recording."""
+    message = TamMessage()
+    message.Index = str(index)
+    message.Date = f"01.10.26 12:{index:02d}"
+    message.Path = f"/download.lua?path=/data/tam/rec/rec.0.{index:03d}"
+    return message
+
+
+async def _wait_for(condition: Any, timeout: float = 5.0) -> None:
+    """Wait until condition() is true, polling the event loop."""
+    async with asyncio.timeout(timeout):
+        while not condition():
+            await asyncio.sleep(0.01)
+
+
+@pytest.fixture
+def tam_coordinator(
+    hass: HomeAssistant, config_dir: Path
+) -> Generator[FritzTamCoordinator]:
+    """Return a TAM coordinator prefetching without retry delays."""
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        entry_id="voicemail-test",
+        options={CONF_PREFETCH_RECORDINGS: True},
+    )
+    config_entry.add_to_hass(hass)
+    with (
+        patch(f"{VOICEMAIL}.PREFETCH_RETRY_DELAY", timedelta(0)),
+        patch(f"{VOICEMAIL}.PREFETCH_SPACING", timedelta(0)),
+    ):
+        yield FritzTamCoordinator(hass, config_entry, MagicMock())
+
+
+@pytest.fixture
+async def audio_client(
+    hass: HomeAssistant,
+    tam_coordinator: FritzTamCoordinator,
+    aiohttp_client: Any,
+    socket_enabled: None,
+) -> Any:
+    """Return a client of a web app serving message 1 like http.py does."""
+
+    async def _handler(request: web.Request) -> web.StreamResponse:
+        return await _async_audio_response(request, tam_coordinator, _message(1))
+
+    app = web.Application()
+    app[KEY_HASS] = hass
+    app.router.add_get("/recording", _handler)
+    return await aiohttp_client(app)
+
+
+async def test_prefetch_keys_follow_the_message_list(
+    hass: HomeAssistant, tam_coordinator: FritzTamCoordinator
+) -> None:
+    """Failed prefetches are retried later; deleted messages are forgotten."""
+    first, second = _message(1), _message(2)
+    with patch.object(
+        tam_coordinator, "_open_audio", side_effect=RequestException("down")
+    ) as open_audio:
+        tam_coordinator._async_schedule_prefetch([first, second])
+        await hass.async_block_till_done(wait_background_tasks=True)
+    assert open_audio.call_count == 2 * 3
+    assert tam_coordinator._prefetched == set()
+
+    def _recording(message: TamMessage) -> tuple[FakeRecording, str]:
+        response = FakeRecording()
+        response.release.set()
+        return response, "audio/wav"
+
+    with patch.object(
+        tam_coordinator, "_open_audio", side_effect=_recording
+    ) as open_audio:
+        tam_coordinator._async_schedule_prefetch([first, second])
+        await hass.async_block_till_done(wait_background_tasks=True)
+    assert open_audio.call_count == 2
+    assert tam_coordinator._prefetched == {
+        _recording_cache_key(first),
+        _recording_cache_key(second),
+    }
+
+    # The first message was deleted on the box.
+    with patch.object(tam_coordinator, "_open_audio") as open_audio:
+        tam_coordinator._async_schedule_prefetch([second])
+        await hass.async_block_till_done(wait_background_tasks=True)
+    open_audio.assert_not_called()
+    assert tam_coordinator._prefetched == {_recording_cache_key(second)}
+
+
+async def test_download_runs_independent_of_playback(
+    hass: HomeAssistant, tam_coordinator: FritzTamCoordinator
+) -> None:
+    """One download per recording, done (and its slot free) without a reader."""
+    message = _message(1)
+    response = FakeRecording()
+    with patch.object(
+        tam_coordinator, "_open_audio", return_value=(response, "audio/wav")
+    ) as open_audio:
+        download = await tam_coordinator.async_recording(message)
+        assert isinstance(download, RecordingDownload)
+        assert await tam_coordinator.async_recording(message) is download
+        await download.async_wait_for(lambda: download.size > 0)
+        response.release.set()
+        await download.async_wait_for(lambda: download.done)
+
+    open_audio.assert_called_once()
+    assert response.closed
+    assert download.error is None
+    assert download.path is not None
+    assert download.path.read_bytes() == RECORDING
+    assert tam_coordinator._downloads == {}
+    assert tam_coordinator._download_slots._value == DOWNLOAD_CONCURRENCY
+    cached = await tam_coordinator.async_recording(message)
+    assert cached == (download.path, "audio/wav")
+
+
+async def test_waiting_for_a_stalled_download_times_out(
+    hass: HomeAssistant, tam_coordinator: FritzTamCoordinator
+) -> None:
+    """A waiter gives up on a download without progress."""
+    response = FakeRecording()
+    with (
+        patch.object(tam_coordinator, "_open_audio", return_value=(response, "audio/wav")),
+        patch(f"{VOICEMAIL}.DOWNLOAD_WAIT_TIMEOUT", timedelta(seconds=0.1)),
+    ):
+        download = await tam_coordinator.async_recording(_message(1))
+        assert isinstance(download, RecordingDownload)
+        with pytest.raises(RequestException):
+            await download.async_wait_for(lambda: download.done)
+        response.release.set()
+        await hass.async_block_till_done(wait_background_tasks=True)
+    assert download.path is not None
+
+
+async def test_playback_tails_the_download(
+    hass: HomeAssistant, tam_coordinator: FritzTamCoordinator, audio_client: Any
+) -> None:
+    """Playback starts during the download; later requests get the file."""
+    response = FakeRecording()
+    with patch.object(
+        tam_coordinator, "_open_audio", return_value=(response, "audio/wav")
+    ):
+        playback = hass.async_create_task(audio_client.get("/recording"))
+        await _wait_for(lambda: tam_coordinator._downloads)
+        (download,) = tam_coordinator._downloads.values()
+        await download.async_wait_for(lambda: download.size > 0)
+        response.release.set()
+        streamed = await playback
+        assert streamed.status == 200
+        assert streamed.headers["Accept-Ranges"] == "none"
+        assert await streamed.read() == RECORDING
+
+    await _wait_for(lambda: not tam_coordinator._downloads)
+    ranged = await audio_client.get("/recording", headers={"Range": "bytes=4-7"})
+    assert ranged.status == 206
+    assert await ranged.read() == RECORDING[4:8]
+
+
+async def test_broken_download_drops_the_playback(
+    hass: HomeAssistant, tam_coordinator: FritzTamCoordinator, audio_client: Any
+) -> None:
+    """A download failing midway closes the connection and caches nothing."""
+    response = FakeRecording(fail=True)
+    response.release.set()
+    with patch.object(
+        tam_coordinator, "_open_audio", return_value=(response, "audio/wav")
+    ):
+        playback = await audio_client.get("/recording")
+        with pytest.raises(ClientPayloadError):
+            await playback.read()
+        await hass.async_block_till_done(wait_background_tasks=True)
+    assert tam_coordinator.cached_audio(_message(1)) is None